@@ -32,6 +32,7 @@ from .time import *
 from .typst import *
 from .import constants
 from .decorators import timed_cache
+from .validation import ValidationResult, ValidationRule
 from .tests import (
     BaseTestTaxCodes,
     BaseTestAccounts,
@@ -0,0 +1,189 @@
+"""This module defines the AccountSelector class, a compiled account range expression
+resolved against the account chart, and the AccountChart class it resolves against.
+"""
+
+from functools import lru_cache
+import re
+import numpy as np
+import pandas as pd
+from .helpers import represents_integer
+
+
+class AccountChart:
+    """Account numbers of an account chart, sorted for range lookups.
+
+    Ranges are resolved by binary search over the sorted account numbers.
+    Matching accounts are returned in the order of the account chart.
+    """
+
+    def __init__(self, accounts: pd.Series | np.ndarray | list[int]):
+        """
+        Args:
+            accounts (pd.Series | np.ndarray | list[int]): Account numbers in
+                account chart order.
+        """
+        self.accounts = np.asarray(accounts, dtype=np.int64)
+        self._order = np.argsort(self.accounts, kind="stable")
+        self._sorted = self.accounts[self._order]
+
+    def between(self, first: int, last: int) -> np.ndarray:
+        """Return accounts from `first` to `last` (inclusive) in account chart order."""
+        lower = np.searchsorted(self._sorted, first, side="left")
+        upper = np.searchsorted(self._sorted, last, side="right")
+        return self.accounts[np.sort(self._order[lower:upper])]
+
+    def contains(self, account: int) -> bool:
+        """Check whether an account is defined in the account chart."""
+        position = np.searchsorted(self._sorted, account)
+        return position < len(self._sorted) and self._sorted[position] == account
+
+
+@lru_cache(maxsize=4096)
+def _parse_expression(expression: str) -> tuple[tuple[bool, int, int | None], ...]:
+    """Parse an account range expression such as "1000:1999-1500+3000".
+
+    Returns:
+        tuple: One `(is_addition, first, last)` tuple per range or account in the
+            expression, with `last` None for individual accounts.
+
+    Raises:
+        ValueError: If an element of the expression is not an account or range.
+    """
+    tokens = []
+    is_addition = True
+    for element in re.split(r"(-|\+)", expression.strip()):
+        element = element.strip()
+        if element == "":
+            pass
+        elif element == "+":
+            is_addition = True
+        elif element == "-":
+            is_addition = False
+        elif re.fullmatch("^[^:]*[:][^:]*$", element):
+            first, last = element.split(":")
+            tokens.append((is_addition, int(first.strip()), int(last.strip())))
+        else:
+            tokens.append((is_addition, int(element), None))
+    return tuple(tokens)
+
+
+class AccountSelector:
+    """Account range expression resolved against an account chart.
+
+    Expressions are parsed once and memoized. The resolved `add` and `subtract`
+    account arrays can be applied as masks or multipliers to account columns,
+    such as the 'account' column of the serialized ledger.
+
+    Attributes:
+        add (np.ndarray): Accounts to be included, in expression order and
+            with repetitions.
+        subtract (np.ndarray): Accounts to be excluded or subtracted.
+        accounts (np.ndarray): Sorted unique accounts in `add` or `subtract`.
+    """
+
+    def __init__(
+        self, range: str | int | dict[str, list[int]] | list[int], chart: AccountChart
+    ):
+        """Resolve an account range against an account chart.
+
+        Args:
+            range (str | int | dict[str, list[int]] | list[int]): The account range.
+                See `LedgerEngine.account_range()` for supported formats.
+            chart (AccountChart): The account chart to resolve ranges against.
+
+        Raises:
+            ValueError: If the input format is invalid.
+        """
+        add, subtract = [], []
+        if represents_integer(range):
+            account = int(range)
+            if chart.contains(abs(account)):
+                if account >= 0:
+                    add = [account]
+                else:
+                    subtract = [abs(account)]
+        elif isinstance(range, dict):
+            if not ("add" in range and "subtract" in range):
+                raise ValueError("Dict must have 'add' and 'subtract' keys.")
+            add = list(range.get("add", []))
+            subtract = list(range.get("subtract", []))
+            if not all(isinstance(i, int) for i in add + subtract):
+                raise ValueError("Both 'add' and 'subtract' must contain only integers.")
+        elif isinstance(range, list):
+            if not all(isinstance(i, int) for i in range):
+                raise ValueError("List elements must all be integers.")
+            add = range
+        elif isinstance(range, str):
+            for is_addition, first, last in _parse_expression(range):
+                accounts = [first] if last is None else chart.between(first, last)
+                if is_addition:
+                    add.append(accounts)
+                else:
+                    subtract.append(accounts)
+            add = np.concatenate(add) if add else []
+            subtract = np.concatenate(subtract) if subtract else []
+        else:
+            raise ValueError(
+                f"Expecting int, str, dict, or list for range, not {type(range).__name__}."
+            )
+
+        self.add = np.asarray(add, dtype=np.int64)
+        self.subtract = np.asarray(subtract, dtype=np.int64)
+        self.accounts = np.unique(np.concatenate([self.add, self.subtract]))
+
+        def occurrences(values: np.ndarray) -> np.ndarray:
+            values = np.sort(values)
+            return (
+                np.searchsorted(values, self.accounts, side="right")
+                - np.searchsorted(values, self.accounts, side="left")
+            )
+        self._multipliers = occurrences(self.add) - occurrences(self.subtract)
+
+    @property
+    def empty(self) -> bool:
+        """True if the expression references no accounts."""
+        return len(self.accounts) == 0
+
+    def to_list(self) -> list[int]:
+        """Return accounts in `add` that are not in `subtract`."""
+        return list(set(self.add.tolist()) - set(self.subtract.tolist()))
+
+    def to_parts(self) -> dict[str, list[int]]:
+        """Return a dict with the `add` and `subtract` account lists."""
+        return {"add": self.add.tolist(), "subtract": self.subtract.tolist()}
+
+    def _positions(self, account: pd.Series | np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        account = pd.Series(account).to_numpy(dtype=np.float64, na_value=np.nan)
+        position = np.searchsorted(self.accounts, account)
+        position = np.minimum(position, max(len(self.accounts) - 1, 0))
+        if self.empty:
+            return position, np.zeros(len(account), dtype=bool)
+        return position, self.accounts[position] == account
+
+    def mask(self, account: pd.Series | np.ndarray) -> np.ndarray:
+        """Mark elements referencing an account in `add` or `subtract`.
+
+        Args:
+            account (pd.Series | np.ndarray): Account numbers, e.g. the 'account'
+                column of the serialized ledger.
+
+        Returns:
+            np.ndarray: Boolean mask of the same length as `account`.
+        """
+        return self._positions(account)[1]
+
+    def multiplier(self, account: pd.Series | np.ndarray) -> np.ndarray:
+        """Net multiplier of each account: The number of occurrences in `add`
+        minus the number of occurrences in `subtract`.
+
+        Args:
+            account (pd.Series | np.ndarray): Account numbers.
+
+        Returns:
+            np.ndarray: Integer multipliers of the same length as `account`,
+                zero for accounts not referenced by the expression.
+        """
+        position, found = self._positions(account)
+        if self.empty:
+            return np.zeros(len(found), dtype=np.int64)
+        return np.where(found, self._multipliers[position], 0)
@@ -0,0 +1,115 @@
+"""This module defines the BalanceCache class, a bounded cache of balance query
+results that is invalidated by a ledger data version rather than by expiry.
+"""
+
+from collections import OrderedDict
+from typing import Callable, Hashable
+import numpy as np
+import pandas as pd
+
+
+class BalanceCache:
+    """Least recently used cache of balance query results.
+
+    Results are stored in long format, one list of (currency, balance) pairs per
+    normalized query, and keyed by the query together with the ledger data
+    version at the time of the lookup. Bumping the version with `invalidate()`
+    renders all previous results unreachable, including results of evaluations
+    that were running while the ledger changed.
+
+    Attributes:
+        version (int): Ledger data version, incremented on each `invalidate()`.
+        maxsize (int): Maximum number of cached query results.
+        hits (int): Number of distinct queries answered from the cache.
+        misses (int): Number of distinct queries that had to be evaluated.
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        """
+        Args:
+            maxsize (int, optional): Maximum number of cached query results.
+                Defaults to 4096.
+        """
+        self.maxsize = maxsize
+        self.version = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def invalidate(self):
+        """Bump the ledger data version and discard all cached results."""
+        self.version += 1
+        self._entries.clear()
+
+    def clear(self):
+        """Discard all cached results and reset hit and miss statistics."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict:
+        """Return cache statistics.
+
+        Returns:
+            dict: With keys 'hits', 'misses', 'size', 'maxsize' and 'version'.
+        """
+        return {
+            "hits": self.hits, "misses": self.misses, "size": len(self._entries),
+            "maxsize": self.maxsize, "version": self.version,
+        }
+
+    def lookup(
+        self, keys: list[Hashable], compute: Callable[[np.ndarray], pd.DataFrame]
+    ) -> pd.DataFrame:
+        """Return balances for a batch of queries, evaluating only uncached ones.
+
+        Args:
+            keys (list[Hashable]): Normalized key of each query. Queries with equal
+                keys are evaluated once.
+            compute (Callable[[np.ndarray], pd.DataFrame]): Evaluates the queries at
+                the given positions of `keys`. Returns a long-format table with
+                columns 'query', 'currency' and 'balance', sorted by 'query',
+                where 'query' refers to the position in the array passed.
+
+        Returns:
+            pd.DataFrame: Long-format table with columns 'query', 'currency' and
+                'balance', where 'query' refers to the position in `keys`.
+        """
+        version = self.version
+        results = {}
+        missing = {}
+        for position, key in enumerate(keys):
+            if key in results or key in missing:
+                continue
+            entry = self._entries.get((version, key))
+            if entry is None:
+                missing[key] = position
+            else:
+                self._entries.move_to_end((version, key))
+                results[key] = entry
+        self.hits += len(results)
+        self.misses += len(missing)
+
+        if missing:
+            computed = compute(np.fromiter(missing.values(), dtype=int, count=len(missing)))
+            query = computed["query"].to_numpy(dtype=int)
+            currency = computed["currency"].to_numpy(dtype=object)
+            balance = computed["balance"].to_numpy(dtype=float, na_value=np.nan)
+            bounds = np.searchsorted(query, np.arange(len(missing) + 1))
+            for i, key in enumerate(missing):
+                rows = slice(bounds[i], bounds[i + 1])
+                results[key] = (currency[rows], balance[rows])
+            # Results of an evaluation overlapping with a ledger change are not stored
+            if version == self.version:
+                for key in missing:
+                    self._entries[(version, key)] = results[key]
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+
+        entries = [results[key] for key in keys]
+        counts = np.fromiter((len(c) for c, _ in entries), dtype=int, count=len(entries))
+        return pd.DataFrame({
+            "query": np.repeat(np.arange(len(keys)), counts),
+            "currency": np.concatenate([c for c, _ in entries] or [np.empty(0, dtype=object)]),
+            "balance": np.concatenate([b for _, b in entries] or [np.empty(0)]),
+        })
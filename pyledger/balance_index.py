@@ -0,0 +1,113 @@
+"""This module defines the BalanceIndex class, a prefix-sum index over a serialized
+ledger that answers balance queries for any date or date span in logarithmic time.
+"""
+
+import numpy as np
+import pandas as pd
+import polars as pl
+
+# Offset that maps day numbers (days since 1970-01-01) to non-negative integers, so
+# that group codes and days can be combined into a single sortable int64 key.
+_DAY_OFFSET = 2**31
+
+
+class BalanceIndex:
+    """Cumulative balances of a serialized ledger, keyed by account, currency and
+    profit center.
+
+    Ledger entries are aggregated per (account, currency, profit_center) group and
+    date, sorted by date within each group, and accumulated. The balance of a group
+    over any date span then takes two binary searches and one subtraction.
+
+    Attributes:
+        groups (pd.DataFrame): One row per (account, currency, profit_center)
+            group. The positional index of a row is the group code expected by
+            `balances()`.
+    """
+
+    GROUP_COLUMNS = ["account", "currency", "profit_center"]
+
+    def __init__(self, ledger: pd.DataFrame | pl.DataFrame | pl.LazyFrame):
+        """Build the index from a serialized ledger.
+
+        Args:
+            ledger (pd.DataFrame | pl.DataFrame | pl.LazyFrame): Ledger entries in
+                long format with at least the columns 'account', 'currency',
+                'profit_center', 'date', 'amount' and 'report_amount'. Polars
+                frames are aggregated in Polars.
+        """
+        if isinstance(ledger, (pl.DataFrame, pl.LazyFrame)):
+            aggregated = (
+                ledger.lazy()
+                .group_by(self.GROUP_COLUMNS + ["date"])
+                .agg(pl.col("amount").sum(), pl.col("report_amount").sum())
+                .sort(self.GROUP_COLUMNS + ["date"], nulls_last=True)
+                .collect().to_pandas()
+            )
+        else:
+            aggregated = (
+                ledger.groupby(
+                    self.GROUP_COLUMNS + ["date"], dropna=False, sort=True, observed=True
+                )[["amount", "report_amount"]].sum().reset_index()
+            )
+        group = (
+            aggregated.groupby(self.GROUP_COLUMNS, dropna=False, sort=False, observed=True)
+            .ngroup().to_numpy(dtype=np.int64)
+        )
+        days = aggregated["date"].to_numpy(dtype="datetime64[D]").astype(np.int64)
+        first = np.flatnonzero(np.r_[True, group[1:] != group[:-1]]) if len(group) else group
+
+        self.groups = aggregated.iloc[first][self.GROUP_COLUMNS].reset_index(drop=True)
+        self._first = first
+        self._keys = group * 2**32 + (days + _DAY_OFFSET)
+        self._amount = self._cumulate(aggregated["amount"], group)
+        self._report_amount = self._cumulate(aggregated["report_amount"], group)
+
+    @staticmethod
+    def _cumulate(values: pd.Series, group: np.ndarray) -> np.ndarray:
+        """Running sums restarting at each group, NA values counting as zero."""
+        values = pd.Series(values.to_numpy(dtype=float, na_value=np.nan)).fillna(0.0)
+        return values.groupby(group).cumsum().to_numpy()
+
+    @staticmethod
+    def _days(dates: np.ndarray, missing: int) -> np.ndarray:
+        """Convert dates to day numbers, substituting `missing` for NaT."""
+        dates = np.asarray(dates, dtype="datetime64[ns]")
+        return np.where(
+            np.isnat(dates), missing, dates.astype("datetime64[D]").astype(np.int64)
+        )
+
+    def balances(
+        self, group: np.ndarray, start: np.ndarray, end: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Compute balances of index groups over date spans.
+
+        Args:
+            group (np.ndarray): Group codes, i.e. positions in `groups`.
+            start (np.ndarray): Inclusive start dates as datetime64, NaT for no
+                lower bound.
+            end (np.ndarray): Inclusive end dates as datetime64, NaT for no
+                upper bound.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray]: The balance in transaction
+                currency, the balance in reporting currency, and the number of
+                aggregated ledger dates contributing to each balance.
+        """
+        group = np.asarray(group, dtype=np.int64)
+        if len(group) == 0:
+            return np.zeros(0), np.zeros(0), np.zeros(0, dtype=np.int64)
+        start = self._days(start, missing=-_DAY_OFFSET)
+        end = self._days(end, missing=_DAY_OFFSET - 1)
+        lower = np.searchsorted(self._keys, group * 2**32 + (start + _DAY_OFFSET), side="left")
+        upper = np.searchsorted(self._keys, group * 2**32 + (end + _DAY_OFFSET), side="right")
+        first = self._first[group]
+
+        def cumulative(values: np.ndarray, position: np.ndarray) -> np.ndarray:
+            return np.where(position > first, values[np.maximum(position - 1, 0)], 0.0)
+
+        amount = cumulative(self._amount, upper) - cumulative(self._amount, lower)
+        report_amount = (
+            cumulative(self._report_amount, upper) - cumulative(self._report_amount, lower)
+        )
+        return amount, report_amount, np.maximum(upper - lower, 0)
@@ -0,0 +1,140 @@
+"""This module defines the ChunkedLedger class, an append-only container of ledger
+entries that is extended without copying previously added entries, and answers
+balance queries from balance checkpoints.
+"""
+
+import bisect
+import numpy as np
+import pandas as pd
+from .balance_index import BalanceIndex
+
+
+class ChunkedLedger:
+    """Serialized ledger stored as a list of DataFrame chunks.
+
+    Appending a chunk leaves existing chunks untouched, so that a ledger can be
+    extended repeatedly at the cost of the appended entries only. The entries
+    are combined into a single DataFrame only when `to_frame()` is called.
+
+    Balances are computed from checkpoints: Cumulative balances per (account,
+    currency, profit center) group as of each date evaluated so far. A balance
+    as of a later date starts from the closest earlier checkpoint and adds only
+    the entries in between, so that evaluating balances at a sequence of
+    increasing dates takes time linear in the number of ledger entries.
+    Appending entries discards checkpoints as of their date or later.
+    """
+
+    def __init__(self, ledger: pd.DataFrame):
+        """
+        Args:
+            ledger (pd.DataFrame): Initial ledger entries in long format.
+        """
+        self._chunks = []
+        self._order = []
+        self._dates = []
+        self._checkpoint_dates = []
+        self._checkpoints = []
+        self.append(ledger)
+
+    def __len__(self) -> int:
+        return sum(len(chunk) for chunk in self._chunks)
+
+    def append(self, ledger: pd.DataFrame):
+        """Append ledger entries.
+
+        Args:
+            ledger (pd.DataFrame): Ledger entries with the same columns as the
+                initial ledger.
+        """
+        if self._chunks and ledger.empty:
+            return
+        dates = ledger["date"].to_numpy(dtype="datetime64[ns]")
+        order = np.argsort(dates, kind="stable")
+        self._chunks.append(ledger)
+        self._order.append(order)
+        self._dates.append(dates[order])
+
+        # Discard checkpoints that do not reflect the appended entries
+        if len(dates) and not np.isnat(self._dates[-1][0]):
+            first = pd.Timestamp(self._dates[-1][0])
+            keep = bisect.bisect_left(self._checkpoint_dates, first)
+            del self._checkpoint_dates[keep:]
+            del self._checkpoints[keep:]
+
+    def balances(self, start=None, end=None) -> pd.DataFrame:
+        """Balances per (account, currency, profit center) group over a date span.
+
+        Args:
+            start (datetime.date, optional): Inclusive start date, None for no
+                lower bound.
+            end (datetime.date, optional): Inclusive end date, None for no
+                upper bound.
+
+        Returns:
+            pd.DataFrame: One row per group with entries in the date span, with
+                columns 'account', 'currency', 'profit_center', 'amount',
+                'report_amount' and 'count', the number of entries.
+        """
+        upper = self._cumulative(end)
+        if start is not None:
+            lower = self._cumulative(pd.Timestamp(start) - pd.Timedelta(days=1))
+            lower = lower.assign(
+                amount=-lower["amount"], report_amount=-lower["report_amount"],
+                count=-lower["count"],
+            )
+            upper = self._aggregate(self._concat([upper, lower]))
+        return upper.loc[upper["count"] > 0].reset_index(drop=True)
+
+    def to_frame(self) -> pd.DataFrame:
+        """Combine all chunks into a single DataFrame.
+
+        Returns:
+            pd.DataFrame: All ledger entries in order of addition.
+        """
+        return pd.concat(self._chunks, ignore_index=True)
+
+    def _cumulative(self, date=None) -> pd.DataFrame:
+        """Cumulative balances per group of all entries up to and including `date`,
+        recorded as a checkpoint."""
+        date = None if date is None else pd.Timestamp(date)
+        position = (
+            len(self._checkpoints) if date is None
+            else bisect.bisect_right(self._checkpoint_dates, date)
+        )
+        if position > 0 and self._checkpoint_dates[position - 1] == date:
+            return self._checkpoints[position - 1]
+
+        since = self._checkpoint_dates[position - 1] if position > 0 else None
+        parts = [self._checkpoints[position - 1]] if position > 0 else []
+        for chunk, order, dates in zip(self._chunks, self._order, self._dates):
+            lower = 0 if since is None else np.searchsorted(dates, since.to_datetime64(), "right")
+            upper = (
+                len(dates) if date is None
+                else np.searchsorted(dates, date.to_datetime64(), "right")
+            )
+            rows = chunk.iloc[order[lower:upper]]
+            parts.append(rows[BalanceIndex.GROUP_COLUMNS + ["amount", "report_amount"]].assign(
+                amount=rows["amount"].to_numpy(dtype=float, na_value=np.nan),
+                report_amount=rows["report_amount"].to_numpy(dtype=float, na_value=np.nan),
+                count=1,
+            ))
+        cumulative = self._aggregate(self._concat(parts))
+
+        if date is not None:
+            self._checkpoint_dates.insert(position, date)
+            self._checkpoints.insert(position, cumulative)
+        return cumulative
+
+    @staticmethod
+    def _concat(parts: list[pd.DataFrame]) -> pd.DataFrame:
+        """Concatenate balance parts, skipping empty ones as pandas deprecates
+        concatenating them. The first part serves as template if all are empty."""
+        return pd.concat([part for part in parts if len(part) > 0] or parts[:1], ignore_index=True)
+
+    @staticmethod
+    def _aggregate(df: pd.DataFrame) -> pd.DataFrame:
+        """Sum up amounts and entry counts per group."""
+        return (
+            df.groupby(BalanceIndex.GROUP_COLUMNS, dropna=False, sort=False, observed=True)
+            [["amount", "report_amount", "count"]].sum().reset_index()
+        )
@@ -117,6 +117,39 @@ AGGREGATED_BALANCE_SCHEMA = pd.read_csv(
     StringIO(AGGREGATED_BALANCE_SCHEMA_CSV), skipinitialspace=True, comment="#"
 )
 
+# Long format balances: one row per query or account and currency, with the
+# balance in the reporting currency in rows with currency "reporting_currency".
+BALANCE_LONG_SCHEMA_CSV = """
+    column,             dtype,                mandatory,       id
+    query,              int,                  True,          True
+    currency,           string[python],       True,          True
+    balance,            Float64,              True,         False
+"""
+BALANCE_LONG_SCHEMA = pd.read_csv(StringIO(BALANCE_LONG_SCHEMA_CSV), skipinitialspace=True)
+
+ACCOUNT_BALANCE_LONG_SCHEMA_CSV = """
+    column,             dtype,                mandatory,       id
+    group,              string[python],       True,         False
+    description,        string[python],       True,         False
+    account,            int,                  True,          True
+    currency,           string[python],       True,          True
+    balance,            Float64,              True,         False
+"""
+ACCOUNT_BALANCE_LONG_SCHEMA = pd.read_csv(
+    StringIO(ACCOUNT_BALANCE_LONG_SCHEMA_CSV), skipinitialspace=True
+)
+
+AGGREGATED_BALANCE_LONG_SCHEMA_CSV = """
+    column,             dtype,                mandatory,       id
+    group,              string[python],       True,          True
+    description,        string[python],       True,          True
+    currency,           string[python],       True,          True
+    balance,            Float64,              True,         False
+"""
+AGGREGATED_BALANCE_LONG_SCHEMA = pd.read_csv(
+    StringIO(AGGREGATED_BALANCE_LONG_SCHEMA_CSV), skipinitialspace=True
+)
+
 ACCOUNT_HISTORY_SCHEMA_CSV = """
     column,              dtype,                mandatory,       id
     id,                  string[python],       False,         True
@@ -2,6 +2,7 @@
 writing fixed-width CSV files and checking if values can be represented as integers.
 """
 
+import hashlib
 from typing import Any, List
 from pathlib import Path, PurePosixPath
 import numpy as np
@@ -205,3 +206,23 @@ def prune_path(path: str, description: str, n: int = 0) -> tuple[str, str]:
         return (str(path), description)
     else:
         return (str(path.parents[-(n + 1)]) if n > 0 else pd.NA, path.parts[n + 1])
+
+
+def fingerprint(df: pd.DataFrame) -> str:
+    """
+    Compute a content fingerprint of a DataFrame.
+
+    The fingerprint reflects column names, data types and values in row order,
+    but not the index. Equal DataFrames yield equal fingerprints across
+    Python processes.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to fingerprint.
+
+    Returns:
+        str: Hexadecimal SHA-256 digest.
+    """
+    digest = hashlib.sha256()
+    digest.update(repr([(str(col), str(dtype)) for col, dtype in df.dtypes.items()]).encode())
+    digest.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
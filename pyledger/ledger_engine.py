@@ -8,17 +8,16 @@ import math
 import zipfile
 import json
 from pathlib import Path
-from typing import Callable, Dict, Literal
+from typing import Any, Callable, Dict, Iterator, Literal
 from consistent_df import enforce_schema, df_to_consistent_str, nest
-import re
 import numpy as np
 import openpyxl
 import pandas as pd
 import polars as pl
 from .reporting import summarize_groups
-from .decorators import timed_cache
 from .constants import (
     ACCOUNT_BALANCE_SCHEMA,
+    ACCOUNT_BALANCE_LONG_SCHEMA,
     ACCOUNT_SCHEMA,
     ACCOUNT_HISTORY_SCHEMA,
     ACCOUNT_SHEET_REPORT_CONFIG_SCHEMA,
@@ -31,12 +30,16 @@ from .constants import (
     RECONCILIATION_SCHEMA,
     TAX_CODE_SCHEMA,
     DEFAULT_ASSETS,
-    AGGREGATED_BALANCE_SCHEMA
+    AGGREGATED_BALANCE_SCHEMA,
+    AGGREGATED_BALANCE_LONG_SCHEMA,
+    BALANCE_LONG_SCHEMA,
 )
+from .account_selector import AccountChart, AccountSelector
 from .storage_entity import AccountingEntity
 from . import excel
-from .helpers import first_elements_as_str, prune_path, represents_integer
-from .time import parse_date_span
+from .helpers import first_elements_as_str, prune_path
+from .time import parse_date_span, parse_date_spans
+from .validation import ValidationResult, ValidationRule, log_flagged, validate
 from .typst import (
     df_to_typst,
     escape_typst_text,
@@ -51,6 +54,13 @@ class LedgerEngine(ABC):
     """
 
     _logger = None
+    _backend = "pandas"
+    _account_selectors = None
+    _profit_center_codes = None
+    _sanitized = None
+    _validated_journal = None
+    _validation_results = None
+    disabled_validation_rules = frozenset()
 
     # ----------------------------------------------------------------------
     # Constructor
@@ -58,6 +68,23 @@ class LedgerEngine(ABC):
     def __init__(self):
         self._logger = logging.getLogger("ledger")
 
+    @property
+    def backend(self) -> str:
+        """Data frame library used to compute account histories and balances.
+
+        Either "pandas" (default) or "polars". The Polars backend converts the
+        serialized ledger to Polars once per rebuild, then filters, accumulates and
+        aggregates it in lazy Polars queries. Account histories are converted to
+        pandas when returned. Completing and serializing the journal remains in pandas.
+        """
+        return self._backend
+
+    @backend.setter
+    def backend(self, backend: Literal["pandas", "polars"]):
+        if backend not in ("pandas", "polars"):
+            raise ValueError(f"Unknown backend '{backend}', expected 'pandas' or 'polars'.")
+        self._backend = backend
+
     # ----------------------------------------------------------------------
     # Storage entities
 
@@ -440,45 +467,94 @@ class LedgerEngine(ABC):
         2. Sanitize tax_codes using the partially sanitized accounts.
         3. Re-sanitize accounts with the validated tax_codes.
 
-        Logs warnings for each discarded or adjusted entry.
+        Logs warnings for each discarded or adjusted entry. The result is memoized
+        until accounts, tax codes or assets change; the returned DataFrames share
+        their values with the cache and must not be modified in place.
 
         Returns:
             Tuple[pd.DataFrame, pd.DataFrame]: The sanitized accounts and tax_codes DataFrames.
         """
-        # Step 1: Partial accounts sanitization
-        raw_accounts = self.accounts.list()
-        raw_tax_codes = self.tax_codes.list()
-        accounts_df_step1 = self.sanitize_accounts(raw_accounts, tax_codes=raw_tax_codes)
+        def build():
+            # Step 1: Partial accounts sanitization
+            raw_accounts = self.accounts.list()
+            raw_tax_codes = self.tax_codes.list()
+            accounts_df_step1 = self.sanitize_accounts(raw_accounts, tax_codes=raw_tax_codes)
+
+            # Step 2: Sanitize tax_codes using partially sanitized accounts
+            tax_codes_df = self.sanitize_tax_codes(raw_tax_codes, accounts=accounts_df_step1)
 
-        # Step 2: Sanitize tax_codes using partially sanitized accounts
-        tax_codes_df = self.sanitize_tax_codes(raw_tax_codes, accounts=accounts_df_step1)
+            # Step 3: Re-validate accounts with the now fully validated tax_codes
+            accounts_df_final = self.sanitize_accounts(raw_accounts, tax_codes=tax_codes_df)
 
-        # Step 3: Re-validate accounts with the now fully validated tax_codes
-        accounts_df_final = self.sanitize_accounts(raw_accounts, tax_codes=tax_codes_df)
+            return accounts_df_final, tax_codes_df
+
+        return self._memoized("accounts_tax_codes", ["accounts", "tax_codes", "assets"], build)
+
+    def _memoized(
+        self, key: str, entities: list[str], build: Callable[[], Any], copy: bool = True
+    ) -> Any:
+        """Return data derived from settings entities, computed once per change.
+
+        The result of `build` is cached against the change versions of the
+        entities it depends on, the reporting currency and the disabled
+        validation rules, so that it is shared by all callers until the
+        underlying data actually changes.
+
+        Args:
+            key (str): Name of the derived data.
+            entities (list[str]): Names of the storage entities the data depends on.
+            build (Callable[[], Any]): Function computing the data.
+            copy (bool, optional): If True, return shallow copies of the cached
+                DataFrame or tuple of DataFrames, so callers may add, drop or
+                reassign columns and rows. Values are shared with the cache in
+                any case and must not be modified in place. Defaults to True.
 
-        return accounts_df_final, tax_codes_df
+        Returns:
+            Any: The cached or newly computed data.
+        """
+        versions = (
+            self.reporting_currency, frozenset(self.disabled_validation_rules),
+            *(getattr(self, name).version for name in entities),
+        )
+        cached = (self._sanitized or {}).get(key)
+        if cached is None or cached[0] != versions:
+            cached = (versions, build())
+            self._sanitized = (self._sanitized or {}) | {key: cached}
+        result = cached[1]
+        if not copy:
+            return result
+        if isinstance(result, tuple):
+            return tuple(df.copy(deep=False) for df in result)
+        return result.copy(deep=False)
 
-    @timed_cache(120)
     def account_currency(self, account: int) -> str:
         """Return a given account's currency."""
-        accounts = self.accounts.list()
-        if not int(account) in accounts["account"].values:
+        accounts = self._accounts_by_number()
+        if not int(account) in accounts.index:
             raise ValueError(f"Account {account} is not defined.")
-        return accounts.loc[accounts["account"] == account, "currency"].item()
+        return accounts.loc[accounts.index == account, "currency"].item()
 
-    @timed_cache(120)
     def account_description(self, account: int) -> str:
         """Return the text describing a given account."""
-        accounts = self.accounts.list()
-        if not int(account) in accounts["account"].values:
+        accounts = self._accounts_by_number()
+        if not int(account) in accounts.index:
             raise ValueError(f"Account {account} is not defined.")
-        return accounts.loc[accounts["account"] == account, "description"].item()
+        return accounts.loc[accounts.index == account, "description"].item()
+
+    def _accounts_by_number(self) -> pd.DataFrame:
+        """Accounts indexed by account number, memoized until accounts change.
+        Callers must not modify the result."""
+        return self._memoized(
+            "accounts_by_number", ["accounts"],
+            lambda: self.accounts.list().set_index("account"), copy=False,
+        )
 
     def individual_account_balances(
         self,
         accounts: str | int | dict[str, list[int]] | list[int] | None,
         period: str | datetime.date | None = None,
         profit_centers: list[str] | str | None = None,
+        output: Literal["dict", "long"] = "dict",
     ) -> pd.DataFrame:
         """Calculate balances individually for a single account
         or for each account in a list or range, returning one row per account.
@@ -493,12 +569,16 @@ class LedgerEngine(ABC):
                 If None, the balance is calculated from all available accounting data.
             profit_centers (list[str], str, optional): If not None, the result is calculated only
                            from ledger entries assigned to the specified profit centers.
+            output (Literal["dict", "long"]): Return type, see below. Defaults to "dict".
 
         Returns:
-            pd.DataFrame: A DataFrame with `ACCOUNT_BALANCE_SCHEMA`, providing one row per
-            account. The `balance` column is a dict[str, float] mapping currencies to amounts
-            (e.g., {"USD": 120.0, "CHF": -50.0}), while `report_balance` holds the numeric
-            value in the reporting currency.
+            pd.DataFrame: With `output="dict"`, a DataFrame with `ACCOUNT_BALANCE_SCHEMA`,
+            providing one row per account. The `balance` column is a dict[str, float] mapping
+            currencies to amounts (e.g., {"USD": 120.0, "CHF": -50.0}), while `report_balance`
+            holds the numeric value in the reporting currency.
+            With `output="long"`, a DataFrame with `ACCOUNT_BALANCE_LONG_SCHEMA`, providing
+            one row per account and currency, and the balance in the reporting currency in
+            rows with currency "reporting_currency".
         """
         # Gather account list
         df = self.accounts.list()[["group", "description", "account", "currency"]]
@@ -509,12 +589,69 @@ class LedgerEngine(ABC):
         df["period"] = period
         df["profit_center"] = [profit_centers] * len(df)
         df.reset_index(drop=True, inplace=True)
-        balances = self.account_balances(df)
+        balances = self.account_balances(df, output=output)
+        if output == "long":
+            balances = balances.merge(
+                df[["group", "description", "account"]], left_on="query", right_index=True
+            )
+            return (
+                enforce_schema(balances, ACCOUNT_BALANCE_LONG_SCHEMA)
+                .sort_values("account", kind="stable").reset_index(drop=True)
+            )
         df[["balance", "report_balance"]] = balances[["balance", "report_balance"]]
         return enforce_schema(df, ACCOUNT_BALANCE_SCHEMA).sort_values("account")
 
+    def balance_matrix(
+        self,
+        accounts: str | int | dict[str, list[int]] | list[int] | None,
+        periods: list[str | datetime.date | None],
+        profit_centers: list[str] | str | None = None,
+    ) -> pd.DataFrame:
+        """Calculate balances of each account over each of several periods.
+
+        All account and period combinations are evaluated in a single batch by
+        `account_balances()`, rather than one ledger pass per period.
+
+        Args:
+            accounts (str | int | dict[str, list[int]] | list[int] | None):
+                The range of accounts to be evaluated. See `account_range()` for possible
+                formats. If None, all accounts are evaluated.
+            periods (list[str | datetime.date | None]): The time periods for which balances
+                are calculated. See `parse_date_span` for possible values.
+            profit_centers (list[str], str, optional): If not None, balances are calculated
+                only from ledger entries assigned to the specified profit centers.
+
+        Returns:
+            pd.DataFrame: A matrix with one column per distinct period and a row index of
+                (account, currency). Rows with currency "reporting_currency" hold balances
+                in the reporting currency; other rows hold balances in each currency in
+                which transactions were recorded. Absent balances are zero.
+        """
+        chart = self.accounts.list()["account"]
+        if accounts is not None:
+            chart = chart.loc[chart.isin(self.account_range(accounts))]
+        chart = chart.to_numpy()
+        periods = list(dict.fromkeys(periods))
+
+        queries = pd.DataFrame({
+            "account": np.repeat(chart, len(periods)),
+            "period": pd.Series(periods * len(chart), dtype="object"),
+            "profit_center": [profit_centers] * (len(chart) * len(periods)),
+        })
+        long = self.account_balances(queries, output="long")
+        long["account"] = chart[long["query"].to_numpy() // len(periods)]
+        long["period"] = long["query"].to_numpy() % len(periods)
+        matrix = long.pivot_table(
+            index=["account", "currency"], columns="period", values="balance",
+            aggfunc="sum", fill_value=0.0,
+        )
+        matrix = matrix.reindex(columns=range(len(periods)), fill_value=0.0)
+        matrix.columns = pd.Index(periods, dtype="object", name="period")
+        return matrix
+
     def account_balances(
-        self, df: pd.DataFrame, reporting_currency_only: bool = False, **kwargs
+        self, df: pd.DataFrame, reporting_currency_only: bool = False,
+        output: Literal["dict", "long"] = "dict", **kwargs
     ) -> pd.DataFrame:
         """Calculate account balances from a DataFrame of flexible query specifications,
         returning a result of the same length with the most efficient method.
@@ -536,15 +673,22 @@ class LedgerEngine(ABC):
                 See `parse_profit_center_range()` for supported formats.
             reporting_currency_only (bool, optional): If True, omits the `balance` column
                 and includes only the `report_balance` column. Defaults to False.
+            output (Literal["dict", "long"]): Return type, see below. Defaults to "dict".
             **kwargs: Additional keyword arguments passed to `_account_balance`.
                 Useful for customizing behavior in derived classes.
 
         Returns:
-            pd.DataFrame: A DataFrame of the same length, enriched with:
+            pd.DataFrame: With `output="dict"`, a DataFrame of the same length, enriched with:
                 - 'report_balance': Amount in the reporting currency.
                 - 'balance': Dictionary of currency-wise balances
                 (excluded if `reporting_currency_only` is True).
+            With `output="long"`, a DataFrame with `BALANCE_LONG_SCHEMA`, holding one row
+            per query and currency. The 'query' column refers to the position of the query
+            in `df`. The balance in the reporting currency is reported in rows with currency
+            "reporting_currency", which are present for every query. If
+            `reporting_currency_only` is True, only these rows are returned.
         """
+        self._validate_balance_output(output)
         # TODO: Define and enforce data frame schema. Replace below if ... block. Issue: #211
         if "profit_center" not in df:
             df["profit_center"] = pd.NA
@@ -552,6 +696,11 @@ class LedgerEngine(ABC):
             self._account_balance(account=acct, period=prd, profit_centers=pc, **kwargs)
             for prd, acct, pc in zip(df["period"], df["account"], df["profit_center"])
         ]
+        if output == "long":
+            long = self._balances_to_long([{"reporting_currency": 0.0, **b} for b in balances])
+            if reporting_currency_only:
+                long = long.loc[long["currency"] == "reporting_currency"]
+            return long.reset_index(drop=True)
         report_balances = [r.pop("reporting_currency", 0.0) for r in balances]
         result = pd.DataFrame({"report_balance": report_balances})
 
@@ -560,42 +709,99 @@ class LedgerEngine(ABC):
 
         return result
 
+    @staticmethod
+    def _validate_balance_output(output: str):
+        if output not in ("dict", "long"):
+            raise ValueError(f"Unknown output '{output}', expected 'dict' or 'long'.")
+
+    @staticmethod
+    def _balances_to_long(balances: list[dict]) -> pd.DataFrame:
+        """Convert a list of balance dicts to a long-format balance table.
+
+        Args:
+            balances (list[dict]): One dict per query mapping currencies to amounts.
+
+        Returns:
+            pd.DataFrame: A DataFrame with `BALANCE_LONG_SCHEMA`, where 'query' is the
+                position of the dict in `balances`.
+        """
+        rows = [
+            (query, currency, amount)
+            for query, balance in enumerate(balances)
+            for currency, amount in balance.items()
+        ]
+        df = pd.DataFrame(rows, columns=["query", "currency", "balance"])
+        return enforce_schema(df, BALANCE_LONG_SCHEMA)
+
+    @staticmethod
+    def _long_to_balances(
+        df: pd.DataFrame, n: int, reporting_currency_only: bool = False
+    ) -> pd.DataFrame:
+        """Convert a long-format balance table to the dict-based balance columns.
+
+        Args:
+            df (pd.DataFrame): Balances with `BALANCE_LONG_SCHEMA`.
+            n (int): Number of queries. Queries without rows get zero balances.
+            reporting_currency_only (bool, optional): If True, omits the `balance` column.
+
+        Returns:
+            pd.DataFrame: A DataFrame of length `n` with columns 'report_balance'
+                and 'balance' (unless `reporting_currency_only`).
+        """
+        balances = [{} for _ in range(n)]
+        for query, currency, amount in zip(df["query"], df["currency"], df["balance"]):
+            balances[query][currency] = None if pd.isna(amount) else amount
+        report_balances = [balance.pop("reporting_currency", 0.0) for balance in balances]
+        result = pd.DataFrame({"report_balance": report_balances})
+        if not reporting_currency_only:
+            result["balance"] = balances
+        return result
+
     def aggregate_account_balances(self, df: pd.DataFrame = None, n: int = 1) -> pd.DataFrame:
         """
         Aggregates account balances by account groups
 
         Prunes the group path to a specified depth and updates the description
         with the next segment in the path when available, otherwise falling
-        back to the original account description. Then sums `report_balance` and aggregates
-        the dict-based `balance` values key by key within each unique (group, description) pair.
+        back to the original account description. Then sums balances per currency
+        within each unique (group, description) pair.
 
         Parameters:
-            df (pd.DataFrame): A DataFrame in LEDGER_ENGINE.ACCOUNT_BALANCE_SCHEMA.
+            df (pd.DataFrame): A DataFrame in LEDGER_ENGINE.ACCOUNT_BALANCE_SCHEMA or
+                LEDGER_ENGINE.ACCOUNT_BALANCE_LONG_SCHEMA.
             n (int): Number of leading segments to preserve in the group path.
 
         Returns:
             pd.DataFrame: Aggregated account balances with the
-                          LEDGER_ENGINE.AGGREGATED_BALANCE_SCHEMA schema.
+                          LEDGER_ENGINE.AGGREGATED_BALANCE_SCHEMA schema, or the
+                          LEDGER_ENGINE.AGGREGATED_BALANCE_LONG_SCHEMA schema for
+                          long-format input.
         """
         groups = [prune_path(g, d, n=n) for g, d in zip(df["group"], df["description"])]
         df[["group", "description"]] = pd.DataFrame(groups, index=df.index)
+        keys = ["group", "description"]
 
-        def _sum_balance_dicts(balances: pd.Series) -> dict:
-            balances = balances.dropna()
-            unique_currencies = {
-                currency for balance_dict in balances for currency in balance_dict
-            }
-            return {
-                currency: sum(balance_dict.get(currency, 0) for balance_dict in balances)
-                for currency in unique_currencies
-            }
+        if "report_balance" not in df.columns:
+            grouped = (
+                df.groupby(keys + ["currency"], dropna=False, sort=False)["balance"]
+                .sum().reset_index()
+            )
+            return enforce_schema(grouped, AGGREGATED_BALANCE_LONG_SCHEMA)
 
+        # Dict-based balances: Sum in long format and convert back
+        long = self._balances_to_long([
+            {"reporting_currency": report, **(balance if isinstance(balance, dict) else {})}
+            for report, balance in zip(df["report_balance"], df["balance"])
+        ])
+        long[keys] = df[keys].to_numpy()[long["query"].to_numpy()]
         grouped = (
-            df.groupby(["group", "description"], dropna=False, sort=False)
-            .agg(report_balance=("report_balance", "sum"), balance=("balance", _sum_balance_dicts))
-            .reset_index()
+            long.groupby(keys + ["currency"], dropna=False, sort=False)["balance"]
+            .sum().reset_index()
         )
-        return enforce_schema(grouped, AGGREGATED_BALANCE_SCHEMA)
+        grouped["query"] = grouped.groupby(keys, dropna=False, sort=False).ngroup()
+        result = grouped[keys].drop_duplicates().reset_index(drop=True)
+        result = pd.concat([result, self._long_to_balances(grouped, len(result))], axis=1)
+        return enforce_schema(result, AGGREGATED_BALANCE_SCHEMA)
 
     def account_history(
         self,
@@ -607,7 +813,7 @@ class LedgerEngine(ABC):
         """
         Return the transaction history for the specified account(s).
 
-        Fetches all transactions in chronological order for a single account,
+        Fetches all transactions ordered by date and id for a single account,
         an account range (e.g., "1000:1999"), or multiple/ranges combined
         (e.g., "1000+1020:1025" or "1020:1025-1000") within the given period.
         The resulting DataFrame includes `balance` (transaction currency) and
@@ -661,6 +867,102 @@ class LedgerEngine(ABC):
 
         return df
 
+    def iter_account_history(
+        self,
+        account: int | str | dict,
+        period: datetime.date = None,
+        profit_centers: str | list[str] | set[str] = None,
+        page_size: int = 10_000,
+        cursor: tuple[datetime.date, str] | None = None,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Iterate over the transaction history for the specified account(s) in pages.
+
+        Yields the history of `account_history()` in consecutive pages ordered by
+        date and id, without materializing the full history. Running `balance`
+        and `report_balance` carry forward across pages. Entries sharing the same
+        date and id are never split across pages, so a page exceeds `page_size`
+        when needed to complete the last transaction.
+
+        Args:
+            account (int | str | dict): Account(s) to retrieve. See `account_history()`.
+            period (datetime.date | str | int, optional): Period or date for the
+                transactions. See `parse_date_span` for details.
+            profit_centers (str | list[str] | set[str], optional): Profit center filter.
+                See `parse_profit_centers()` for supported formats.
+            page_size (int, optional): Number of entries per page. Defaults to 10,000.
+            cursor (tuple[datetime.date, str], optional): Date and id of the last entry
+                of a previously retrieved page. If given, iteration resumes with the
+                entry following the cursor. Defaults to None.
+
+        Yields:
+            pd.DataFrame: Pages of the transaction history in ACCOUNT_HISTORY_SCHEMA.
+                The date and id of a page's last row serve as cursor to resume
+                iteration after this page.
+
+        Raises:
+            ValueError: If `page_size` is not a positive integer.
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be a positive integer.")
+        start, end = parse_date_span(period)
+        accounts = self.account_range(account)
+        if profit_centers is not None:
+            profit_centers = self.parse_profit_centers(profit_centers)
+
+        ledger = self.serialized_ledger()
+        filter = ledger["account"].isin(accounts)
+        if profit_centers is not None:
+            filter = filter & self._profit_center_mask(ledger["profit_center"], profit_centers)
+
+        # Resume from the cursor or the start of the period, whichever is later
+        amount, report_amount = 0.0, 0.0
+        if cursor is not None:
+            cursor_date, cursor_id = pd.Timestamp(cursor[0]), cursor[1]
+        if cursor is not None and (start is None or cursor_date >= pd.Timestamp(start)):
+            amount, report_amount = self._opening_balance(
+                ledger, filter, accounts, start=cursor_date.date(), profit_centers=profit_centers
+            )
+            same_day = filter & (ledger["date"] == cursor_date) & (ledger["id"] <= cursor_id)
+            same_day = same_day.fillna(False)
+            amount += ledger.loc[same_day, "amount"].sum()
+            report_amount += ledger.loc[same_day, "report_amount"].sum()
+            filter = filter & (
+                (ledger["date"] > cursor_date)
+                | ((ledger["date"] == cursor_date) & (ledger["id"] > cursor_id))
+            )
+        elif start is not None:
+            amount, report_amount = self._opening_balance(
+                ledger, filter, accounts, start=start, profit_centers=profit_centers
+            )
+            filter = filter & (ledger["date"] >= pd.to_datetime(start))
+        if end is not None:
+            filter = filter & (ledger["date"] <= pd.to_datetime(end))
+
+        # Order selected entries by date and id, keeping only their positions
+        positions = np.flatnonzero(filter.fillna(False).to_numpy(dtype=bool))
+        keys = ledger[["date", "id"]].iloc[positions].reset_index(drop=True)
+        order = keys.sort_values(["date", "id"], kind="stable").index.to_numpy()
+        positions, keys = positions[order], keys.iloc[order]
+        dates, ids = keys["date"].to_numpy(), keys["id"].fillna("").to_numpy(dtype=str)
+        new_key = (dates[1:] != dates[:-1]) | (ids[1:] != ids[:-1])
+        boundaries = np.flatnonzero(np.r_[True, new_key, True])
+
+        pos = 0
+        while pos < len(positions):
+            stop = min(pos + page_size, len(positions))
+            stop = boundaries[np.searchsorted(boundaries, stop)]
+            df = ledger.iloc[positions[pos:stop]].reset_index(drop=True)
+            df.insert(df.columns.get_loc("amount") + 1, "balance", df["amount"].cumsum() + amount)
+            df.insert(
+                df.columns.get_loc("report_amount") + 1,
+                "report_balance", df["report_amount"].cumsum() + report_amount
+            )
+            amount += df["amount"].sum()
+            report_amount += df["report_amount"].sum()
+            pos = stop
+            yield enforce_schema(df, schema=ACCOUNT_HISTORY_SCHEMA)
+
     def _fetch_account_history(
         self, account: int | list[int], start: datetime.date = None, end: datetime.date = None,
         profit_centers: list[str] | str = None
@@ -678,13 +980,6 @@ class LedgerEngine(ABC):
         Returns:
             pd.DataFrame: DataFrame containing the transaction history of the account(s).
         """
-        ledger = self.serialized_ledger()
-        if isinstance(account, list):
-            filter = ledger["account"].isin(account)
-        else:
-            filter = ledger["account"] == account
-        if end is not None:
-            filter = filter & (ledger["date"] <= pd.to_datetime(end))
         if profit_centers is not None:
             if isinstance(profit_centers, str):
                 profit_centers = [profit_centers]
@@ -694,16 +989,100 @@ class LedgerEngine(ABC):
                 raise ValueError(
                     f"Profit centers: {', '.join(invalid_profit_centers)} do not exist."
                 )
-            filter = filter & (ledger["profit_center"].isin(profit_centers))
+        if self.backend == "polars":
+            return self._fetch_account_history_polars(
+                account, start=start, end=end, profit_centers=profit_centers
+            )
+
+        ledger = self.serialized_ledger()
+        if isinstance(account, list):
+            filter = ledger["account"].isin(account)
+        else:
+            filter = ledger["account"] == account
+        if profit_centers is not None:
+            filter = filter & self._profit_center_mask(ledger["profit_center"], profit_centers)
+        opening_balance, opening_report_balance = 0.0, 0.0
+        if start is not None:
+            opening_balance, opening_report_balance = self._opening_balance(
+                ledger, filter, account, start=start, profit_centers=profit_centers
+            )
+            filter = filter & (ledger["date"] >= pd.to_datetime(start))
+        if end is not None:
+            filter = filter & (ledger["date"] <= pd.to_datetime(end))
+        # Same order as the pages of iter_account_history()
         df = ledger.loc[filter, :]
-        df = df.sort_values("date")
-        df.insert(df.columns.get_loc("amount") + 1, "balance", df["amount"].cumsum())
+        df = df.sort_values(["date", "id"], kind="stable")
+        df.insert(
+            df.columns.get_loc("amount") + 1, "balance", df["amount"].cumsum() + opening_balance
+        )
         df.insert(df.columns.get_loc("report_amount") + 1,
-                  "report_balance", df["report_amount"].cumsum())
-        if start is not None:
-            df = df.loc[df["date"] >= pd.to_datetime(start), :]
+                  "report_balance", df["report_amount"].cumsum() + opening_report_balance)
         return df.reset_index(drop=True)
 
+    def _fetch_account_history_polars(
+        self, account: int | list[int], start: datetime.date = None, end: datetime.date = None,
+        profit_centers: list[str] = None
+    ) -> pd.DataFrame:
+        """Polars implementation of `_fetch_account_history()`.
+
+        Filters, sorts by date and id and accumulates the ledger in a single lazy query. Balances
+        accumulate over all entries of the selected accounts up to `end`, before
+        restricting the result to entries from `start` onwards.
+
+        Args:
+            account (int, list[int]): The account or list of accounts to fetch the history for.
+            start (datetime.date, optional): Start date for the history. Defaults to None.
+            end (datetime.date, optional): End date for the history. Defaults to None.
+            profit_centers (list[str], optional): Validated profit center filter.
+
+        Returns:
+            pd.DataFrame: DataFrame containing the transaction history of the account(s).
+        """
+        accounts = account if isinstance(account, list) else [account]
+        filter = pl.col("account").is_in(accounts)
+        if profit_centers is not None:
+            filter = filter & pl.col("profit_center").is_in(profit_centers)
+        if end is not None:
+            filter = filter & (pl.col("date").dt.date() <= pd.Timestamp(end).date())
+        df = (
+            self._serialized_ledger_frame().lazy()
+            .filter(filter)
+            .sort(["date", "id"], nulls_last=True, maintain_order=True)
+            .with_columns(
+                balance=pl.col("amount").cum_sum(),
+                report_balance=pl.col("report_amount").cum_sum(),
+            )
+        )
+        if start is not None:
+            df = df.filter(pl.col("date").dt.date() >= pd.Timestamp(start).date())
+        df = df.select(ACCOUNT_HISTORY_SCHEMA["column"].to_list()).collect()
+        return enforce_schema(df.to_pandas(), ACCOUNT_HISTORY_SCHEMA)
+
+    def _serialized_ledger_frame(self) -> pl.DataFrame:
+        """Return the serialized ledger as a Polars DataFrame."""
+        return pl.from_pandas(self.serialized_ledger())
+
+    def _opening_balance(
+        self, ledger: pd.DataFrame, filter: pd.Series, account: int | list[int],
+        start: datetime.date, profit_centers: list[str] | None = None
+    ) -> tuple[float, float]:
+        """Compute the balance carried forward into an account history.
+
+        Args:
+            ledger (pd.DataFrame): The serialized ledger.
+            filter (pd.Series): Boolean mask selecting the ledger entries of the
+                requested account(s) and profit centers.
+            account (int, list[int]): The account or list of accounts.
+            start (datetime.date): First date of the account history.
+            profit_centers (list[str], optional): Validated profit center filter.
+
+        Returns:
+            tuple[float, float]: Sum of `amount` and `report_amount` of all
+                selected entries dated before `start`.
+        """
+        rows = ledger.loc[filter & (ledger["date"] < pd.to_datetime(start))]
+        return rows["amount"].sum(), rows["report_amount"].sum()
+
     def account_range(
         self, range: str | int | dict[str, list[int]] | list[int], mode: str = "list"
     ) -> dict | list[int]:
@@ -742,63 +1121,51 @@ class LedgerEngine(ABC):
         Raises:
             ValueError: If the input format is invalid or no matching accounts are found.
         """
-        add = []
-        subtract = []
+        selector = self.account_selector(range)
+        if mode == "list":
+            return selector.to_list()
+        return selector.to_parts()
 
-        if represents_integer(range):
-            account = int(range)
-            if abs(account) in self.accounts.list()["account"].values:
-                if account >= 0:
-                    add = [account]
-                else:
-                    subtract = [abs(account)]
-        elif isinstance(range, dict):
-            if not ("add" in range and "subtract" in range):
-                raise ValueError("Dict must have 'add' and 'subtract' keys.")
-            # Ensure values are lists
-            add = list(range.get("add", []))
-            subtract = list(range.get("subtract", []))
-            if not all(isinstance(i, int) for i in add + subtract):
-                raise ValueError("Both 'add' and 'subtract' must contain only integers.")
-        elif isinstance(range, list):
-            if not all(isinstance(i, int) for i in range):
-                raise ValueError("List elements must all be integers.")
-            add = range
-        elif isinstance(range, str):
-            is_addition = True
-            for element in re.split(r"(-|\+)", range.strip()):
-                accounts = []
-                if element.strip() == "":
-                    pass
-                elif element.strip() == "+":
-                    is_addition = True
-                elif element.strip() == "-":
-                    is_addition = False
-                elif re.fullmatch("^[^:]*[:][^:]*$", element):
-                    sequence = element.split(":")
-                    first = int(sequence[0].strip())
-                    last = int(sequence[1].strip())
-                    accounts = self.accounts.list()
-                    in_range = (accounts["account"] >= first) & (accounts["account"] <= last)
-                    accounts = list(accounts["account"][in_range])
-                elif re.match("[0-9]*", element.strip()):
-                    accounts = [int(element.strip())]
-                else:
-                    raise ValueError(f"Accounts '{element}' not identifiable.")
-                if len(accounts) > 0:
-                    if is_addition:
-                        add += accounts
-                    else:
-                        subtract += accounts
+    def account_selector(
+        self, range: str | int | dict[str, list[int]] | list[int]
+    ) -> AccountSelector:
+        """Return a compiled account selector for an account range.
+
+        Selectors for string and integer ranges are memoized until the account
+        chart changes. Range bounds are resolved by
+        binary search over the sorted account chart.
+
+        Args:
+            range (str | int | dict[str, list[int]] | list[int]): The account(s) to be
+                evaluated. See `account_range()` for supported formats.
+
+        Returns:
+            AccountSelector: Selector with resolved `add` and `subtract` accounts.
+
+        Raises:
+            ValueError: If the input format is invalid or no matching accounts are found.
+        """
+        cache = self._account_selectors
+        version = self.accounts.version
+        if cache is None or cache[0] != version:
+            cache = (version, AccountChart(self.accounts.list()["account"]), {})
+            self._account_selectors = cache
+        _, chart, selectors = cache
+
+        if isinstance(range, (str, int)):
+            selector = selectors.get(range)
+            if selector is None:
+                selector = AccountSelector(range, chart)
+                selectors[range] = selector
         else:
-            raise ValueError(
-                f"Expecting int, str, dict, or list for range, not {type(range).__name__}."
-            )
-        if not add and not subtract:
+            selector = AccountSelector(range, chart)
+        if selector.empty:
             raise ValueError(f"No account matching '{range}'.")
-        if mode == "list":
-            return list(set(add) - set(subtract))
-        return {"add": add, "subtract": subtract}
+        return selector
+
+    def _clear_account_selectors(self):
+        """Discard memoized account selectors, e.g. after account chart changes."""
+        self._account_selectors = None
 
     # ----------------------------------------------------------------------
     # Journal
@@ -840,6 +1207,15 @@ class LedgerEngine(ABC):
 
         A warning specifying the reason is logged for each discarded entry.
 
+        Each check is a named rule, see `_journal_rules()`. Rules listed in
+        `disabled_validation_rules` are skipped, and `validation_result("journal")`
+        reports flagged ids and wall time per rule.
+
+        Validation results are remembered per transaction. Transactions already
+        validated with identical content are not checked again, until accounts,
+        tax codes, assets, prices, profit centers or the reporting currency change.
+        Warnings recorded for them are logged again, as in a full validation.
+
         Args:
             df (pd.DataFrame): Journal data to sanitize.
 
@@ -847,178 +1223,305 @@ class LedgerEngine(ABC):
             pd.DataFrame: Sanitized journal data containing only valid entries.
         """
 
-        df = enforce_schema(df, JOURNAL_SCHEMA, keep_extra_columns=True)
+        df = enforce_schema(df, JOURNAL_SCHEMA, keep_extra_columns=True).reset_index(drop=True)
+        versions = (
+            self.reporting_currency, tuple(df.columns), frozenset(self.disabled_validation_rules),
+            *(getattr(self, name).version for name in [
+                "accounts", "tax_codes", "assets", "price_history", "profit_centers"
+            ]),
+        )
+        memo = self._validated_journal
+        if memo is None or memo[0] != versions:
+            memo = (
+                versions, pd.Series(dtype="uint64"),
+                df.loc[:, ["id", "tax_code", "report_amount"]].iloc[:0],
+                pd.DataFrame({"id": df["id"].iloc[:0], "rule": pd.Series(dtype="string")}),
+            )
+        _, known, patched, flags = memo
+
+        def concat(parts: list[pd.DataFrame], empty: pd.DataFrame) -> pd.DataFrame:
+            parts = [part for part in parts if len(part) > 0]
+            return pd.concat(parts) if parts else empty
+
+        # Reuse transactions validated before with identical content
+        hashes = self._transaction_hashes(df)
+        hashes = hashes.loc[hashes.index.notna()]
+        common = hashes.index.intersection(known.index)
+        unchanged = common[known[common].to_numpy() == hashes[common].to_numpy()]
+        reused_values = patched.loc[patched["id"].isin(unchanged)].sort_values("id", kind="stable")
+        position = df.loc[df["id"].isin(reused_values["id"])].sort_values("id", kind="stable").index
+        reused = df.loc[position].assign(
+            tax_code=reused_values["tax_code"].set_axis(position),
+            report_amount=reused_values["report_amount"].set_axis(position),
+        )
+        reused_flags = flags.loc[flags["id"].isin(unchanged)]
+
+        # Validate new or modified transactions
+        is_fresh = ~df["id"].isin(unchanged)
+        fresh = df.loc[is_fresh].reset_index(drop=True)
+        validation = self._validate_journal(fresh, log=False)
+        is_valid = ~validation.discard
+        fresh = fresh.loc[is_valid].set_axis(df.index[is_fresh.to_numpy()][is_valid])
+        fresh_flags = concat(
+            [ids[["id"]].assign(rule=rule) for rule, ids in validation.ids.items()],
+            flags.iloc[:0],
+        )
 
-        invalid_ids = set()
-        invalid_ids = self._invalid_multidate_txns(df, invalid_ids)
-        self._invalid_tax_codes(df, invalid_ids)
-        invalid_ids = self._invalid_accounts(df, invalid_ids)
-        precision = self.precision_vectorized(df["currency"], dates=df["date"], allow_missing=True)
-        invalid_ids = self._invalid_assets(df, invalid_ids, precision)
-        invalid_ids = self._invalid_currency(df, invalid_ids)
-        invalid_ids = self._invalid_prices(df, invalid_ids)
-        invalid_ids = self._invalid_profit_centers(df, invalid_ids)
-        df["report_amount"] = self._fill_report_amounts(df, invalid_ids, precision)
-        invalid_ids = self._unbalanced_report_amounts(df, invalid_ids)
+        # Log the same warnings as a validation of all transactions
+        all_flags = concat([reused_flags, fresh_flags], flags.iloc[:0])
+        log_flagged(
+            self._journal_rules() + self._journal_balance_rules(),
+            {rule: group[["id"]] for rule, group in all_flags.groupby("rule", sort=False)},
+            self._logger,
+        )
 
-        return df.query("id not in @invalid_ids").reset_index(drop=True)
+        # Remember hashes of all validated transactions, the patched columns of
+        # valid transactions and the rules flagging any of them. The memo thus
+        # holds three columns per valid journal entry rather than a full copy.
+        result = concat([reused, fresh], df.iloc[:0]).sort_index().reset_index(drop=True)
+        self._validated_journal = (
+            versions,
+            concat([known.loc[~known.index.isin(hashes.index)], hashes], known),
+            concat([
+                patched.loc[~patched["id"].isin(hashes.index)],
+                result.loc[result["id"].notna(), ["id", "tax_code", "report_amount"]],
+            ], patched),
+            concat([flags.loc[~flags["id"].isin(hashes.index)], all_flags], flags.iloc[:0]),
+        )
+        return result
 
-    def _invalid_multidate_txns(self, df: pd.DataFrame, invalid_ids: set) -> set:
-        """Mark transactions where a single 'id' spans multiple distinct 'date' values."""
-        invalid_date = df.groupby("id")["date"].transform("nunique") > 1
-        new_invalid_ids = set(df.loc[invalid_date, "id"]) - invalid_ids
-        if new_invalid_ids:
-            self._logger.warning(
-                f"Discarding {len(new_invalid_ids)} journal entries where a single 'id' "
-                f"has more than one 'date': {first_elements_as_str(new_invalid_ids)}"
-            )
-            invalid_ids = invalid_ids.union(new_invalid_ids)
+    @staticmethod
+    def _transaction_hashes(df: pd.DataFrame) -> pd.Series:
+        """Hash the content of each transaction, including the order of its rows.
 
-        return invalid_ids
+        Returns:
+            pd.Series: Hash per transaction, indexed by 'id'.
+        """
+        rows = pd.util.hash_pandas_object(df, index=False).to_numpy()
+        position = df.groupby("id", dropna=False).cumcount().to_numpy().astype("uint64")
+        mixed = pd.util.hash_array(rows ^ (position * np.uint64(0x9E3779B97F4A7C15)))
+        # Truncate hashes so that sums over a transaction can not overflow
+        return pd.Series(mixed >> np.uint64(16), index=df["id"]).groupby(level=0).sum()
 
-    def _invalid_tax_codes(self, df: pd.DataFrame, invalid_ids: set) -> None:
-        """Drop undefined 'tax_code' references."""
-        _, tax_codes = self.sanitized_accounts_tax_codes()
-        invalid_tax_code_mask = ~df["tax_code"].isna() & ~df["tax_code"].isin(set(tax_codes["id"]))
-        new_invalid_ids = set(df.loc[invalid_tax_code_mask, "id"]) - invalid_ids
-        if new_invalid_ids:
-            self._logger.warning(
-                f"Setting 'tax_code' to 'NA' for {len(new_invalid_ids)} journal entries "
-                f"with invalid tax codes: {first_elements_as_str(new_invalid_ids)}"
-            )
-        df.loc[invalid_tax_code_mask, "tax_code"] = pd.NA
+    def _validate_journal(self, df: pd.DataFrame, log: bool = True) -> ValidationResult:
+        """Apply the journal validation rules of `sanitize_journal()`.
 
-    def _invalid_accounts(self, df: pd.DataFrame, invalid_ids: set) -> set:
+        Fills in missing report amounts and removes invalid tax codes in place.
+
+        Args:
+            df (pd.DataFrame): Journal entries to validate.
+            log (bool, optional): If True, log a warning for each rule that
+                flags entries. Defaults to True.
+
+        Returns:
+            ValidationResult: Rows to discard, with flagged ids and timing per rule.
         """
-        Mark transactions with invalid accounts:
-        - both 'account' and 'contra' are missing, or
-        - a referenced account is not defined."""
-        accounts, _ = self.sanitized_accounts_tax_codes()
-        accounts_set = set(accounts["account"])
+        frame = self._journal_validation_frame(df)
+        validation = dict(
+            id_columns=["id"], logger=self._logger if log else None, by_id=True,
+            disabled=self.disabled_validation_rules,
+        )
+        result = validate(frame, self._journal_rules(), **validation)
+        frame["report_amount"] = self._fill_report_amounts(frame, result.discard)
+        result = validate(frame, self._journal_balance_rules(), result=result, **validation)
+        df["tax_code"] = frame["tax_code"]
+        df["report_amount"] = frame["report_amount"]
+        self._validation_results = (self._validation_results or {}) | {"journal": result}
+        return result
 
-        # Transactions missing both 'account' and 'contra'
-        missing_mask = df["account"].isna() & df["contra"].isna()
-        missing_ids = set(df.loc[missing_mask, "id"]) - invalid_ids
-        if missing_ids:
-            self._logger.warning(
-                f"Discarding {len(missing_ids)} journal entries with neither 'account' "
-                f"nor 'contra' specified: {first_elements_as_str(missing_ids)}"
-            )
-            invalid_ids = invalid_ids.union(missing_ids)
-
-        # Transactions with invalid account or contra references
-        invalid_account_mask = ~df["account"].isna() & ~df["account"].isin(accounts_set)
-        invalid_contra_mask = ~df["contra"].isna() & ~df["contra"].isin(accounts_set)
-        ref_mask = invalid_account_mask | invalid_contra_mask
-        ref_ids = set(df.loc[ref_mask, "id"]) - invalid_ids - missing_ids
-        if ref_ids:
-            self._logger.warning(
-                f"Discarding {len(ref_ids)} journal entries with invalid account "
-                f"or contra references: {first_elements_as_str(ref_ids)}"
-            )
-            invalid_ids = invalid_ids.union(ref_ids)
+    def _journal_validation_frame(self, df: pd.DataFrame, prices: bool = True) -> pd.DataFrame:
+        """Join journal-like entries with the reference data of the validation rules.
 
-        return invalid_ids
+        Adds the columns '_account_defined', '_contra_defined', '_account_currency',
+        '_contra_currency' and '_precision' of each entry's currency, or NaN for
+        undefined currencies. With a 'tax_code' column, adds '_tax_code_defined'.
+        If `prices` is True, adds '_fx_rate', the price of each entry's currency
+        in reporting currency as of its date, or NaN if unavailable.
 
-    def _invalid_assets(self, df: pd.DataFrame, invalid_ids: set, precision: pl.Series) -> set:
-        """Mark transactions with invalid asset references."""
-        null_mask = precision.is_null().to_numpy()
-        new_invalid_ids = set(df.loc[null_mask, "id"]) - invalid_ids
+        Returns:
+            pd.DataFrame: Copy of `df` with the added columns.
+        """
+        accounts, tax_codes = self.sanitized_accounts_tax_codes()
+        account_currency = (
+            self.accounts.list().drop_duplicates("account").set_index("account")["currency"]
+        )
+        frame = df.copy()
+        for column in ["account", "contra"]:
+            frame[f"_{column}_defined"] = frame[column].isin(accounts["account"])
+            frame[f"_{column}_currency"] = frame[column].map(account_currency)
+        if "tax_code" in frame.columns:
+            frame["_tax_code_defined"] = frame["tax_code"].isin(tax_codes["id"])
+        precision = self.precision_vectorized(
+            frame["currency"], dates=frame["date"], allow_missing=True
+        )
+        frame["_precision"] = np.array(precision.to_numpy(), dtype=float)
+        if prices:
+            fx_rate = np.array(self.price_vectorized(
+                frame["currency"], frame["date"], currency=self.reporting_currency,
+                allow_missing=True
+            ).to_numpy(), dtype=float)
+            fx_rate[frame["date"].isna().to_numpy()] = np.nan
+            frame["_fx_rate"] = fx_rate
+        return frame
+
+    def _journal_rules(self) -> list[ValidationRule]:
+        """Validation rules of `sanitize_journal()` applied before report amounts
+        are filled in, in order of application."""
+        return [
+            ValidationRule(
+                "multiple_dates", self._invalid_multidate_txns,
+                "Discarding %d journal entries where a single 'id' has more than one 'date': %s",
+            ),
+            ValidationRule(
+                "tax_codes", self._invalid_tax_codes,
+                "Setting 'tax_code' to 'NA' for %d journal entries with invalid tax codes: %s",
+                patch=self._clear_tax_codes,
+            ),
+            *self._account_rules(),
+            ValidationRule(
+                "currency", self._invalid_currency,
+                "Discarding %d journal entries with mismatched transaction currency: %s",
+            ),
+            ValidationRule(
+                "prices", self._invalid_prices,
+                "Discarding %d journal entries with invalid price: %s",
+            ),
+            *self._profit_center_rules(),
+        ]
 
-        if new_invalid_ids:
-            self._logger.warning(
-                f"Discarding {len(new_invalid_ids)} journal entries with invalid currency: "
-                f"{first_elements_as_str(new_invalid_ids)}"
-            )
-            invalid_ids = invalid_ids.union(new_invalid_ids)
+    def _journal_balance_rules(self) -> list[ValidationRule]:
+        """Validation rules of `sanitize_journal()` applied after report amounts
+        are filled in."""
+        return [
+            ValidationRule(
+                "unbalanced", self._unbalanced_report_amounts,
+                "Discarding %d journal entries where amounts do not balance to zero: %s",
+            ),
+        ]
 
-        return invalid_ids
+    def _account_rules(self) -> list[ValidationRule]:
+        """Rules on account, contra account and currency references, shared by
+        journal and target balance validation."""
+        return [
+            ValidationRule(
+                "missing_accounts", self._missing_accounts,
+                "Discarding %d journal entries with neither 'account' nor 'contra' specified: %s",
+            ),
+            ValidationRule(
+                "accounts", self._invalid_accounts,
+                "Discarding %d journal entries with invalid account or contra references: %s",
+            ),
+            ValidationRule(
+                "assets", self._invalid_assets,
+                "Discarding %d journal entries with invalid currency: %s",
+            ),
+        ]
 
-    def _invalid_currency(self, df: pd.DataFrame, invalid_ids: set) -> set:
-        """Mark transactions with currency mismatched to account or contra account."""
-        reporting_currency = self.reporting_currency
+    def _profit_center_rules(self) -> list[ValidationRule]:
+        """Rules on profit center references, shared by journal and target
+        balance validation."""
+        return [
+            ValidationRule(
+                "profit_centers", self._invalid_profit_centers,
+                "Discarding %d journal entries with missing or invalid profit center: %s",
+            ),
+            ValidationRule(
+                "undefined_profit_centers", self._undefined_profit_centers,
+                "Discarding %d journal entries assigned to a profit center, "
+                "while no profit centers are defined: %s",
+            ),
+        ]
 
-        def is_invalid(row):
-            if row["id"] in invalid_ids:
-                return True
-            if "amount" in df.columns and row["amount"] == 0:
-                return False
-            if pd.notna(row["account"]):
-                account_currency = self.account_currency(row["account"])
-                if ((account_currency != reporting_currency)
-                        and (row["currency"] != account_currency)):
-                    return True
-            if pd.notna(row["contra"]):
-                contra_currency = self.account_currency(row["contra"])
-                if ((contra_currency != reporting_currency)
-                        and (row["currency"] != contra_currency)):
-                    return True
-            return False
-
-        invalid_currency = df.apply(is_invalid, axis=1, result_type='reduce')
-        new_invalid_ids = set(df.loc[invalid_currency, "id"]) - invalid_ids
-        if new_invalid_ids:
-            self._logger.warning(
-                f"Discarding {len(new_invalid_ids)} journal entries with mismatched transaction "
-                f"currency: {first_elements_as_str(new_invalid_ids)}"
-            )
-            invalid_ids = invalid_ids.union(new_invalid_ids)
+    def validation_result(self, entity: str) -> ValidationResult | None:
+        """Result of the latest validation by `sanitize_<entity>()`.
 
-        return invalid_ids
+        Reports the ids flagged by each rule and the wall time spent per rule,
+        e.g. to identify rules to add to `disabled_validation_rules` for
+        trusted data sources.
 
-    def _invalid_prices(self, df: pd.DataFrame, invalid_ids: set) -> set:
-        """Mark transactions with missing price references."""
-        reporting_currency = self.reporting_currency
+        Args:
+            entity (str): One of 'journal', 'target_balance', 'reconciliation'
+                or 'revaluations'.
 
-        def is_invalid(row):
-            if row["id"] in invalid_ids:
-                return True
-            if (
-                row.get("currency") == reporting_currency
-                or ("report_amount" in df.columns and pd.notna(row.get("report_amount")))
-            ):
-                return False
-            try:
-                self.price(
-                    ticker=row["currency"], date=row["date"], currency=reporting_currency
-                )
-                return False
-            except ValueError:
-                return True
+        Returns:
+            ValidationResult | None: The latest result, or None if no data of
+                this entity has been validated yet.
+        """
+        return (self._validation_results or {}).get(entity)
 
-        invalid_price = df.apply(is_invalid, axis=1, result_type='reduce')
-        new_invalid_ids = set(df.loc[invalid_price, "id"]) - invalid_ids
-        if new_invalid_ids:
-            self._logger.warning(
-                f"Discarding {len(new_invalid_ids)} journal entries with invalid price: "
-                f"{first_elements_as_str(new_invalid_ids)}"
-            )
-            invalid_ids = invalid_ids.union(new_invalid_ids)
+    @staticmethod
+    def _invalid_multidate_txns(df: pd.DataFrame) -> np.ndarray:
+        """Mark transactions where a single 'id' spans multiple distinct 'date' values."""
+        return (df.groupby("id")["date"].transform("nunique") > 1).to_numpy(dtype=bool)
+
+    @staticmethod
+    def _invalid_tax_codes(df: pd.DataFrame) -> np.ndarray:
+        """Mark undefined 'tax_code' references."""
+        return (df["tax_code"].notna() & ~df["_tax_code_defined"]).to_numpy(dtype=bool)
 
-        return invalid_ids
+    @staticmethod
+    def _clear_tax_codes(df: pd.DataFrame, mask: np.ndarray) -> None:
+        """Drop undefined 'tax_code' references."""
+        df.loc[mask, "tax_code"] = pd.NA
 
-    def _invalid_profit_centers(self, df: pd.DataFrame, invalid_ids: set) -> set:
-        """Mark transactions with missing or invalid profit center references."""
+    @staticmethod
+    def _missing_accounts(df: pd.DataFrame) -> np.ndarray:
+        """Mark entries with neither 'account' nor 'contra' specified."""
+        return (df["account"].isna() & df["contra"].isna()).to_numpy(dtype=bool)
+
+    @staticmethod
+    def _invalid_accounts(df: pd.DataFrame) -> np.ndarray:
+        """Mark entries referencing an undefined account or contra account."""
+        invalid_account = df["account"].notna() & ~df["_account_defined"]
+        invalid_contra = df["contra"].notna() & ~df["_contra_defined"]
+        return (invalid_account | invalid_contra).to_numpy(dtype=bool)
+
+    @staticmethod
+    def _invalid_assets(df: pd.DataFrame) -> np.ndarray:
+        """Mark entries with invalid asset references."""
+        return np.isnan(df["_precision"].to_numpy(dtype=float))
+
+    def _invalid_currency(self, df: pd.DataFrame) -> np.ndarray:
+        """Mark entries with currency mismatched to account or contra account.
+
+        Entries with zero amount, or referencing an account denominated in
+        reporting currency, are exempt from the check.
+        """
+        invalid_currency = np.zeros(len(df), dtype=bool)
+        for column in ["_account_currency", "_contra_currency"]:
+            currency = df[column]
+            mismatch = (
+                currency.notna() & (currency != self.reporting_currency)
+                & (df["currency"] != currency)
+            )
+            invalid_currency |= mismatch.fillna(True).to_numpy(dtype=bool)
+        if "amount" in df.columns:
+            invalid_currency &= ~(df["amount"] == 0).fillna(False).to_numpy(dtype=bool)
+        return invalid_currency
+
+    def _invalid_prices(self, df: pd.DataFrame) -> np.ndarray:
+        """Mark entries in a non-reporting currency without report amount,
+        for which no price is available as of the entry's date."""
+        return (
+            (df["currency"] != self.reporting_currency).fillna(True).to_numpy(dtype=bool)
+            & df["report_amount"].isna().to_numpy(dtype=bool)
+            & np.isnan(df["_fx_rate"].to_numpy(dtype=float))
+        )
+
+    def _invalid_profit_centers(self, df: pd.DataFrame) -> np.ndarray:
+        """Mark entries with missing or invalid profit center references, if
+        profit centers are defined."""
         profit_centers = set(self.profit_centers.list()["profit_center"])
-        if profit_centers:
-            invalid_mask = df["profit_center"].isna() | ~df["profit_center"].isin(profit_centers)
-        else:
-            invalid_mask = df["profit_center"].notna()
-        new_invalid_ids = set(df.loc[invalid_mask, "id"]) - invalid_ids
-        if new_invalid_ids:
-            if profit_centers:
-                self._logger.warning(
-                    f"Discarding {len(new_invalid_ids)} journal entries with missing or invalid "
-                    f"profit center: {first_elements_as_str(new_invalid_ids)}"
-                )
-            else:
-                self._logger.warning(
-                    f"Discarding {len(new_invalid_ids)} journal entries assigned to a "
-                    f"profit center, while no profit centers are defined: "
-                    f"{first_elements_as_str(new_invalid_ids)}"
-                )
-            invalid_ids = invalid_ids.union(new_invalid_ids)
-        return invalid_ids
+        if not profit_centers:
+            return np.zeros(len(df), dtype=bool)
+        invalid = df["profit_center"].isna() | ~df["profit_center"].isin(profit_centers)
+        return invalid.to_numpy(dtype=bool)
+
+    def _undefined_profit_centers(self, df: pd.DataFrame) -> np.ndarray:
+        """Mark entries assigned to a profit center, while none are defined."""
+        if set(self.profit_centers.list()["profit_center"]):
+            return np.zeros(len(df), dtype=bool)
+        return df["profit_center"].notna().to_numpy(dtype=bool)
 
     @staticmethod
     def amount_multiplier(df: pd.DataFrame) -> np.ndarray:
@@ -1036,22 +1539,30 @@ class LedgerEngine(ABC):
             np.where(df["account"].notna(), 1, -1)
         )
 
-    def _fill_report_amounts(
-        self, df: pd.DataFrame, invalid_ids: set, precision: pd.Series
-    ) -> pd.Series:
+    def _fill_report_amounts(self, df: pd.DataFrame, discard: np.ndarray) -> pd.Series:
         """Fill missing report amounts with default values.
 
         Replaces NA report amounts by converting the amount in transaction
-        currency into the reporting currency. Ensures that transactions with a single
+        currency into the reporting currency at the prices in the '_fx_rate'
+        column of the journal validation frame. Ensures that transactions with a single
         non-reporting currency that are balanced in their original currency are also balanced in
         reporting currency.
+
+        Args:
+            df (pd.DataFrame): Journal validation frame.
+            discard (np.ndarray): Boolean array marking rows to be discarded,
+                which are left unchanged.
         """
+        fx_rate = df["_fx_rate"].to_numpy(dtype=float)
         report_amount = df["report_amount"].copy()
-        na_mask = report_amount.isna() & ~df["id"].isin(invalid_ids)
-        report_amount.loc[na_mask] = self.report_amount(
-            amount=df.loc[na_mask, "amount"],
-            currency=df.loc[na_mask, "currency"],
-            date=df.loc[na_mask, "date"],
+        na_mask = report_amount.isna() & ~discard
+        na_rows = na_mask.to_numpy(dtype=bool)
+        dates = df.loc[na_mask, "date"]
+        report_amount.loc[na_mask] = self.round_to_precision(
+            pd.array(df.loc[na_mask, "amount"], dtype="Float64")
+            * pd.array(fx_rate[na_rows], dtype="Float64"),
+            [self.reporting_currency] * int(na_rows.sum()),
+            dates.iloc[0] if not dates.empty else None,
         )
 
         # Identify transactions with a single non-reporting currency that are
@@ -1068,7 +1579,7 @@ class LedgerEngine(ABC):
             "report_amount": report_amount * multiplier,
             "single_account_row": multiplier != 0,
             "original_report_amount_missing": df["report_amount"].isna(),
-            "precision": precision,
+            "precision": df["_precision"],
         })
         grouped = grouped.groupby("id").agg(
             nunique_currency=("currency", "nunique"),
@@ -1089,49 +1600,77 @@ class LedgerEngine(ABC):
         ])
         # Ensure transactions with a single non-reporting currency that are balanced in their
         # original currency are also balanced in reporting currency.
-        for txn_id in auto_balance_ids.difference(invalid_ids):
-            txn_mask = (df["id"] == txn_id) & (multiplier != 0)
-            first_txn_row = np.flatnonzero(txn_mask)[0]
-            txn_multiplier = multiplier[txn_mask]
-            fx_rate = self.price(
-                date=df["date"].iloc[first_txn_row],
-                ticker=df["currency"].iloc[first_txn_row],
-                currency=self.reporting_currency,
-            )[1]
-            # Adjust sign for 'amount' and 'report_amount' where only 'contra' is specified
-            unrounded_values = df.loc[txn_mask, "amount"] * txn_multiplier * fx_rate
-            rounded_values = report_amount[txn_mask] * txn_multiplier
-            increment = self.precision_vectorized(["reporting_currency"], [None])[0]
-            while True:
-                errors = rounded_values - unrounded_values
-                # Exit if within tolerance
-                if abs(rounded_values.sum()) <= tolerance:
-                    break
-                # Reduce the row with the largest positive error
-                if rounded_values.sum() > tolerance:
-                    idx_largest_err = errors.idxmax()
-                    rounded_values[idx_largest_err] -= increment
-                # Increase the row with the largest negative error
-                elif rounded_values.sum() < -tolerance:
-                    idx_smallest_err = errors.idxmin()
-                    rounded_values[idx_smallest_err] += increment
-            # Restore original sign where only 'contra' is specified
-            report_amount[txn_mask] = rounded_values * txn_multiplier
+        rows = np.flatnonzero(
+            df["id"].isin(auto_balance_ids).to_numpy(dtype=bool) & ~discard & (multiplier != 0)
+        )
+        if len(rows) > 0:
+            report_amount.iloc[rows] = self._balance_report_amounts(
+                txn_id=df["id"].iloc[rows].to_numpy(),
+                rounded=(report_amount.iloc[rows] * multiplier[rows]).to_numpy(dtype=float),
+                unrounded=(
+                    (df["amount"].iloc[rows] * multiplier[rows]).to_numpy(dtype=float)
+                    * fx_rate[rows]
+                ),
+                increment=self.precision_vectorized(["reporting_currency"], [None])[0],
+            ) * multiplier[rows]
         return report_amount
 
-    def _unbalanced_report_amounts(self, df: pd.DataFrame, invalid_ids: set) -> set:
-        """Mark transactions whose total amounts do not balance to zero as invalid."""
-        net_amount = (df["report_amount"] * self.amount_multiplier(df)).groupby(df["id"]).sum()
+    @staticmethod
+    def _balance_report_amounts(
+        txn_id: np.ndarray, rounded: np.ndarray, unrounded: np.ndarray, increment: float
+    ) -> np.ndarray:
+        """Adjust rounded amounts by whole increments so that each transaction
+        balances to zero within half an increment.
+
+        Largest remainder allocation: Rows whose rounding error is largest in
+        the direction of a transaction's imbalance are adjusted first, one
+        increment per row and round, ties going to the earlier row. The result
+        equals repeatedly adjusting the row with the largest error by one
+        increment until the transaction balances, evaluated for all
+        transactions at once.
+
+        Args:
+            txn_id (np.ndarray): Transaction id of each row.
+            rounded (np.ndarray): Rounded amounts, signed so that balanced
+                transactions sum to zero.
+            unrounded (np.ndarray): Corresponding unrounded amounts.
+            increment (float): Rounding increment.
+
+        Returns:
+            np.ndarray: The adjusted rounded amounts.
+        """
+        txn = pd.Series(pd.factorize(txn_id)[0])
+        total = pd.Series(rounded).groupby(txn).transform("sum").to_numpy()
+        n_rows = txn.groupby(txn).transform("size").to_numpy()
+        sign = np.sign(total)
+        # Rounded amounts are multiples of the increment, so this never hits an integer
+        steps = np.ceil((np.abs(total) - increment / 2) / increment).astype(int)
+
+        # Rounding errors in the direction of the imbalance, in increments. Errors of
+        # exactly minus one half equal plus one half after one adjustment: treat these
+        # rows as adjusted in advance of the first round.
+        error = sign * np.round((rounded - unrounded) / increment, 6)
+        carried = (error <= -0.5).astype(int)
+        error = error + carried
+        steps = steps + pd.Series(carried).groupby(txn).transform("sum").to_numpy()
+        rounds, remainder = np.divmod(steps, n_rows)
+
+        # Rank rows within each transaction, rows carried forward first in the first round
+        first_round = np.where(rounds == 0, carried, 0)
+        order = np.lexsort((np.arange(len(txn)), -error, -first_round, txn.to_numpy()))
+        rank = np.empty(len(txn), dtype=int)
+        rank[order] = txn.iloc[order].groupby(txn.iloc[order]).cumcount().to_numpy()
+
+        adjustment = rounds + (rank < remainder) - carried
+        return rounded - sign * increment * adjustment
+
+    def _unbalanced_report_amounts(self, df: pd.DataFrame) -> np.ndarray:
+        """Mark transactions whose total amounts do not balance to zero."""
+        net_amount = (
+            (df["report_amount"] * self.amount_multiplier(df)).groupby(df["id"]).transform("sum")
+        )
         precision = self.precision_vectorized(["reporting_currency"], [None])[0] / 2
-        unbalanced = abs(net_amount) > precision
-        if unbalanced.any():
-            unbalanced_ids = set(unbalanced.index[unbalanced])
-            self._logger.warning(
-                f"Discarding {len(unbalanced_ids)} journal entries where "
-                f"amounts do not balance to zero: {first_elements_as_str(unbalanced_ids)}"
-            )
-            invalid_ids = invalid_ids.union(unbalanced_ids)
-        return invalid_ids
+        return (net_amount.abs() > precision).fillna(False).to_numpy(dtype=bool)
 
     def serialize_ledger(self, df: pd.DataFrame) -> pd.DataFrame:
         """Serializes the ledger into a long format.
@@ -1243,17 +1782,33 @@ class LedgerEngine(ABC):
             currencies=tickers, dates=dates, allow_missing=True
         )
 
-        result = []
-        for amt, prec in zip(amounts, precision):
-            if prec is None or pd.isna(amt):
-                result.append(None)
-            else:
-                scaled = round(amt / prec, 0) * prec
-                rounded = round(scaled, -1 * math.floor(math.log10(prec)))
-                result.append(rounded)
+        amounts = pd.array(amounts, dtype="Float64").to_numpy(dtype=float, na_value=np.nan)
+        rounded = self._round_to_increment(amounts, precision.to_numpy())
+        result = [None if np.isnan(value) else value for value in rounded.tolist()]
 
         return result[0] if is_scalar else result
 
+    @staticmethod
+    def _round_to_increment(amount: np.ndarray, increment: np.ndarray) -> np.ndarray:
+        """Vectorized counterpart of the rounding performed in `round_to_precision()`.
+
+        Args:
+            amount (np.ndarray): Values to be rounded.
+            increment (np.ndarray): Precision increment for each value.
+
+        Returns:
+            np.ndarray: Rounded values, NaN where amount or increment is missing.
+        """
+        amount = np.asarray(amount, dtype=float)
+        increment = np.asarray(increment, dtype=float)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            scaled = np.round(amount / increment) * increment
+            digits = -np.floor(np.log10(increment))
+            factor = 10.0 ** np.abs(digits)
+            return np.where(
+                digits >= 0, np.round(scaled * factor) / factor, np.round(scaled / factor) * factor
+            )
+
     def report_amount(
         self, amount: list[float], currency: list[str], date: list[datetime.date]
     ) -> list[float]:
@@ -1275,15 +1830,15 @@ class LedgerEngine(ABC):
         if not (len(amount) == len(currency) == len(date)):
             raise ValueError("Vectors 'amount', 'currency', and 'date' must have the same length.")
 
+        # Look up each distinct (currency, date) price only once
         reporting_currency = self.reporting_currency
-        prices = [
-            self.price(src_currency, date=dt, currency=reporting_currency)[1]
-            for src_currency, dt in zip(currency, date)
-        ]
-        amounts = [
-            amt * rate if amt is not None and rate is not None else None
-            for amt, rate in zip(amount, prices)
-        ]
+        pairs = list(zip(currency, date))
+        rates = {
+            pair: self.price(pair[0], date=pair[1], currency=reporting_currency)[1]
+            for pair in dict.fromkeys(pairs)
+        }
+        prices = pd.array([rates[pair] for pair in pairs], dtype="Float64")
+        amounts = pd.array(list(amount), dtype="Float64") * prices
         if isinstance(date, pd.Series):
             date = date.iloc[0] if not date.empty else None
         else:
@@ -1335,7 +1890,6 @@ class LedgerEngine(ABC):
         df = df.loc[~invalid_mask].reset_index(drop=True)
         return df
 
-    @timed_cache(120)
     def price(
         self,
         ticker: str,
@@ -1345,6 +1899,8 @@ class LedgerEngine(ABC):
         """Retrieve price for a given ticker as of a specified date. If no price is available
         on the exact date, return latest price observation prior to the specified date.
 
+        Results are memoized until prices or assets change.
+
         Args:
             ticker (str): Asset identifier.
             date (datetime.date): Date for which the price is required.
@@ -1363,6 +1919,17 @@ class LedgerEngine(ABC):
         elif not isinstance(date, datetime.date):
             date = pd.to_datetime(date).date()
 
+        prices = self._memoized("price_lookups", ["price_history", "assets"], dict, copy=False)
+        key = (ticker, date, currency)
+        if key not in prices:
+            prices[key] = self._lookup_price(ticker, date, currency)
+        return prices[key]
+
+    def _lookup_price(
+        self, ticker: str, date: datetime.date, currency: str | None
+    ) -> tuple[str, float]:
+        """Look up a price in the price history, see `price()`."""
+
         if ticker not in self._prices_as_dict_of_df:
             raise ValueError(f"No price data available for '{ticker}'.")
 
@@ -1381,25 +1948,105 @@ class LedgerEngine(ABC):
 
         return (currency, prc.iloc[-1].item())
 
+    def price_vectorized(
+        self, tickers: pl.Series, dates: pl.Series, currency: str, allow_missing: bool = False
+    ) -> pl.Series:
+        """Vectorized counterpart of `price()` for prices in a given currency.
+
+        Resolves all (ticker, date) pairs with a single backward as-of join
+        against the price history: Each pair gets the latest price observation
+        on or prior to its date.
+
+        Args:
+            tickers (pl.Series): Asset identifiers.
+            dates (pl.Series): Corresponding dates, same length as `tickers`.
+                Missing dates default to today.
+            currency (str): Currency in which prices are desired.
+            allow_missing (bool): If True, unavailable prices return null instead
+                of raising.
+
+        Returns:
+            pl.Series: Prices (float or null), one per (ticker, date) input. Tickers
+                equal to `currency` have a price of 1.0.
+
+        Raises:
+            ValueError: If no price is available for any of the pairs and
+                `allow_missing` is False.
+        """
+        tickers = pl.Series(tickers) if not isinstance(tickers, pl.Series) else tickers
+        dates = pl.Series(dates) if not isinstance(dates, pl.Series) else dates
+        lookup = pl.DataFrame({
+            "ticker": tickers.cast(pl.Utf8),
+            "currency": pl.Series([currency] * len(tickers), dtype=pl.Utf8),
+            "date": dates.cast(pl.Date).fill_null(datetime.date.today()),
+        }).with_row_index("row")
+        joined = (
+            lookup.sort("date")
+            .join_asof(
+                self._prices_as_df, by=["ticker", "currency"], on="date",
+                strategy="backward", check_sortedness=False,
+            )
+            .sort("row")
+            .with_columns(
+                price=pl.when(pl.col("ticker") == pl.col("currency"))
+                .then(1.0).otherwise(pl.col("price"))
+            )
+        )
+
+        if not allow_missing:
+            missing_idx = joined["price"].is_null().arg_true().min()
+            if missing_idx is not None:
+                raise ValueError(
+                    f"No {currency} prices available for '{joined['ticker'][missing_idx]}' "
+                    f"before {joined['date'][missing_idx]}."
+                )
+        return joined["price"]
+
+    @property
+    def _prices_as_df(self) -> pl.DataFrame:
+        """Price history for as-of joins in `price_vectorized()`, memoized until
+        prices or assets change.
+
+        Returns:
+            pl.DataFrame: Columns 'ticker', 'currency', 'date' and 'price', sorted
+                by ticker, currency and date. Observations without a date are omitted.
+        """
+        def build():
+            prices = self.sanitize_prices(self.price_history.list())
+            return (
+                pl.from_pandas(prices[["ticker", "currency", "date", "price"]])
+                .with_columns(
+                    pl.col("ticker").cast(pl.Utf8), pl.col("currency").cast(pl.Utf8),
+                    pl.col("date").cast(pl.Date), pl.col("price").cast(pl.Float64),
+                )
+                .drop_nulls("date")
+                .sort(["ticker", "currency", "date"], maintain_order=True)
+            )
+        return self._memoized("prices_as_df", ["price_history", "assets"], build, copy=False)
+
     @property
-    @timed_cache(120)
     def _prices_as_dict_of_df(self) -> Dict[str, pd.DataFrame]:
-        """Organizes price data by ticker and currency for quick access.
+        """Organizes price data by ticker and currency for quick access, memoized
+        until prices or assets change.
 
         Returns:
             Dict[str, Dict[str, pd.DataFrame]]: Maps each asset ticker to
             a nested dictionary of DataFrames by currency, with its
             `price` history sorted by `date` with `NaT` values first.
         """
-        result = {}
-        prices = self.sanitize_prices(self.price_history.list()).groupby(["ticker", "currency"])
-        for (ticker, currency), group in prices:
-            group = group[["date", "price"]].sort_values("date", na_position="first")
-            group = group.reset_index(drop=True)
-            if ticker not in result.keys():
-                result[ticker] = {}
-            result[ticker][currency] = group
-        return result
+        def build():
+            result = {}
+            prices = self.sanitize_prices(self.price_history.list())
+            for (ticker, currency), group in prices.groupby(["ticker", "currency"]):
+                group = group[["date", "price"]].sort_values("date", na_position="first")
+                group = group.reset_index(drop=True)
+                if ticker not in result.keys():
+                    result[ticker] = {}
+                result[ticker][currency] = group
+            return result
+        return self._memoized(
+            "prices_as_dict_of_df", ["price_history", "assets"], build, copy=False
+        )
 
     # ----------------------------------------------------------------------
     # Assets
@@ -1432,14 +2079,13 @@ class LedgerEngine(ABC):
         return df
 
     @property
-    @timed_cache(120)
     def _assets_as_df(self) -> pl.DataFrame:
         """
         Returns a clean, unified DataFrame of asset definitions for precision lookups.
 
         Merges default and user-defined assets, fills missing dates with a fallback default date,
         removes duplicates on ('ticker', 'date') keeping the first occurrence, and sorts
-        values by ticker and date.
+        values by ticker and date. The result is memoized until assets change.
 
         Returns:
             pl.DataFrame: A Polars DataFrame with columns:
@@ -1447,19 +2093,20 @@ class LedgerEngine(ABC):
                 - 'date' (date): Effective date (or fallback default for timeless entries).
                 - 'increment' (float): Precision increment for the asset.
         """
-        combined = (
-            pl.concat([
-                pl.from_pandas(self.sanitize_assets(self.assets.list())),
-                pl.from_pandas(DEFAULT_ASSETS),
-            ])
-            .with_columns([
-                pl.col("ticker").cast(pl.Utf8),
-                pl.col("date").fill_null(DEFAULT_DATE).cast(pl.Date),
-            ])
-            .unique(subset=["ticker", "date"], keep="first")
-            .sort(["ticker", "date"])
-        )
-        return combined
+        def build():
+            return (
+                pl.concat([
+                    pl.from_pandas(self.sanitize_assets(self.assets.list())),
+                    pl.from_pandas(DEFAULT_ASSETS),
+                ])
+                .with_columns([
+                    pl.col("ticker").cast(pl.Utf8),
+                    pl.col("date").fill_null(DEFAULT_DATE).cast(pl.Date),
+                ])
+                .unique(subset=["ticker", "date"], keep="first")
+                .sort(["ticker", "date"])
+            )
+        return self._memoized("assets_as_df", ["assets"], build, copy=False)
 
     def precision_vectorized(
         self, currencies: pl.Series, dates: pl.Series, allow_missing: bool = False
@@ -1542,54 +2189,75 @@ class LedgerEngine(ABC):
         """
         df = enforce_schema(df, RECONCILIATION_SCHEMA, keep_extra_columns=True)
         id_columns = RECONCILIATION_SCHEMA.query("id == True")["column"].tolist()
-        id_data = df[id_columns]
-        invalid_mask = pd.Series(False, index=df.index)
+        frame = self._reconciliation_validation_frame(df)
+        result = validate(
+            frame, self._reconciliation_rules(), id_columns=id_columns, logger=self._logger,
+            disabled=self.disabled_validation_rules,
+        )
+        self._validation_results = (self._validation_results or {}) | {"reconciliation": result}
+        frame["tolerance"] = frame["tolerance"].fillna(0.0)
 
-        mask = self._invalid_periods(df["period"], invalid_mask)
-        self._log_invalid_rows("invalid periods", mask, id_data)
-        invalid_mask |= mask
+        return frame.loc[~result.discard, df.columns].reset_index(drop=True)
 
-        mask = self._invalid_reconciliation_accounts(df["account"], invalid_mask)
-        self._log_invalid_rows("invalid accounts", mask, id_data)
-        invalid_mask |= mask
+    def _reconciliation_validation_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Join reconciliation rows with the reference data of the validation rules.
 
-        mask = self._invalid_reconciliation_profit_centers(df["profit_center"], invalid_mask)
-        self._log_invalid_rows("invalid profit centers", mask, id_data)
-        invalid_mask |= mask
+        Adds the columns '_period_valid', '_period_start', '_period_end' and
+        '_currency_defined', which is False for currencies without asset
+        definition as of the end of the period.
 
-        drop_mask, patch_mask = self._invalid_currencies(
-            df["currency"], df["period"], df["balance"], df["report_balance"], invalid_mask
+        Returns:
+            pd.DataFrame: Copy of `df` with the added columns.
+        """
+        spans = parse_date_spans(df["period"], errors="coerce")
+        frame = df.copy()
+        frame["_period_valid"] = spans["valid"] & df["period"].notna()
+        frame["_period_start"] = spans["start"]
+        frame["_period_end"] = spans["end"]
+        precision = self.precision_vectorized(
+            currencies=frame["currency"], dates=frame["_period_end"], allow_missing=True
         )
-        self._log_invalid_rows("invalid currencies without report balance", drop_mask, id_data)
-        self._log_invalid_rows(
-            "invalid currencies with patch (clearing balance & currency)", patch_mask, id_data
+        frame["_currency_defined"] = (
+            frame["currency"].isna().to_numpy() | precision.is_not_null().to_numpy()
         )
-        df.loc[patch_mask, ["balance", "currency"]] = pd.NA
-        invalid_mask |= drop_mask
-
-        mask = self._invalid_missing_balances(df["balance"], df["report_balance"], invalid_mask)
-        self._log_invalid_rows("missing both balances", mask, id_data)
-        invalid_mask |= mask
-        df["tolerance"] = df["tolerance"].fillna(0.0)
-
-        return df.loc[~invalid_mask].reset_index(drop=True)
-
-    def _invalid_periods(self, period: pd.Series, invalid_mask: pd.Series) -> pd.Series:
-        """Mark rows with invalid periods."""
-        def is_invalid(x):
-            if pd.isna(x):
-                return True
-            try:
-                return not bool(parse_date_span(x))
-            except Exception:
-                return True
-
-        mask = period.apply(is_invalid)
-        return mask & ~invalid_mask
+        return frame
+
+    def _reconciliation_rules(self) -> list[ValidationRule]:
+        """Validation rules of `sanitize_reconciliation()`, in order of application."""
+        return [
+            ValidationRule(
+                "periods", lambda df: ~df["_period_valid"].to_numpy(dtype=bool),
+                "Discarding %d reconciliation rows with invalid periods: %s",
+            ),
+            ValidationRule(
+                "accounts", self._invalid_reconciliation_accounts,
+                "Discarding %d reconciliation rows with invalid accounts: %s",
+            ),
+            ValidationRule(
+                "profit_centers", self._invalid_reconciliation_profit_centers,
+                "Discarding %d reconciliation rows with invalid profit centers: %s",
+            ),
+            ValidationRule(
+                "patched_currencies",
+                lambda df: (~df["_currency_defined"] & df["balance"].notna()).to_numpy(bool),
+                "Discarding %d reconciliation rows with invalid currencies with patch "
+                "(clearing balance & currency): %s",
+                patch=self._clear_reconciliation_currencies,
+            ),
+            ValidationRule(
+                "currencies",
+                lambda df: (~df["_currency_defined"] & df["report_balance"].isna()).to_numpy(bool),
+                "Discarding %d reconciliation rows with invalid currencies without "
+                "report balance: %s",
+            ),
+            ValidationRule(
+                "missing_balances",
+                lambda df: (df["balance"].isna() & df["report_balance"].isna()).to_numpy(bool),
+                "Discarding %d reconciliation rows with missing both balances: %s",
+            ),
+        ]
 
-    def _invalid_reconciliation_accounts(
-        self, account: pd.Series, invalid_mask: pd.Series
-    ) -> pd.Series:
+    def _invalid_reconciliation_accounts(self, df: pd.DataFrame) -> np.ndarray:
         """Mark rows with invalid account references."""
         def is_invalid(x):
             try:
@@ -1598,57 +2266,20 @@ class LedgerEngine(ABC):
             except Exception:
                 return True
 
-        mask = account.apply(is_invalid)
-        return mask & ~invalid_mask
+        account = df["account"]
+        invalid = {x: is_invalid(x) for x in account.dropna().unique()}
+        return account.map(invalid).fillna(True).to_numpy(dtype=bool)
 
-    def _invalid_reconciliation_profit_centers(
-        self, pc: pd.Series, invalid_mask: pd.Series
-    ) -> pd.Series:
+    def _invalid_reconciliation_profit_centers(self, df: pd.DataFrame) -> np.ndarray:
         """Mark rows with invalid profit centers."""
         valid_set = set(self.profit_centers.list()["profit_center"])
-        mask = pc.notna() & ~pc.isin(valid_set)
-        return mask & ~invalid_mask
+        pc = df["profit_center"]
+        return (pc.notna() & ~pc.isin(valid_set)).to_numpy(dtype=bool)
 
-    def _invalid_currencies(
-        self,
-        currency: pd.Series,
-        period: pd.Series,
-        balance: pd.Series,
-        report_balance: pd.Series,
-        invalid_mask: pd.Series,
-    ) -> tuple[pd.Series, pd.Series]:
-        """Mark rows with invalid currencies and identify patchable ones."""
-        valid_idx = ~invalid_mask
-        currency_valid = currency.loc[valid_idx]
-        period_valid = period.loc[valid_idx].map(lambda x: parse_date_span(x)[1])
-        precision = self.precision_vectorized(
-            currencies=currency_valid, dates=period_valid, allow_missing=True
-        )
-
-        currency_na_mask = currency_valid.isna().to_numpy()
-        precision_null_mask = precision.is_null().to_numpy()
-        invalid_local = (~currency_na_mask) & precision_null_mask
-        full_mask = pd.Series(False, index=currency.index)
-        full_mask.loc[currency_valid.index[invalid_local]] = True
-
-        drop_mask = full_mask & report_balance.isna()
-        patch_mask = full_mask & balance.notna()
-        return drop_mask, patch_mask
-
-    def _invalid_missing_balances(
-        self, balance: pd.Series, report_balance: pd.Series, invalid_mask: pd.Series
-    ) -> pd.Series:
-        """Mark rows missing both balances."""
-        mask = balance.isna() & report_balance.isna()
-        return mask & ~invalid_mask
-
-    def _log_invalid_rows(self, reason: str, mask: pd.Series, id_data: pd.DataFrame) -> None:
-        """Log a warning for invalid rows."""
-        if mask.any():
-            self._logger.warning(
-                f"Discarding {mask.sum()} reconciliation rows with {reason}: "
-                f"{first_elements_as_str(id_data.loc[mask].to_dict('records'))}"
-            )
+    @staticmethod
+    def _clear_reconciliation_currencies(df: pd.DataFrame, mask: np.ndarray) -> None:
+        """Set balance and currency of rows with invalid currencies to NA."""
+        df.loc[mask, ["balance", "currency"]] = pd.NA
 
     def reconcile(
         self,
@@ -1673,13 +2304,12 @@ class LedgerEngine(ABC):
             start = pd.to_datetime(start) if start else None
             end = pd.to_datetime(end)
 
-            def row_within_period(row) -> bool:
-                r_start, r_end = parse_date_span(row["period"])
-                r_start = pd.to_datetime(r_start) if r_start else pd.to_datetime(r_end)
-                r_end = pd.to_datetime(r_end)
-                return (start is None or r_start >= start) and (r_end <= end)
-
-            df = df[df.apply(row_within_period, axis=1)].reset_index(drop=True)
+            spans = parse_date_spans(df["period"])
+            row_start = spans["start"].fillna(spans["end"])
+            within = spans["end"] <= end
+            if start is not None:
+                within &= row_start >= start
+            df = df[within].reset_index(drop=True)
 
         if file_pattern is not None:
             df = df[df['file'].str.contains(file_pattern, na=False)]
@@ -1714,7 +2344,7 @@ class LedgerEngine(ABC):
 
         if not df.empty:
             df["delta"] = df["actual_balance"].fillna(0) - df["balance"].fillna(0)
-            df["end"] = [parse_date_span(period)[1] for period in df['period']]
+            df["end"] = parse_date_spans(df["period"])["end"].dt.date
             df["precision"] = \
                 self.precision_vectorized(df["currency"], dates=df["end"], allow_missing=True)
             df["report_delta"] = \
@@ -1828,6 +2458,93 @@ class LedgerEngine(ABC):
 
         return valid
 
+    def _profit_center_categories(self) -> tuple[pd.Index, dict]:
+        """Return the sorted defined profit centers, which serve as categories of
+        the 'profit_center' column in the serialized ledger, together with the
+        memo of resolved profit center filters.
+
+        Both are cached until the profit center entity changes.
+        """
+        cache = self._profit_center_codes
+        version = self.profit_centers.version
+        if cache is None or cache[0] != version:
+            defined = self.profit_centers.list()["profit_center"].dropna().unique()
+            cache = (version, pd.Index(sorted(defined), dtype="string"), {})
+            self._profit_center_codes = cache
+        return cache[1], cache[2]
+
+    def _clear_profit_center_codes(self):
+        """Discard cached profit center categories, e.g. after profit center changes."""
+        self._profit_center_codes = None
+
+    def _encode_profit_centers(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Store the 'profit_center' column as categorical, with integer codes
+        referring to `_profit_center_categories()`. Undefined profit centers are
+        appended as additional categories.
+        """
+        categories, _ = self._profit_center_categories()
+        values = df["profit_center"].astype("string")
+        undefined = pd.Index(values.dropna().unique(), dtype="string").difference(categories)
+        if len(undefined):
+            categories = categories.append(undefined)
+        df["profit_center"] = pd.Categorical(values, categories=categories)
+        return df
+
+    def _resolve_profit_centers(
+        self, profit_centers: str | list[str] | set[str] | None
+    ) -> tuple[set[str], np.ndarray] | None:
+        """Resolve a profit center filter into profit center names and a boolean
+        lookup table over the integer codes of `_profit_center_categories()`.
+
+        Resolved filters are memoized until the profit center entity changes.
+
+        Args:
+            profit_centers (str | list[str] | set[str] | None): Profit center filter.
+                See `parse_profit_centers()` for supported formats.
+
+        Returns:
+            tuple[set[str], np.ndarray] | None: The valid profit center names and
+                a lookup table with one entry per category plus a final False entry
+                for code -1 (missing). None if no filtering applies.
+        """
+        if pd.api.types.is_scalar(profit_centers) and pd.isna(profit_centers):
+            return None
+        categories, resolved = self._profit_center_categories()
+        key = profit_centers if isinstance(profit_centers, str) else frozenset(profit_centers)
+        result = resolved.get(key)
+        if result is None:
+            valid = self.parse_profit_centers(profit_centers)
+            result = (valid, np.append(categories.isin(valid), False))
+            resolved[key] = result
+        return result
+
+    def _profit_center_mask(
+        self, values: pd.Series, profit_centers: str | list[str] | set[str] | None
+    ) -> np.ndarray | None:
+        """Mark values matching a profit center filter.
+
+        Categorical values encoded by `_encode_profit_centers()` are matched by
+        integer code lookup; other values fall back to a string comparison.
+
+        Args:
+            values (pd.Series): Profit center column, e.g. of the serialized ledger.
+            profit_centers (str | list[str] | set[str] | None): Profit center filter.
+
+        Returns:
+            np.ndarray | None: Boolean mask of the same length as `values`,
+                None if no filtering applies.
+        """
+        resolved = self._resolve_profit_centers(profit_centers)
+        if resolved is None:
+            return None
+        valid, lookup = resolved
+        categories, _ = self._profit_center_categories()
+        if isinstance(values.dtype, pd.CategoricalDtype) and (
+            values.cat.categories.equals(categories)
+        ):
+            return lookup[values.cat.codes.to_numpy()]
+        return values.isin(valid).to_numpy(dtype=bool)
+
     # ----------------------------------------------------------------------
     # Reporting
 
@@ -1889,9 +2606,27 @@ class LedgerEngine(ABC):
         if len(set(labels)) != len(labels):
             raise ValueError(f"Duplicate column names in `columns['labels']`: {labels}")
 
+        # Compute one balance matrix per distinct profit center filter
+        records = columns.to_dict("records")
+        filters = {repr(row.get("profit_centers")): row.get("profit_centers") for row in records}
+        matrices = {
+            key: self.balance_matrix(
+                accounts=accounts["account"].tolist(),
+                periods=[
+                    row["period"] for row in records if repr(row.get("profit_centers")) == key
+                ],
+                profit_centers=profit_centers,
+            ).xs("reporting_currency", level="currency")
+            for key, profit_centers in filters.items()
+        }
         dfs = [
-            self._report_column(row=row, accounts=accounts, prune_level=prune_level)
-            for row in columns.to_dict("records")
+            self._report_column(
+                label=row["label"],
+                report_balances=matrices[repr(row.get("profit_centers"))][row["period"]],
+                accounts=accounts,
+                prune_level=prune_level,
+            )
+            for row in records
         ]
         sheet = pd.concat(dfs, axis=1)
         # Remove duplicate "group"/"description" columns, keeping the first instance
@@ -1945,28 +2680,26 @@ class LedgerEngine(ABC):
 
         return report
 
-    def _report_column(self, row, accounts, prune_level=2) -> pd.DataFrame:
-        """Helper to compute balances for a single reporting column."""
-        balances = self.individual_account_balances(
-            accounts=accounts["account"].tolist(),
-            period=row["period"],
-            profit_centers=row.get("profit_centers")
-        )
-        balances = balances.drop(columns=["group", "description", "currency"], errors="ignore")
-        balances = balances.merge(
-            accounts[["account", "group", "description", "currency", "account_multiplier"]],
-            on="account", how="right"
+    def _report_column(
+        self, label, report_balances: pd.Series, accounts: pd.DataFrame, prune_level=2
+    ) -> pd.DataFrame:
+        """Helper to aggregate reporting currency balances for a single reporting column."""
+        report_balances = report_balances.reindex(accounts["account"])
+        balances = accounts[["account", "group", "description"]].assign(
+            currency="reporting_currency",
+            # Apply account multiplier
+            balance=(
+                report_balances.to_numpy(dtype=float, na_value=np.nan)
+                * accounts["account_multiplier"].to_numpy(dtype=float, na_value=np.nan)
+            ),
         )
-
-        # Apply account multiplier
-        balances["report_balance"] *= balances["account_multiplier"]
         aggregated = self.aggregate_account_balances(balances, n=prune_level)
 
         # Hack: aggregate_account_balances always adds a leading slash, remove it manually
         aggregated["group"] = aggregated["group"].str.removeprefix("/")
 
-        return aggregated[["group", "description", "report_balance"]].rename(
-            columns={"report_balance": row["label"]}
+        return aggregated[["group", "description", "balance"]].rename(
+            columns={"balance": label}
         )
 
     def account_sheet_tables(
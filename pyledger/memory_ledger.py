@@ -34,32 +34,51 @@ class MemoryLedger(StandaloneLedger):
         self._reporting_currency = reporting_currency
         self._assets = DataFrameEntity(
             ASSETS_SCHEMA,
+            on_change=self._invalidate_ledger,
+            validate_change=self._check_open_settings
         )
 
-        def _clear_account_caches():
-            self.serialized_ledger.cache_clear()
-            self.account_currency.cache_clear()
+        def _clear_account_caches(ids=None):
+            self._invalidate_ledger()
+            self._clear_account_selectors()
         self._accounts = DataFrameEntity(
             ACCOUNT_SCHEMA,
             on_change=_clear_account_caches
         )
         self._tax_codes = DataFrameEntity(
             TAX_CODE_SCHEMA,
-            on_change=self.serialized_ledger.cache_clear
+            on_change=self._invalidate_ledger
         )
         self._price_history = DataFrameEntity(
             PRICE_SCHEMA,
-            on_change=self.price.cache_clear
+            on_change=self._invalidate_ledger,
+            validate_change=self._check_open_settings
+        )
+        self._revaluations = DataFrameEntity(
+            REVALUATION_SCHEMA,
+            on_change=self._invalidate_ledger,
+            validate_change=self._check_open_period
         )
-        self._revaluations = DataFrameEntity(REVALUATION_SCHEMA)
         self._journal = JournalDataFrameEntity(
             JOURNAL_SCHEMA,
             prepare_for_mirroring=self.sanitize_journal,
-            on_change=self.serialized_ledger.cache_clear
+            on_change=self._invalidate_journal,
+            validate_change=self._check_open_period
+        )
+
+        def _clear_profit_center_caches(ids=None):
+            self._invalidate_ledger()
+            self._clear_profit_center_codes()
+        self._profit_centers = DataFrameEntity(
+            PROFIT_CENTER_SCHEMA,
+            on_change=_clear_profit_center_caches
         )
-        self._profit_centers = DataFrameEntity(PROFIT_CENTER_SCHEMA)
         self._reconciliation = DataFrameEntity(RECONCILIATION_SCHEMA)
-        self._target_balance = DataFrameEntity(TARGET_BALANCE_SCHEMA)
+        self._target_balance = DataFrameEntity(
+            TARGET_BALANCE_SCHEMA,
+            on_change=self._invalidate_ledger,
+            validate_change=self._check_open_period
+        )
 
     # ----------------------------------------------------------------------
     # Currency
@@ -71,3 +90,4 @@ class MemoryLedger(StandaloneLedger):
     @reporting_currency.setter
     def reporting_currency(self, currency):
         self._reporting_currency = currency
+        self._invalidate_ledger()
@@ -4,15 +4,24 @@ independently of third-party software.
 """
 
 import datetime
+import time
 import zipfile
+from typing import Any, Callable, Literal
 import numpy as np
 import pandas as pd
+import polars as pl
 from pyledger.helpers import first_elements_as_str
 from pyledger.storage_entity import AccountingEntity
-from pyledger.time import parse_date_span
+from pyledger.time import parse_date_span, parse_date_spans
+from .balance_cache import BalanceCache
+from .balance_index import BalanceIndex
+from .chunked_ledger import ChunkedLedger
 from .decorators import timed_cache
-from .constants import JOURNAL_SCHEMA, REVALUATION_SCHEMA, TARGET_BALANCE_SCHEMA
+from .constants import (
+    BALANCE_LONG_SCHEMA, JOURNAL_SCHEMA, REVALUATION_SCHEMA, TARGET_BALANCE_SCHEMA
+)
 from .ledger_engine import LedgerEngine
+from .validation import ValidationRule, validate
 from consistent_df import enforce_schema
 
 
@@ -24,6 +33,14 @@ class StandaloneLedger(LedgerEngine):
     with a specific data storage choice.
     """
 
+    _balance_cache = None
+    _closed_until = None
+    _closing_snapshot = None
+    _ledger_built = None
+    _ledger_derived = None
+    _ledger_state = None
+    _pending_journal_ids = None
+
     # ----------------------------------------------------------------------
     # Storage entities
 
@@ -82,8 +99,9 @@ class StandaloneLedger(LedgerEngine):
             self.revaluations.mirror(revaluations, delete=True)
 
     def clear(self):
-        """Extend clear() to delete reconciliation,
+        """Extend clear() to reopen closed periods and delete reconciliation,
         target balance, and revaluations records after base deletion."""
+        self.reopen_period()
         super().clear()
         self.reconciliation.mirror(None, delete=True)
         self.target_balance.mirror(None, delete=True)
@@ -95,9 +113,9 @@ class StandaloneLedger(LedgerEngine):
     def tax_entries(self, df: pd.DataFrame) -> pd.DataFrame:
         """Create journal entries to book tax according to tax_codes.
 
-        Iterates through the provided DataFrame and calculates tax for entries
-        that have a non-null tax_code. It generates a new journal entry for
-        each tax account.
+        Calculates tax for entries that have a non-null tax_code. Tax definitions
+        and account tax codes are joined to all taxed entries at once, and one
+        journal entry is generated for each tax account.
 
         Args:
             df (pd.DataFrame): A pandas DataFrame containing journal entries.
@@ -106,65 +124,57 @@ class StandaloneLedger(LedgerEngine):
             pd.DataFrame: A new DataFrame with tax journal entries.
             Returns empty DataFrame with the correct structure if no tax codes are present.
         """
-        tax_definitions = self.tax_codes.list().set_index("id").to_dict("index")
-        tax_journal_entries = []
-        accounts = self.accounts.list()
-        account_tax_map = accounts.set_index("account")["tax_code"].to_dict()
-
-        for row in df.loc[df["tax_code"].notna()].to_dict("records"):
-            tax = tax_definitions[row["tax_code"]]
-            account_tax_code = account_tax_map.get(row["account"])
-            contra_tax_code = account_tax_map.get(row["contra"])
-            if pd.isna(account_tax_code) and pd.isna(contra_tax_code):
-                self._logger.warning(
-                    f"Skip tax code '{row['tax_code']}' for {row['id']}: Neither account nor "
-                    f"counter account have a tax_code."
-                )
-            elif pd.isna(account_tax_code) and pd.notna(contra_tax_code):
-                multiplier = 1.0
-                account = row["contra"] if tax["is_inclusive"] else row["account"]
-            elif pd.notna(account_tax_code) and pd.isna(contra_tax_code):
-                multiplier = -1.0
-                account = row["account"] if tax["is_inclusive"] else row["contra"]
-            else:
-                self._logger.warning(
-                    f"Skip tax code '{row['tax_code']}' for {row['id']}: Both account and "
-                    f"counter accounts have tax_code."
-                )
-                continue
+        taxed = df.loc[df["tax_code"].notna()].reset_index(drop=True)
+        tax = self.tax_codes.list().set_index("id").loc[taxed["tax_code"]].reset_index(drop=True)
+        account_tax_map = self.accounts.list().set_index("account")["tax_code"]
+        has_account_tax = taxed["account"].map(account_tax_map).notna().to_numpy(dtype=bool)
+        has_contra_tax = taxed["contra"].map(account_tax_map).notna().to_numpy(dtype=bool)
+
+        for row in np.flatnonzero(has_account_tax == has_contra_tax):
+            reason = (
+                "Both account and counter accounts have tax_code." if has_account_tax[row]
+                else "Neither account nor counter account have a tax_code."
+            )
+            self._logger.warning(
+                f"Skip tax code '{taxed['tax_code'].iat[row]}' for {taxed['id'].iat[row]}: "
+                f"{reason}"
+            )
 
-            # Calculate tax amount
-            if tax["is_inclusive"]:
-                amount = row["amount"] * tax["rate"] / (1 + tax["rate"])
-            else:
-                amount = row["amount"] * tax["rate"]
-            amount = amount * multiplier
-
-            # Create a new journal entry for the tax amount
-            if amount != 0:
-                base_entry = {
-                    "date": row["date"],
-                    "description": "TAX: " + row["description"],
-                    "account": account,
-                    "document": row["document"],
-                    "currency": row["currency"],
-                    "report_amount": np.nan,
-                    "tax_code": row["tax_code"],
-                    "profit_center": row["profit_center"]
-                }
-                if pd.notna(tax["account"]):
-                    tax_journal_entries.append(base_entry | {
-                        "id": f"{row['id']}:tax",
-                        "contra": tax["account"],
-                        "amount": amount,
-                    })
-                if pd.notna(tax["contra"]):
-                    amount = -1 * amount
-                    tax_journal_entries.append(base_entry | {
-                        "id": f"{row['id']}:tax",
-                        "contra": tax["contra"],
-                        "amount": amount,
-                    })
+        # Calculate tax amount, with the sign given by the side carrying the tax code
+        is_inclusive = tax["is_inclusive"].to_numpy(dtype=bool, na_value=False)
+        rate = tax["rate"].to_numpy(dtype=float, na_value=np.nan)
+        amount = taxed["amount"].to_numpy(dtype=float, na_value=np.nan)
+        amount = np.where(is_inclusive, amount * rate / (1 + rate), amount * rate)
+        amount = amount * np.where(has_account_tax, -1.0, 1.0)
+        account = np.where(
+            has_account_tax == is_inclusive,
+            taxed["account"].to_numpy(dtype=object), taxed["contra"].to_numpy(dtype=object)
+        )
+        keep = (has_account_tax != has_contra_tax) & (amount != 0)
+
+        # Create a journal entry for the tax amount per tax account and contra account
+        base = pd.DataFrame({
+            "id": taxed["id"] + ":tax",
+            "date": taxed["date"],
+            "description": "TAX: " + taxed["description"],
+            "account": account,
+            "document": taxed["document"],
+            "currency": taxed["currency"],
+            "report_amount": np.nan,
+            "tax_code": taxed["tax_code"],
+            "profit_center": taxed["profit_center"],
+            "amount": amount,
+        })
+        legs = []
+        for leg, column, sign in [(0, "account", 1.0), (1, "contra", -1.0)]:
+            rows = keep & tax[column].notna().to_numpy(dtype=bool)
+            legs.append(base.loc[rows].assign(
+                contra=tax.loc[rows, column], amount=base.loc[rows, "amount"] * sign, leg=leg
+            ))
+        tax_journal_entries = (
+            pd.concat(legs).rename_axis("row").sort_values(["row", "leg"])
+            .drop(columns="leg").reset_index(drop=True)
+        )
 
         # Round amounts and remove balanced entries after rounding
         result = enforce_schema(pd.DataFrame(tax_journal_entries), JOURNAL_SCHEMA)
@@ -182,14 +192,416 @@ class StandaloneLedger(LedgerEngine):
     def serialized_ledger(self) -> pd.DataFrame:
         """Retrieves a DataFrame with all ledger transactions in long format.
 
+        After changes to journal entries, the previously completed journal is
+        patched with the changed transactions rather than rebuilt from scratch.
+        Only automated entries depending on the changes are regenerated, see
+        `_patch_complete_journal()`.
+
         Returns:
             pd.DataFrame: Combined DataFrame with ledger data.
         """
-        _, ledger = self.complete_journal(
+        ids, self._pending_journal_ids = self._pending_journal_ids, None
+        if ids and self._ledger_state is not None:
+            state = self._patch_complete_journal(*self._ledger_state, ids=ids)
+        else:
+            state = self._build_ledger_state()
+        state = (state[0], self._encode_profit_centers(state[1]))
+        self._ledger_state = state
+        self._ledger_built = time.time()
+        self._ledger_derived = None
+        # A rebuild after the cache expired may pick up changes made elsewhere
+        self.balance_cache.invalidate()
+        return state[1]
+
+    def _build_ledger_state(self) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """Complete the journal from scratch.
+
+        Storage backends may override this method to reuse previously persisted
+        results for unchanged accounting data.
+
+        Returns:
+            tuple[pd.DataFrame, pd.DataFrame]: The completed journal and the
+                ledger in long format, as returned by `complete_journal()`.
+        """
+        return self.complete_journal(
             journal=self.journal.list(), target_balances=self.target_balance.list(),
             revaluations=self.revaluations.list()
         )
-        return ledger
+
+    def _invalidate_ledger(self, ids: set | None = None):
+        """Discard the cached serialized ledger and all data derived from it.
+
+        Args:
+            ids (set, optional): Ids of changed entries. Ignored, as changes to
+                entities other than the journal require a full rebuild.
+        """
+        self._ledger_state = None
+        self._pending_journal_ids = None
+        self._ledger_derived = None
+        self._closing_snapshot = None
+        self.serialized_ledger.cache_clear()
+        self.balance_cache.invalidate()
+
+    def _invalidate_journal(self, ids: set | None = None):
+        """Mark journal entries as changed in the cached serialized ledger.
+
+        The changed transactions are patched into the ledger when it is next
+        retrieved. Without ids, the ledger is discarded entirely.
+
+        Args:
+            ids (set, optional): Ids of added, modified or deleted journal entries.
+        """
+        if ids is None or self._ledger_state is None:
+            self._invalidate_ledger()
+        else:
+            self._pending_journal_ids = (self._pending_journal_ids or set()) | set(ids)
+            self._ledger_derived = None
+            self.serialized_ledger.cache_clear()
+            self.balance_cache.invalidate()
+
+    def _patch_complete_journal(
+        self, complete_journal: pd.DataFrame, ledger: pd.DataFrame, ids: set
+    ) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """Update a completed journal and its ledger for changed journal entries.
+
+        Replaces entries of the changed transactions and their tax entries with
+        the sanitized current journal entries for these ids and recomputed tax
+        entries. Automated revaluation and target balance entries depend on
+        the ledger up to their date, see `_automated_entry_horizon()`. The
+        earliest date touched by the change marks the first rule depending on
+        it; automated entries before that rule's date are kept, and all later
+        automated entries are regenerated in chronological order.
+
+        Args:
+            complete_journal (pd.DataFrame): Completed journal as returned by
+                `complete_journal()`.
+            ledger (pd.DataFrame): Corresponding ledger in long format.
+            ids (set): Ids of the added, modified or deleted journal entries.
+
+        Returns:
+            tuple[pd.DataFrame, pd.DataFrame]: The patched journal and ledger.
+        """
+        journal = self.journal.list()
+        journal = journal.loc[journal["id"].isin(ids)]
+        ids = set(ids) | {f"{id}:tax" for id in ids}
+        removed = complete_journal["id"].isin(ids)
+
+        # Discard automated entries from the first rule depending on the change onwards
+        since = None
+        earliest = pd.concat([journal["date"], complete_journal.loc[removed, "date"]]).min()
+        if pd.notna(earliest):
+            rules = self._automated_entry_horizon()
+            since = rules.loc[rules["horizon"] >= earliest, "date"].min()
+            since = None if pd.isna(since) else since
+        if since is not None and self.closed_until is not None and since <= self.closed_until:
+            # Regenerated automated entries may alter balances of closed periods
+            self._closing_snapshot = None
+        if since is not None:
+            stale = (
+                complete_journal["origin"].isin(["revaluation", "target_balance"])
+                & (complete_journal["date"] >= since)
+            )
+            ids |= set(complete_journal.loc[stale, "id"])
+            removed |= stale
+
+        entries = [complete_journal.loc[~removed]]
+        ledger = [ledger.loc[~ledger["id"].isin(ids)]]
+        if not journal.empty:
+            journal = self.sanitize_journal(self.journal.standardize(journal))
+            tax_entries = self.tax_entries(journal)
+            ledger.append(self.serialize_ledger(pd.concat([journal, tax_entries])))
+            journal["origin"] = "journal"
+            tax_entries["origin"] = "tax"
+            entries += [journal, tax_entries]
+
+        ledger = [df for df in ledger if not df.empty] or ledger[:1]
+        ledger = pd.concat(ledger, ignore_index=True)
+        if since is not None:
+            ledger = ChunkedLedger(ledger)
+            entries += self._automated_entries(
+                ledger, revaluations=self.sanitized_revaluations(),
+                target_balances=self.sanitized_target_balance(), since=since,
+            )
+            ledger = ledger.to_frame()
+
+        entries = [df for df in entries if not df.empty] or entries[:1]
+        complete_journal = pd.concat(entries, ignore_index=True)
+        complete_journal = complete_journal.sort_values("date").reset_index(drop=True)
+        ledger = ledger.sort_values("date").reset_index(drop=True)
+        return complete_journal, ledger
+
+    def _automated_entry_horizon(self) -> pd.DataFrame:
+        """Booking date of each automated entry rule and the latest date of ledger
+        entries it depends on.
+
+        Revaluations depend on balances up to their booking date. Target balances
+        depend on balances up to their booking date or the end of their lookup
+        period, whichever is later, and on all entries if the lookup period is
+        open-ended.
+
+        Returns:
+            pd.DataFrame: One row per revaluation and target balance rule, with
+                columns 'date' and 'horizon'.
+        """
+        revaluations = self.revaluations.list()
+        target_balances = self.target_balance.list()
+
+        date = target_balances["date"]
+        spans = parse_date_spans(target_balances["lookup_period"], errors="coerce")
+        end = spans["end"]
+        target_horizon = (
+            end.where(end > date, date)
+            .where(end.notna(), pd.Timestamp.max)
+            # Invalid rules are discarded and do not depend on any entries
+            .where(spans["valid"], date)
+        )
+        dtype = revaluations["date"].dtype
+        return pd.DataFrame({
+            "date": pd.concat([revaluations["date"], date], ignore_index=True),
+            "horizon": pd.concat([
+                revaluations["date"], target_horizon.astype(dtype)
+            ], ignore_index=True),
+        })
+
+    # ----------------------------------------------------------------------
+    # Period closing
+
+    @property
+    def closed_until(self) -> pd.Timestamp | None:
+        """Last day of the closed periods, or None if no period is closed.
+
+        Journal entries, revaluations and target balances dated on or before
+        this date are read-only, as are prices and assets effective within
+        closed periods.
+        """
+        return self._closed_until
+
+    @closed_until.setter
+    def closed_until(self, date: datetime.date | None):
+        self._closed_until = None if date is None else pd.Timestamp(date)
+        self._closing_snapshot = None
+        self._ledger_derived = None
+
+    def close_period(self, period: datetime.date | str) -> pd.DataFrame:
+        """Close all periods up to the end of `period`.
+
+        Balances as of the end of the period are stored as a snapshot. Balance
+        queries that do not reach into closed periods start from this snapshot
+        and only consider ledger entries after it. Closed periods remain
+        available for historical queries, but entries dated within them can no
+        longer be added, modified or deleted.
+
+        Args:
+            period (datetime.date | str): Date or period to close, e.g. "2024"
+                to close the fiscal year 2024 and all prior periods.
+
+        Returns:
+            pd.DataFrame: The closing balances, see `closing_balances()`.
+
+        Raises:
+            ValueError: If the period is open-ended or ends before periods that
+                are already closed.
+        """
+        _, end = parse_date_span(period)
+        if end is None:
+            raise ValueError("Cannot close an open-ended period.")
+        end = pd.Timestamp(end)
+        if self.closed_until is not None and end < self.closed_until:
+            raise ValueError(
+                f"Periods up to {self.closed_until.date()} are already closed, "
+                "reopen them first."
+            )
+        self.closed_until = end
+        return self.closing_balances()
+
+    def reopen_period(self):
+        """Reopen all closed periods."""
+        if self.closed_until is not None:
+            self.closed_until = None
+
+    def closing_balances(self) -> pd.DataFrame:
+        """Balances carried forward from closed periods.
+
+        The snapshot is computed once per closing and kept across changes to
+        journal entries, as these can not affect closed periods.
+
+        Returns:
+            pd.DataFrame: One row per (account, currency, profit center) group
+                with ledger entries up to `closed_until`, with columns 'account',
+                'currency', 'profit_center', 'amount' and 'report_amount'. Empty
+                if no period is closed.
+        """
+        closed = self.closed_until
+        snapshot = self._closing_snapshot
+        if snapshot is None or snapshot[0] != closed:
+            ledger = self.serialized_ledger()
+            if closed is None:
+                ledger = ledger.iloc[:0]
+            else:
+                ledger = ledger.loc[ledger["date"] <= closed]
+            balances = (
+                ledger.groupby(
+                    BalanceIndex.GROUP_COLUMNS, dropna=False, sort=True, observed=True
+                )[["amount", "report_amount"]].sum().reset_index()
+            )
+            snapshot = (closed, balances)
+            self._closing_snapshot = snapshot
+        return snapshot[1].copy()
+
+    def _open_balance_index(self) -> BalanceIndex:
+        """Return a balance index over the closing balances, dated at the closing
+        date, and the ledger entries after it.
+
+        The index answers all balance queries that do not reach into closed
+        periods, i.e. with a period starting after the closing date or ending on
+        or after it without a start date. It is cached like `_balance_index()`.
+        """
+        def build():
+            closed = self.closed_until
+            ledger = self.serialized_ledger()
+            columns = BalanceIndex.GROUP_COLUMNS + ["date", "amount", "report_amount"]
+            return BalanceIndex(pd.concat([
+                self.closing_balances().assign(date=closed)[columns],
+                ledger.loc[ledger["date"] > closed, columns],
+            ], ignore_index=True))
+        return self._derived_from_ledger("open_balance_index", build)
+
+    def _check_open_period(self, df: pd.DataFrame):
+        """Reject changes to entries dated within closed periods.
+
+        Args:
+            df (pd.DataFrame): Entries to be added, modified or deleted, with a
+                'date' column.
+
+        Raises:
+            ValueError: If any entry is dated on or before `closed_until`.
+        """
+        closed = self.closed_until
+        if closed is None or df.empty:
+            return
+        dates = pd.to_datetime(df["date"])
+        if (dates <= closed).any():
+            raise ValueError(
+                f"Periods up to {closed.date()} are closed, cannot change entries dated "
+                f"{first_elements_as_str(sorted(set(dates[dates <= closed].dt.date)))}."
+            )
+
+    def _check_open_settings(self, df: pd.DataFrame):
+        """Reject changes to prices or assets effective within closed periods.
+
+        Prices and assets apply from their date onwards, or to all periods if
+        undated, and thereby affect amounts of closed periods unless dated after
+        `closed_until`.
+
+        Args:
+            df (pd.DataFrame): Entries to be added, modified or deleted, with a
+                'date' column.
+
+        Raises:
+            ValueError: If any entry is undated or dated on or before `closed_until`.
+        """
+        closed = self.closed_until
+        if closed is None or df.empty:
+            return
+        if pd.to_datetime(df["date"]).isna().any():
+            raise ValueError(
+                f"Periods up to {closed.date()} are closed, cannot change undated entries."
+            )
+        self._check_open_period(df)
+
+    def _balance_index(self, ledger: pd.DataFrame = None) -> BalanceIndex:
+        """Return a prefix-sum balance index over ledger entries.
+
+        The index over the serialized ledger is cached and rebuilt whenever
+        the `serialized_ledger()` cache is invalidated or expires. With the
+        Polars backend, ledger entries are aggregated in Polars.
+
+        Args:
+            ledger (pd.DataFrame, optional): Ledger entries to index. If None,
+                returns the cached index of `self.serialized_ledger()`.
+
+        Returns:
+            BalanceIndex: Index for balance lookups over the ledger entries.
+        """
+        if ledger is not None:
+            return BalanceIndex(ledger)
+
+        def build():
+            if self.backend == "polars":
+                return BalanceIndex(self._serialized_ledger_frame())
+            return BalanceIndex(self.serialized_ledger())
+        return self._derived_from_ledger("balance_index", build)
+
+    def _serialized_ledger_frame(self) -> pl.DataFrame:
+        """Return the serialized ledger as a Polars DataFrame, cached alongside
+        `serialized_ledger()`.
+
+        The frame is converted once per rebuild from the cached ledger state,
+        skipping the copy `serialized_ledger()` returns to its callers.
+        """
+        def build():
+            self._refresh_ledger()
+            return pl.from_pandas(self._ledger_state[1])
+        return self._derived_from_ledger("frame", build)
+
+    def _refresh_ledger(self):
+        """Rebuild the serialized ledger if it was invalidated or its cache expired,
+        ahead of balance cache lookups or direct use of the cached ledger state.
+        The rebuild bumps the balance cache version, so that cached balances never
+        outlive the ledger they were computed from and results of the first lookup
+        after a rebuild are kept."""
+        if (
+            self._ledger_state is None or self._pending_journal_ids
+            or self._ledger_built is None or time.time() - self._ledger_built > 120
+        ):
+            self.serialized_ledger()
+
+    def _derived_from_ledger(self, key: str, build: Callable[[], Any]) -> Any:
+        """Return data derived from the serialized ledger.
+
+        Derived data is cached until the serialized ledger is invalidated or
+        for at most 120 seconds, the lifetime of the `serialized_ledger()` cache.
+
+        Args:
+            key (str): Name of the derived data.
+            build (Callable[[], Any]): Function computing the derived data.
+
+        Returns:
+            Any: The cached or newly computed derived data.
+        """
+        cached = (self._ledger_derived or {}).get(key)
+        if cached is not None and time.time() - cached[0] <= 120:
+            return cached[1]
+        # Building may refresh the serialized ledger and thereby reset derived data
+        value = build()
+        self._ledger_derived = (self._ledger_derived or {}) | {key: (time.time(), value)}
+        return value
+
+    def _opening_balance(
+        self, ledger: pd.DataFrame, filter: pd.Series, account: int | list[int],
+        start: datetime.date, profit_centers: list[str] | None = None
+    ) -> tuple[float, float]:
+        """Look up the balance carried forward into an account history in the
+        balance index, rather than summing up all prior ledger entries."""
+        closed = self.closed_until
+        if closed is not None and pd.Timestamp(start) > closed:
+            index = self._open_balance_index()
+        else:
+            index = self._balance_index()
+        accounts = account if isinstance(account, list) else [account]
+        groups = index.groups["account"].isin(accounts)
+        if profit_centers is not None:
+            groups = groups & self._profit_center_mask(
+                index.groups["profit_center"], profit_centers
+            )
+        groups = np.flatnonzero(groups.to_numpy(dtype=bool))
+        end = pd.Timestamp(start) - pd.Timedelta(days=1)
+        amount, report_amount, _ = index.balances(
+            groups,
+            start=np.full(len(groups), np.datetime64("NaT"), dtype="datetime64[ns]"),
+            end=np.full(len(groups), end.to_datetime64(), dtype="datetime64[ns]"),
+        )
+        return amount.sum(), report_amount.sum()
 
     def complete_journal(
         self, journal: pd.DataFrame, target_balances: pd.DataFrame, revaluations: pd.DataFrame
@@ -201,7 +613,9 @@ class StandaloneLedger(LedgerEngine):
         target-balance definitions, and revaluation instructions. Tax entries
         are first generated and applied to the journal. Then, revaluation and
         target balance entries are automatically and recursively generated and
-        inserted in chronological order.
+        inserted in chronological order. Ledger entries of automated entries are
+        appended to a `ChunkedLedger`, which is combined into a single DataFrame
+        only once all entries are generated.
 
         Args:
             journal (pd.DataFrame): The raw journal entries.
@@ -226,16 +640,48 @@ class StandaloneLedger(LedgerEngine):
 
         # Convert journal to ledger: Split `account`/`contra` into two ledger rows
         initial_journal = pd.concat([journal, tax_entries], ignore_index=True)
-        ledger = self.serialize_ledger(initial_journal)
+        ledger = ChunkedLedger(self.serialize_ledger(initial_journal))
 
         # Collect all journal entries
         journal["origin"] = "journal"
         tax_entries["origin"] = "tax"
         all_entries = [journal, tax_entries]
+        all_entries += self._automated_entries(
+            ledger, revaluations=revaluations, target_balances=target_balances
+        )
+
+        # Combine all journal entries and sort by date
+        complete_journal = pd.concat(all_entries, ignore_index=True)
+        complete_journal = complete_journal.sort_values("date").reset_index(drop=True)
+        ledger = ledger.to_frame().sort_values("date").reset_index(drop=True)
+        return complete_journal, ledger
+
+    def _automated_entries(
+        self, ledger: ChunkedLedger, revaluations: pd.DataFrame,
+        target_balances: pd.DataFrame, since: datetime.date | None = None
+    ) -> list[pd.DataFrame]:
+        """Recursively generate automated journal entries in chronological order.
+
+        For each booking date, revaluation entries are computed first and target
+        balance entries second. Generated entries are appended to `ledger`, so
+        that they are reflected in the balances of subsequent dates.
 
-        # Recursively generate automated journal entries in chronological order
+        Args:
+            ledger (ChunkedLedger): Ledger entries up to the first processed date,
+                extended in place.
+            revaluations (pd.DataFrame): Sanitized revaluation rules.
+            target_balances (pd.DataFrame): Sanitized target balance rules.
+            since (datetime.date, optional): Only process rules booked on or after
+                this date. Defaults to None, processing all rules.
+
+        Returns:
+            list[pd.DataFrame]: Generated journal entries with an 'origin' column.
+        """
+        entries = []
         dates = pd.concat([revaluations["date"], target_balances["date"]])
         dates = dates.dropna().drop_duplicates().sort_values()
+        if since is not None:
+            dates = dates.loc[dates >= pd.Timestamp(since)]
         for date in dates:
             # Compute revaluations entries first
             mask = revaluations["date"] == date
@@ -245,11 +691,8 @@ class StandaloneLedger(LedgerEngine):
                 )
                 if not reval_journal.empty:
                     reval_journal["origin"] = "revaluation"
-                    all_entries.append(reval_journal)
-                    ledger = pd.concat(
-                        [ledger, self.serialize_ledger(reval_journal)],
-                        ignore_index=True
-                    )
+                    entries.append(reval_journal)
+                    ledger.append(self.serialize_ledger(reval_journal))
 
             # Calculate target balance entries second
             mask = target_balances["date"] == date
@@ -259,20 +702,12 @@ class StandaloneLedger(LedgerEngine):
                 )
                 if not target_journal.empty:
                     target_journal["origin"] = "target_balance"
-                    all_entries.append(target_journal)
-                    ledger = pd.concat(
-                        [ledger, self.serialize_ledger(target_journal)],
-                        ignore_index=True
-                    )
-
-        # Combine all journal entries and sort by date
-        complete_journal = pd.concat(all_entries, ignore_index=True)
-        complete_journal = complete_journal.sort_values("date").reset_index(drop=True)
-        ledger = ledger.sort_values("date").reset_index(drop=True)
-        return complete_journal, ledger
+                    entries.append(target_journal)
+                    ledger.append(self.serialize_ledger(target_journal))
+        return entries
 
     def _target_balance_entries(
-        self, ledger: pd.DataFrame, target_balance: pd.DataFrame
+        self, ledger: pd.DataFrame | ChunkedLedger, target_balance: pd.DataFrame
     ) -> pd.DataFrame:
         """
         Generate automated journal entries based on target balance specifications.
@@ -283,15 +718,18 @@ class StandaloneLedger(LedgerEngine):
         ensuring consistency across periods.
 
         All rules are processed in ascending order of their booking dates, as each
-        generated entry may influence the balances of subsequent rules. For each rule,
-        the method computes the current balance based on the specified lookup filters
-        (e.g., account ranges, periods, profit centers). If the balance differs from
-        the target, it creates journal entries that adjust the specified account to the
-        desired value—typically zero—offsetting the difference to a designated
+        generated entry may influence the balances of subsequent rules. Rules passed
+        together, such as all rules sharing a booking date in `complete_journal()`,
+        are evaluated against the same ledger in one batch: Current balances are
+        computed by a single `account_balances()` call based on the specified lookup
+        filters (e.g., account ranges, periods, profit centers), and deltas are
+        rounded and converted to the reporting currency as vectors. If the balance
+        differs from the target, a journal entry adjusts the specified account to
+        the desired value—typically zero—offsetting the difference to a designated
         contra account.
 
         Args:
-            ledger (pd.DataFrame): The existing ledger with JOURNAL_SCHEMA.
+            ledger (pd.DataFrame | ChunkedLedger): The existing ledger with JOURNAL_SCHEMA.
             target_balance (pd.DataFrame): A DataFrame defining target balance rules,
                 with TARGET_BALANCE_SCHEMA.
 
@@ -299,48 +737,61 @@ class StandaloneLedger(LedgerEngine):
             pd.DataFrame: A DataFrame of generated journal entries that enforce
                 the target balances.
         """
-
-        result = []
         reporting_currency = self.reporting_currency
+        target_balance = target_balance.reset_index(drop=True)
+        n = len(target_balance)
+        if n == 0:
+            return self.journal.standardize(pd.DataFrame())
+
+        # Look up current balances of all rules in one batch
+        queries = pd.DataFrame({
+            "account": target_balance["lookup_accounts"],
+            "period": target_balance["lookup_period"].astype("object"),
+            "profit_center": target_balance["lookup_profit_centers"].astype("object"),
+        })
+        balances = self.account_balances(queries, output="long", ledger=ledger)
+        current_balance = (
+            pd.DataFrame({"query": np.arange(n), "currency": target_balance["currency"]})
+            .merge(balances, on=["query", "currency"], how="left")
+            .sort_values("query")["balance"]
+            .to_numpy(dtype=float, na_value=np.nan)
+        )
+        current_balance = np.where(np.isnan(current_balance), 0.0, current_balance)
 
-        for idx, row in enumerate(target_balance.to_dict("records")):
-            balance = self._account_balance(
-                ledger=ledger, account=row["lookup_accounts"],
-                period=row["lookup_period"], profit_centers=row["lookup_profit_centers"]
-            )
-            current_balance = balance.get(row["currency"], 0.0)
-            currency = (
-                reporting_currency if row["currency"] == "reporting_currency" else row["currency"]
-            )
-            delta = row["balance"] - current_balance
-            delta = self.round_to_precision(delta, ticker=currency, date=row["date"])
-            report_delta = self.report_amount(
-                amount=[delta], currency=[currency], date=[row["date"]]
-            )[0]
-
-            if delta == 0 and report_delta == 0:
-                continue
-
-            base_entry = {
-                "id": f"target_balance:{row['date']}:{idx}",
-                "date": row["date"],
-                "currency": currency,
-                "description": row["description"],
-                "document": row["document"],
-                "profit_center": row["profit_center"],
-            }
-            result.append({
-                **base_entry,
-                "account": row["account"],
-                "contra": row["contra"],
-                "amount": -report_delta,
-                "report_amount": -report_delta,
-            })
-
-        return self.journal.standardize(pd.DataFrame(result))
+        # Round deltas and convert them to the reporting currency at each booking date
+        currency = target_balance["currency"].where(
+            target_balance["currency"] != "reporting_currency", reporting_currency
+        )
+        dates = target_balance["date"]
+        delta = self._round_to_increment(
+            target_balance["balance"].to_numpy(dtype=float, na_value=np.nan) - current_balance,
+            self.precision_vectorized(currency, dates, allow_missing=True).to_numpy(),
+        )
+        rate = self.price_vectorized(currency, dates, currency=reporting_currency).to_numpy()
+        report_delta = self._round_to_increment(
+            delta * rate,
+            self.precision_vectorized(
+                [reporting_currency] * n, dates, allow_missing=True
+            ).to_numpy(),
+        )
+
+        result = pd.DataFrame({
+            "id": [f"target_balance:{date}:{idx}" for idx, date in enumerate(dates)],
+            "date": dates,
+            "currency": currency,
+            "description": target_balance["description"],
+            "document": target_balance["document"],
+            "profit_center": target_balance["profit_center"],
+            "account": target_balance["account"],
+            "contra": target_balance["contra"],
+            "amount": -report_delta,
+            "report_amount": -report_delta,
+        })
+        result = result.loc[~((delta == 0) & (report_delta == 0))]
+        return self.journal.standardize(result.reset_index(drop=True))
 
     def _revaluation_entries(
-        self, ledger: pd.DataFrame, revaluations: pd.DataFrame
+        self, ledger: pd.DataFrame | ChunkedLedger, revaluations: pd.DataFrame
     ) -> pd.DataFrame:
         """
         Compute journal entries for currency (or other) revaluations.
@@ -359,7 +810,8 @@ class StandaloneLedger(LedgerEngine):
         separately for each defined profit center and assigned accordingly.
 
         Args:
-            ledger (pd.DataFrame): The current ledger in serialized format (long form).
+            ledger (pd.DataFrame | ChunkedLedger): The current ledger in serialized
+                format (long form).
             revaluations (pd.DataFrame): A DataFrame with revaluation instructions following
                 the `REVALUATION_SCHEMA` format.
 
@@ -389,10 +841,9 @@ class StandaloneLedger(LedgerEngine):
             expanded.rename(columns={"date": "period"}), ledger=ledger
         )
         df = pd.concat([expanded, balances.reset_index(drop=True)], axis=1)
-        df["fx_rate"] = [
-            self.price(currency, date=date, currency=reporting_currency)[1]
-            for currency, date in zip(df["currency"], df["date"])
-        ]
+        df["fx_rate"] = self.price_vectorized(
+            df["currency"], df["date"], currency=reporting_currency
+        ).to_numpy()
         df["account_currency_balance"] = [
             balance.get(currency, 0) for balance, currency in zip(df["balance"], df["currency"])
         ]
@@ -456,14 +907,14 @@ class StandaloneLedger(LedgerEngine):
         return pd.concat([no_profit_center, by_profit_center], ignore_index=True)
 
     def _account_balance(
-        self, account: str | int | dict | list, ledger: pd.DataFrame = None,
+        self, account: str | int | dict | list, ledger: pd.DataFrame | ChunkedLedger = None,
         profit_centers: list[str] | str = None, period: datetime.date | str = None,
     ) -> dict:
         """Compute the balance of one or more accounts from the serialized ledger.
 
         Args:
-            ledger (pd.DataFrame, optional): Ledger entries to compute balance from.
-                If None, defaults to the result of `self.serialized_ledger()`.
+            ledger (pd.DataFrame | ChunkedLedger, optional): Ledger entries to compute
+                balance from. If None, defaults to the result of `self.serialized_ledger()`.
             account (int, str, dict): The account(s) to be evaluated. Can be a
                 a single account, e.g. 1020, a sequence of accounts separated
                 by a column, e.g. "1000:1999", in which case the combined
@@ -491,32 +942,30 @@ class StandaloneLedger(LedgerEngine):
         if ledger is None:
             ledger = self.serialized_ledger()
 
-        multipliers = self.account_multipliers(self.account_range(account, mode="parts"))
-        multipliers = pd.DataFrame(list(multipliers.items()), columns=["account", "multiplier"])
-        rows = ledger["account"].isin(multipliers["account"])
-
-        if profit_centers is not None and profit_centers is not pd.NA:
-            profit_centers = self.parse_profit_centers(profit_centers)
-            valid_profit_centers = set(self.profit_centers.list()["profit_center"])
-            invalid_profit_centers = set(profit_centers) - valid_profit_centers
-            if invalid_profit_centers:
-                raise ValueError(
-                    f"Profit centers: {', '.join(invalid_profit_centers)} do not exist."
-                )
-            rows = rows & (ledger["profit_center"].isin(profit_centers))
+        selector = self.account_selector(account)
         start, end = parse_date_span(period)
-        if start is not None:
-            rows = rows & (ledger["date"] >= pd.Timestamp(start))
-        if end is not None:
-            rows = rows & (ledger["date"] <= pd.Timestamp(end))
+        if isinstance(ledger, ChunkedLedger):
+            # Group balances over the period, starting from the closest checkpoint
+            ledger = ledger.balances(start, end)
+            rows = selector.mask(ledger["account"])
+        else:
+            rows = selector.mask(ledger["account"])
+            if start is not None:
+                rows = rows & (ledger["date"] >= pd.Timestamp(start)).to_numpy(dtype=bool)
+            if end is not None:
+                rows = rows & (ledger["date"] <= pd.Timestamp(end)).to_numpy(dtype=bool)
+        profit_center_mask = self._profit_center_mask(ledger["profit_center"], profit_centers)
+        if profit_center_mask is not None:
+            rows = rows & profit_center_mask
 
         if rows.sum() == 0:
             return {"reporting_currency": 0.0}
 
         sub = ledger.loc[rows, ["account", "amount", "report_amount", "currency"]]
-        sub = sub.merge(multipliers, on="account", how="inner")
-        sub["amount"] *= sub["multiplier"]
-        sub["report_amount"] *= sub["multiplier"]
+
+        multiplier = selector.multiplier(sub["account"])
+        sub["amount"] *= multiplier
+        sub["report_amount"] *= multiplier
         grouped = sub.groupby("currency", sort=False)["amount"].sum().reset_index()
         rounded_amounts = dict(zip(
             grouped["currency"],
@@ -531,6 +980,284 @@ class StandaloneLedger(LedgerEngine):
             **rounded_amounts
         }
 
+    def account_balances(
+        self, df: pd.DataFrame, reporting_currency_only: bool = False,
+        output: Literal["dict", "long"] = "dict", ledger: pd.DataFrame | ChunkedLedger = None
+    ) -> pd.DataFrame:
+        """Calculate account balances for a batch of queries in a single vectorized pass.
+
+        Overrides the row-by-row evaluation of `LedgerEngine.account_balances()`.
+        Distinct account ranges, periods, and profit center filters are resolved
+        once, and all queries are evaluated with vectorized joins against the
+        prefix-sum `BalanceIndex` of the ledger, so that each balance takes two
+        binary searches per account, currency and profit center. Results are
+        identical to calling `_account_balance()` for each row, which remains the
+        reference implementation.
+
+        Queries against the serialized ledger are answered from `balance_cache`
+        where possible; only queries not evaluated since the last ledger change
+        are computed.
+
+        Args:
+            df (pd.DataFrame): Balance queries with columns 'account', 'period' and
+                optionally 'profit_center'. See `LedgerEngine.account_balances()`.
+            reporting_currency_only (bool, optional): If True, omits the `balance`
+                column and includes only the `report_balance` column. Defaults to False.
+            output (Literal["dict", "long"]): Return type. Defaults to "dict".
+            ledger (pd.DataFrame | ChunkedLedger, optional): Ledger entries to compute
+                balances from. If None, defaults to the result of `self.serialized_ledger()`.
+
+        Returns:
+            pd.DataFrame: With `output="dict"`, a DataFrame of the same length as `df` with
+                columns 'report_balance' and 'balance' (unless `reporting_currency_only`).
+                With `output="long"`, a DataFrame with `BALANCE_LONG_SCHEMA`, see
+                `LedgerEngine.account_balances()`. The dict form is derived from the
+                long form.
+        """
+        self._validate_balance_output(output)
+        n = len(df)
+        if ledger is None:
+            self._refresh_ledger()
+            keys = self._balance_query_keys(df)
+            long = self.balance_cache.lookup(
+                keys, lambda positions: self._evaluate_balance_queries(df.iloc[positions])
+            )
+            if reporting_currency_only and output == "long":
+                long = long.loc[long["currency"] == "reporting_currency"]
+            long = enforce_schema(long.reset_index(drop=True), BALANCE_LONG_SCHEMA)
+        else:
+            long = self._evaluate_balance_queries(
+                df, ledger=ledger,
+                reporting_currency_only=reporting_currency_only and output == "long",
+            )
+        if output == "long":
+            return long
+        return self._long_to_balances(long, n, reporting_currency_only=reporting_currency_only)
+
+    def _evaluate_balance_queries(
+        self, df: pd.DataFrame, ledger: pd.DataFrame | ChunkedLedger = None,
+        reporting_currency_only: bool = False, index: BalanceIndex = None
+    ) -> pd.DataFrame:
+        """Evaluate a batch of balance queries against the balance index.
+
+        Without explicit ledger, queries that do not reach into closed periods
+        are answered from the closing balances, see `_open_balance_index()`.
+
+        Args:
+            df (pd.DataFrame): Balance queries, see `account_balances()`.
+            ledger (pd.DataFrame | ChunkedLedger, optional): Ledger entries to compute
+                balances from. If None, defaults to the result of `self.serialized_ledger()`.
+            reporting_currency_only (bool, optional): If True, returns only balances
+                in the reporting currency. Defaults to False.
+            index (BalanceIndex, optional): Index to evaluate queries against.
+                Defaults to the index over `ledger`.
+
+        Returns:
+            pd.DataFrame: Balances with `BALANCE_LONG_SCHEMA`, sorted by query.
+        """
+        if isinstance(ledger, ChunkedLedger):
+            # Index the group balances over each distinct period, dated at its end
+            codes, periods = self._factorize_specs(df["period"])
+            parts = []
+            for code, period in enumerate(periods):
+                positions = np.flatnonzero(codes == code)
+                start, end = parse_date_span(period)
+                balances = ledger.balances(start, end).assign(
+                    date=pd.Timestamp(end or start or datetime.date.today())
+                )
+                long = self._evaluate_balance_queries(
+                    df.iloc[positions], ledger=balances,
+                    reporting_currency_only=reporting_currency_only,
+                )
+                parts.append(long.assign(query=positions[long["query"].to_numpy()]))
+            long = pd.concat(parts, ignore_index=True).sort_values("query", kind="stable")
+            return enforce_schema(long.reset_index(drop=True), BALANCE_LONG_SCHEMA)
+
+        closed = self.closed_until
+        if ledger is None and index is None and closed is not None and len(df) > 0:
+            # Evaluate queries not reaching into closed periods from the closing balances
+            codes, periods = self._factorize_specs(df["period"])
+            spans = [parse_date_span(period) for period in periods]
+            recent = np.array([
+                (start is None or pd.Timestamp(start) > closed)
+                and (end is None or pd.Timestamp(end) >= closed)
+                for start, end in spans
+            ], dtype=bool)[codes]
+            parts = []
+            for mask, build in [
+                (recent, self._open_balance_index), (~recent, self._balance_index)
+            ]:
+                positions = np.flatnonzero(mask)
+                if len(positions) > 0:
+                    long = self._evaluate_balance_queries(
+                        df.iloc[positions], index=build(),
+                        reporting_currency_only=reporting_currency_only,
+                    )
+                    parts.append(long.assign(query=positions[long["query"].to_numpy()]))
+            long = pd.concat(parts, ignore_index=True).sort_values("query", kind="stable")
+            return enforce_schema(long.reset_index(drop=True), BALANCE_LONG_SCHEMA)
+
+        n = len(df)
+        report = pd.DataFrame({
+            "query": np.arange(n), "currency": "reporting_currency", "balance": 0.0
+        })
+        parts = [report]
+        if n > 0:
+            if index is None:
+                index = self._balance_index(ledger)
+            if "profit_center" in df.columns:
+                profit_centers = df["profit_center"]
+            else:
+                profit_centers = [pd.NA] * n
+
+            # Resolve each distinct query specification only once
+            account_codes, account_specs = self._factorize_specs(df["account"])
+            period_codes, period_specs = self._factorize_specs(df["period"])
+            center_codes, center_specs = self._factorize_specs(profit_centers)
+            multipliers = pd.concat([
+                pd.DataFrame({
+                    "spec": code, "account": selector.accounts,
+                    "multiplier": selector.multiplier(selector.accounts)
+                })
+                for code, selector in enumerate(
+                    self.account_selector(spec) for spec in account_specs
+                )
+            ], ignore_index=True)
+            spans = parse_date_spans(pd.Series(period_specs, dtype="object"))
+            starts = spans["start"].to_numpy()
+            ends = spans["end"].to_numpy()
+            today = datetime.date.today()
+            round_dates = [today if pd.isna(end) else end.date() for end in spans["end"]]
+            center_filters = [self._resolve_profit_centers(spec) for spec in center_specs]
+
+            # Join queries with the (account, currency, profit center) groups of the index
+            groups = index.groups.assign(group=np.arange(len(index.groups)))
+            queries = pd.DataFrame({"query": np.arange(n), "spec": account_codes})
+            merged = queries.merge(multipliers, on="spec").merge(groups, on="account")
+
+            # Apply profit center filters
+            query = merged["query"].to_numpy()
+            center_code = center_codes[query]
+            keep = np.ones(len(merged), dtype=bool)
+            for code, (spec, resolved) in enumerate(zip(center_specs, center_filters)):
+                if resolved is not None:
+                    in_centers = self._profit_center_mask(merged["profit_center"], spec)
+                    keep &= (center_code != code) | in_centers
+            merged = merged.loc[keep]
+            query = query[keep]
+
+            # Look up balances over each query's period and sum up per query and currency
+            amount, report_amount, count = index.balances(
+                merged["group"].to_numpy(),
+                start=starts[period_codes[query]], end=ends[period_codes[query]],
+            )
+            multiplier = merged["multiplier"].to_numpy(dtype=float)
+            totals = pd.DataFrame({
+                "query": query,
+                "currency": merged["currency"].to_numpy(),
+                "amount": amount * multiplier,
+                "report_amount": report_amount * multiplier,
+            }).loc[count > 0]
+            by_query = totals.groupby("query", sort=False)["report_amount"].sum()
+            by_currency = (
+                totals.groupby(["query", "currency"], sort=False)["amount"].sum().reset_index()
+            )
+
+            # Round to the precision applicable at the end of each query's period
+            report_balances = self._round_to_increment(
+                by_query.to_numpy(),
+                self.precision_vectorized(
+                    [self.reporting_currency] * len(by_query),
+                    [round_dates[period_codes[q]] for q in by_query.index],
+                    allow_missing=True,
+                ).to_numpy(),
+            )
+            currency_balances = self._round_to_increment(
+                by_currency["amount"].to_numpy(),
+                self.precision_vectorized(
+                    by_currency["currency"].tolist(),
+                    [round_dates[period_codes[q]] for q in by_currency["query"]],
+                    allow_missing=True,
+                ).to_numpy(),
+            )
+            report.loc[by_query.index.to_numpy(), "balance"] = report_balances
+            if not reporting_currency_only:
+                parts.append(by_currency.assign(balance=currency_balances).drop(columns="amount"))
+
+        long = pd.concat(parts, ignore_index=True).sort_values("query", kind="stable")
+        return enforce_schema(long.reset_index(drop=True), BALANCE_LONG_SCHEMA)
+
+    def _balance_query_keys(self, df: pd.DataFrame) -> list[tuple]:
+        """Normalize balance queries into hashable `balance_cache` keys.
+
+        Periods are resolved to their date span and profit center filters to the
+        set of profit centers they select, so that equivalent queries share a key.
+        Spans of open-ended periods are resolved against today's date, which is
+        therefore part of their key.
+
+        Args:
+            df (pd.DataFrame): Balance queries, see `account_balances()`.
+
+        Returns:
+            list[tuple]: One (account, span, profit centers) key per query.
+        """
+        def center_key(spec):
+            try:
+                resolved = self._resolve_profit_centers(spec)
+            except Exception:
+                # Unresolvable filters raise when the query is evaluated
+                return repr(spec)
+            return None if resolved is None else frozenset(resolved[0])
+
+        n = len(df)
+        profit_centers = df["profit_center"] if "profit_center" in df.columns else [None] * n
+        period_codes, period_specs = self._factorize_specs(df["period"])
+        today = datetime.date.today()
+        spans = [
+            span if span[1] is not None else (*span, today)
+            for span in (
+                parse_date_span(None if pd.api.types.is_scalar(p) and pd.isna(p) else p)
+                for p in period_specs
+            )
+        ]
+        center_codes, center_specs = self._factorize_specs(profit_centers)
+        centers = [center_key(spec) for spec in center_specs]
+        return [
+            (account if isinstance(account, (str, int)) else repr(account),
+             spans[period_code], centers[center_code])
+            for account, period_code, center_code in zip(df["account"], period_codes, center_codes)
+        ]
+
+    @property
+    def balance_cache(self) -> BalanceCache:
+        """Cache of balance query results shared by all `account_balances()` callers,
+        such as `reconcile()` and `report_table()`.
+
+        Cached results are discarded whenever the serialized ledger is
+        invalidated by a change to any ledger entity or rebuilt after its cache
+        expired. Queries against an explicitly passed ledger bypass the cache.
+        """
+        if self._balance_cache is None:
+            self._balance_cache = BalanceCache()
+        return self._balance_cache
+
+    @staticmethod
+    def _factorize_specs(values) -> tuple[np.ndarray, list]:
+        """Encode query specifications, which may be unhashable, as integer codes.
+
+        Returns:
+            tuple[np.ndarray, list]: Integer code for each value and the list of
+                distinct values in order of first appearance.
+        """
+        codes, index, uniques = [], {}, []
+        for value in values:
+            key = repr(value)
+            if key not in index:
+                index[key] = len(uniques)
+                uniques.append(value)
+            codes.append(index[key])
+        return np.array(codes, dtype=int), uniques
+
     # ----------------------------------------------------------------------
     # Target Balance
 
@@ -559,107 +1286,99 @@ class StandaloneLedger(LedgerEngine):
         """
 
         df = enforce_schema(df, TARGET_BALANCE_SCHEMA, keep_extra_columns=True)
+        frame = self._target_balance_validation_frame(df)
+        result = validate(
+            frame, self._target_balance_rules(), id_columns=["id"], logger=self._logger,
+            by_id=True, disabled=self.disabled_validation_rules,
+        )
+        self._validation_results = (self._validation_results or {}) | {"target_balance": result}
 
-        invalid_ids = set()
-        invalid_ids = self._invalid_balance(df, invalid_ids)
-        invalid_ids = self._invalid_lookup_period(df, invalid_ids)
-        invalid_ids = self._invalid_accounts_range(df, invalid_ids)
-        invalid_ids = self._invalid_lookup_profit_centers(df, invalid_ids)
-        invalid_ids = self._invalid_accounts(df, invalid_ids)
-        precision = self.precision_vectorized(df["currency"], dates=df["date"], allow_missing=True)
-        invalid_ids = self._invalid_assets(df, invalid_ids, precision)
-        # TODO: validate currency and price including possible "reporting_currency" value
-        invalid_ids = self._invalid_profit_centers(df, invalid_ids)
-
-        return df.query("id not in @invalid_ids").reset_index(drop=True)
-
-    def _invalid_balance(self, df: pd.DataFrame, invalid_ids: set) -> set:
-        """Mark target balance entries with missing balance values."""
-        invalid_mask = df["balance"].isna()
-        missing_ids = set(df.loc[invalid_mask, "id"]) - invalid_ids
-
-        if missing_ids:
-            self._logger.warning(
-                f"Discarding {len(missing_ids)} target balance entries with missing 'balance': "
-                f"{first_elements_as_str(missing_ids)}"
-            )
-            invalid_ids = invalid_ids.union(missing_ids)
-
-        return invalid_ids
-
-    def _invalid_lookup_period(self, df: pd.DataFrame, invalid_ids: set) -> set:
-        """Mark target balance entries with invalid 'lookup_period' values."""
-
-        def is_invalid(span: str) -> bool:
-            if pd.isna(span):
-                return True
-            try:
-                parse_date_span(span)
-                return False
-            except Exception:
-                return True
+        return df.loc[~result.discard].reset_index(drop=True)
 
-        invalid_mask = df["lookup_period"].apply(is_invalid).astype(bool)
-        new_ids = set(df.loc[invalid_mask, "id"]) - invalid_ids
+    def sanitized_target_balance(self) -> pd.DataFrame:
+        """Sanitized target balances, see `sanitize_target_balance()`.
 
-        if new_ids:
-            self._logger.warning(
-                f"Discarding {len(new_ids)} entries with invalid 'lookup_period': "
-                f"{first_elements_as_str(new_ids)}"
-            )
-            invalid_ids = invalid_ids.union(new_ids)
+        The result is memoized until target balances or the settings they are
+        validated against change, so that warnings are logged once per change.
+        """
+        return self._memoized(
+            "target_balance",
+            [
+                "target_balance", "accounts", "tax_codes", "assets", "price_history",
+                "profit_centers",
+            ],
+            lambda: self.sanitize_target_balance(self.target_balance.list()),
+        )
 
-        return invalid_ids
+    def _target_balance_validation_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Join target balance entries with the reference data of the validation
+        rules: the columns of `_journal_validation_frame()` without prices, and
+        '_lookup_period_valid'."""
+        frame = self._journal_validation_frame(df, prices=False)
+        spans = parse_date_spans(df["lookup_period"], errors="coerce")
+        frame["_lookup_period_valid"] = spans["valid"] & df["lookup_period"].notna()
+        return frame
+
+    def _target_balance_rules(self) -> list[ValidationRule]:
+        """Validation rules of `sanitize_target_balance()`, in order of application."""
+        # TODO: validate currency and price including possible "reporting_currency" value
+        return [
+            ValidationRule(
+                "balance", lambda df: df["balance"].isna().to_numpy(dtype=bool),
+                "Discarding %d target balance entries with missing 'balance': %s",
+            ),
+            ValidationRule(
+                "lookup_period", lambda df: ~df["_lookup_period_valid"].to_numpy(dtype=bool),
+                "Discarding %d entries with invalid 'lookup_period': %s",
+            ),
+            ValidationRule(
+                "lookup_accounts", self._invalid_accounts_range,
+                "Discarding %d entries with unresolvable 'lookup_accounts': %s",
+            ),
+            ValidationRule(
+                "lookup_profit_centers", self._invalid_lookup_profit_centers,
+                "Discarding %d entries with `unresolvable profit centers`: %s",
+            ),
+            ValidationRule(
+                "undefined_lookup_profit_centers", self._undefined_lookup_profit_centers,
+                "Discarding %d entries with `assigned to a profit center, "
+                "while no profit centers are defined`: %s",
+            ),
+            *self._account_rules(),
+            *self._profit_center_rules(),
+        ]
 
-    def _invalid_accounts_range(self, df: pd.DataFrame, invalid_ids: set) -> set:
+    def _invalid_accounts_range(self, df: pd.DataFrame) -> np.ndarray:
         """Mark target balance entries with unresolvable 'lookup_accounts' values."""
 
         def is_invalid(val: str) -> bool:
-            if pd.isna(val):
-                return True
             try:
                 accounts = self.account_range(val, mode="parts")
                 return (len(accounts["add"]) == 0) and (len(accounts["subtract"]) == 0)
             except Exception:
                 return True
 
-        mask = df["lookup_accounts"].apply(is_invalid).astype(bool)
-        new_ids = set(df.loc[mask, "id"]) - invalid_ids
-
-        if new_ids:
-            self._logger.warning(
-                f"Discarding {len(new_ids)} entries with unresolvable 'lookup_accounts': "
-                f"{first_elements_as_str(new_ids)}"
-            )
-            invalid_ids = invalid_ids.union(new_ids)
+        lookup_accounts = df["lookup_accounts"]
+        invalid = {val: is_invalid(val) for val in lookup_accounts.dropna().unique()}
+        return lookup_accounts.map(invalid).fillna(True).to_numpy(dtype=bool)
 
-        return invalid_ids
-
-    def _invalid_lookup_profit_centers(self, df: pd.DataFrame, invalid_ids: set) -> set:
+    def _invalid_lookup_profit_centers(self, df: pd.DataFrame) -> np.ndarray:
         """Mark target balance entries with unresolvable 'lookup_profit_centers' values."""
-
         valid_profit_centers = set(self.profit_centers.list()["profit_center"])
-
         if not valid_profit_centers:
-            mask = df["lookup_profit_centers"].notna()
-            reason = "assigned to a profit center, while no profit centers are defined"
-        else:
-            mask = (
-                df["lookup_profit_centers"].notna()
-                & ~df["lookup_profit_centers"].isin(valid_profit_centers)
-            )
-            reason = "unresolvable profit centers"
-
-        new_ids = set(df.loc[mask, "id"]) - invalid_ids
-
-        if new_ids:
-            self._logger.warning(
-                f"Discarding {len(new_ids)} entries with `{reason}`: "
-                f"{first_elements_as_str(new_ids)}"
-            )
-            invalid_ids = invalid_ids.union(new_ids)
+            return np.zeros(len(df), dtype=bool)
+        mask = (
+            df["lookup_profit_centers"].notna()
+            & ~df["lookup_profit_centers"].isin(valid_profit_centers)
+        )
+        return mask.to_numpy(dtype=bool)
 
-        return invalid_ids
+    def _undefined_lookup_profit_centers(self, df: pd.DataFrame) -> np.ndarray:
+        """Mark target balance entries with 'lookup_profit_centers', while no
+        profit centers are defined."""
+        if set(self.profit_centers.list()["profit_center"]):
+            return np.zeros(len(df), dtype=bool)
+        return df["lookup_profit_centers"].notna().to_numpy(dtype=bool)
 
     # ----------------------------------------------------------------------
     # Revaluations
@@ -678,78 +1397,111 @@ class StandaloneLedger(LedgerEngine):
         Returns:
             pd.DataFrame: The sanitized DataFrame with valid revaluation entries.
         """
-        # Enforce schema
         df = enforce_schema(df, REVALUATION_SCHEMA, keep_extra_columns=True)
         df["split_per_profit_center"] = df["split_per_profit_center"].fillna(False)
         id_columns = REVALUATION_SCHEMA.query("id == True")["column"].tolist()
 
-        # Validate date: discard rows with invalid dates (NaT)
-        invalid_date_mask = df["date"].isna()
-        if invalid_date_mask.any():
-            invalid = df.loc[invalid_date_mask, id_columns].to_dict(orient='records')
-            self._logger.warning(
-                f"Discarding {len(invalid)} revaluation rows with invalid dates: "
-                f"{first_elements_as_str(invalid)}"
-            )
-            df = df.loc[~invalid_date_mask]
-
         # TODO: use sanitized accounts
-        valid_accounts = set(self.accounts.list()["account"])
+        valid_accounts = self.accounts.list()["account"]
+        frame = df.assign(
+            _credit_defined=df["credit"].isin(valid_accounts),
+            _debit_defined=df["debit"].isin(valid_accounts),
+        )
+        result = validate(
+            frame, self._revaluation_rules(), id_columns=id_columns, logger=self._logger,
+            disabled=self.disabled_validation_rules,
+        )
+        self._validation_results = (self._validation_results or {}) | {"revaluations": result}
 
-        # Ensure at least one of credit or debit is specified
-        both_missing_mask = df["credit"].isna() & df["debit"].isna()
-        if both_missing_mask.any():
-            invalid = df.loc[both_missing_mask, id_columns].to_dict(orient='records')
-            self._logger.warning(
-                f"Discarding {len(invalid)} revaluations with no credit nor debit specified: "
-                f"{first_elements_as_str(invalid)}"
-            )
-            df = df.loc[~both_missing_mask]
-
-        # Ensure non-missing credit and debit accounts exist in the accounts entity
-        invalid_credit_mask = ~df["credit"].isna() & ~df["credit"].isin(valid_accounts)
-        invalid_debit_mask = ~df["debit"].isna() & ~df["debit"].isin(valid_accounts)
-        invalid_account_mask = invalid_credit_mask | invalid_debit_mask
-        if invalid_account_mask.any():
-            invalid = df.loc[invalid_account_mask, id_columns].to_dict(orient='records')
-            self._logger.warning(
-                f"Discarding {len(invalid)} revaluations with non-existent "
-                f"credit or debit accounts: {first_elements_as_str(invalid)}"
-            )
-            df = df.loc[~invalid_account_mask]
-
-        def validate_account_prices(accounts: pd.Series, dates: pd.Series) -> pd.Series:
-            """
-            Validate that for each row's accounts, all required price definitions are available.
-
-            For each row, this checks all associated accounts and uses `price()` to ensure
-            that a conversion rate exists for their currencies. Rows lacking a required
-            price definition are marked invalid.
-            """
-            valid_list = []
-            for acc, d in zip(accounts, dates):
-                accounts_list = self.account_range(acc)
-                # Assume this row is valid until a missing price definition is found
-                all_valid = True
-                for a in accounts_list:
-                    acc_curr = self.account_currency(a)
-                    if acc_curr != self.reporting_currency:
-                        try:
-                            self.price(ticker=acc_curr, date=d, currency=self.reporting_currency)
-                        except Exception:
-                            # If a price definition is missing or any error occurs, mark invalid
-                            all_valid = False
-                            break
-                valid_list.append(all_valid)
-            return pd.Series(valid_list, index=accounts.index)
-
-        currency_validation_mask = validate_account_prices(df["account"], df["date"])
-        if not currency_validation_mask.all():
-            invalid = df.loc[~currency_validation_mask, id_columns].to_dict(orient='records')
-            self._logger.warning(
-                f"Discarding {len(invalid)} revaluation rows with no price definition "
-                f"for required currencies: {first_elements_as_str(invalid)}"
-            )
-            df = df.loc[currency_validation_mask]
+        return df.loc[~result.discard].reset_index(drop=True)
+
+    def sanitized_revaluations(self) -> pd.DataFrame:
+        """Sanitized revaluations, see `sanitize_revaluations()`.
+
+        The result is memoized until revaluations or the settings they are
+        validated against change, so that warnings are logged once per change.
+        """
+        return self._memoized(
+            "revaluations", ["revaluations", "accounts", "assets", "price_history"],
+            lambda: self.sanitize_revaluations(self.revaluations.list()),
+        )
+
+    def _revaluation_rules(self) -> list[ValidationRule]:
+        """Validation rules of `sanitize_revaluations()`, in order of application."""
+        return [
+            ValidationRule(
+                "dates", lambda df: df["date"].isna().to_numpy(dtype=bool),
+                "Discarding %d revaluation rows with invalid dates: %s",
+            ),
+            ValidationRule(
+                "missing_accounts", self._missing_revaluation_accounts,
+                "Discarding %d revaluations with no credit nor debit specified: %s",
+            ),
+            ValidationRule(
+                "accounts", self._invalid_revaluation_accounts,
+                "Discarding %d revaluations with non-existent credit or debit accounts: %s",
+            ),
+            ValidationRule(
+                "prices", self._invalid_revaluation_prices,
+                "Discarding %d revaluation rows with no price definition "
+                "for required currencies: %s",
+            ),
+        ]
+
+    @staticmethod
+    def _missing_revaluation_accounts(df: pd.DataFrame) -> np.ndarray:
+        """Mark revaluations with neither credit nor debit account."""
+        return (df["credit"].isna() & df["debit"].isna()).to_numpy(dtype=bool)
+
+    @staticmethod
+    def _invalid_revaluation_accounts(df: pd.DataFrame) -> np.ndarray:
+        """Mark revaluations with undefined credit or debit accounts."""
+        invalid_credit = df["credit"].notna() & ~df["_credit_defined"]
+        invalid_debit = df["debit"].notna() & ~df["_debit_defined"]
+        return (invalid_credit | invalid_debit).to_numpy(dtype=bool)
+
+    def _invalid_revaluation_prices(self, df: pd.DataFrame) -> np.ndarray:
+        """Mark revaluations lacking a price definition for the currency of any
+        revalued account as of the revaluation date.
+
+        Only rows passing the preceding revaluation rules are checked, since
+        account ranges of other rows need not be resolvable. Each distinct
+        combination of account range and date is expanded to its accounts, and
+        prices of their currencies are looked up in a single vectorized query.
+        """
+        checked = ~(
+            df["date"].isna().to_numpy(dtype=bool)
+            | self._missing_revaluation_accounts(df)
+            | self._invalid_revaluation_accounts(df)
+        )
 
-        return df.reset_index(drop=True)
+        invalid = np.zeros(len(df), dtype=bool)
+        rows = df.loc[checked, ["account", "date"]]
+        if rows.empty:
+            return invalid
+
+        # Expand each distinct (account range, date) pair to the revalued accounts
+        pairs = rows.drop_duplicates().reset_index(drop=True)
+        members = pd.DataFrame(
+            [
+                (accounts, account)
+                for accounts in pairs["account"].drop_duplicates()
+                for account in self.account_selector(accounts).to_list()
+            ],
+            columns=["account", "member"],
+        ).astype({"account": pairs["account"].dtype})
+        lookups = pairs.reset_index(names="pair").merge(members, on="account")
+        currency = self.accounts.list().drop_duplicates("account").set_index("account")["currency"]
+        lookups = lookups.assign(currency=lookups["member"].map(currency))
+        lookups = lookups.loc[lookups["currency"] != self.reporting_currency]
+
+        # Look up prices of all foreign currencies at once
+        price = np.array(self.price_vectorized(
+            lookups["currency"], lookups["date"], currency=self.reporting_currency,
+            allow_missing=True,
+        ).to_numpy(), dtype=float)
+        pairs = pairs.assign(invalid=pairs.index.isin(lookups.loc[np.isnan(price), "pair"]))
+        invalid[checked] = rows.merge(
+            pairs, on=["account", "date"], how="left"
+        )["invalid"].to_numpy(dtype=bool)
+        return invalid
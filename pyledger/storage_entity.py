@@ -25,7 +25,8 @@ class AccountingEntity(ABC):
         self,
         schema: pd.DataFrame,
         prepare_for_mirroring: Callable[[pd.DataFrame], pd.DataFrame] = lambda x: x,
-        on_change: Callable[[], None] = lambda: None,
+        on_change: Callable[[set | None], None] = lambda ids: None,
+        validate_change: Callable[[pd.DataFrame], None] = lambda data: None,
         *args: Any,
         **kwargs: Any
     ) -> None:
@@ -37,8 +38,14 @@ class AccountingEntity(ABC):
                                    defining the entity's DataFrame schema.
             prepare_for_mirroring (Callable[[pd.DataFrame], pd.DataFrame], optional):
                 Function to prepare data for mirroring. Defaults to identity function.
-            on_change (Callable[[], None], optional):
-                Callback that triggers after any data change.
+            on_change (Callable[[set | None], None], optional):
+                Callback that triggers after any data change. Receives the set of
+                affected ids, or None if the affected entries are unknown. Ids are
+                scalars for entities with a single id column and tuples otherwise.
+            validate_change (Callable[[pd.DataFrame], None], optional):
+                Callback that receives all added, deleted, and both the previous
+                and updated versions of modified entries before a change is
+                stored. Raises an exception to reject the change.
             *args, **kwargs: Additional arguments passed to the superclass.
         """
         super().__init__(*args, **kwargs)
@@ -47,6 +54,28 @@ class AccountingEntity(ABC):
         self._id_columns = schema.query("id == True")["column"].to_list()
         self._prepare_for_mirroring = prepare_for_mirroring
         self._on_change = on_change
+        self._validate_change = validate_change
+        self._version = 0
+
+    @property
+    def version(self) -> Any:
+        """Change version of the entity's data.
+
+        The version compares unequal after each change of the data, so that
+        data derived from the entity can be cached against it.
+        """
+        return self._version
+
+    def _changed(self, ids: set | None = None) -> None:
+        """Bump the change version and notify `on_change` of a data change."""
+        self._version += 1
+        self._on_change(ids)
+
+    def _affected_ids(self, data: pd.DataFrame) -> set:
+        """Collect the ids of the given entries, as reported to `on_change`."""
+        if len(self._id_columns) == 1:
+            return set(data[self._id_columns[0]])
+        return set(data[self._id_columns].itertuples(index=False, name=None))
 
     def standardize(self, data: pd.DataFrame, drop_extra_columns: bool = False) -> pd.DataFrame:
         """
@@ -340,12 +369,14 @@ class StandaloneAccountingEntity(AccountingEntity):
         super().__init__(*args, **kwargs)
 
     @abstractmethod
-    def _store(self, data: pd.DataFrame) -> None:
+    def _store(self, data: pd.DataFrame, ids: set | None = None) -> None:
         """
         Update storage with an updated version of the DataFrame.
 
         Args:
             data (pd.DataFrame): The updated DataFrame to store.
+            ids (set, optional): Ids of the added, modified or deleted entries,
+                passed on to `on_change`. None if unknown.
         """
 
     def _prepare_addition(self, data: pd.DataFrame):
@@ -354,12 +385,13 @@ class StandaloneAccountingEntity(AccountingEntity):
         overlap = pd.merge(current, incoming, on=self._id_columns, how='inner')
         if not overlap.empty:
             raise ValueError("Unique identifiers already exist.")
+        self._validate_change(incoming)
         combined = pd.concat([current, incoming], ignore_index=True)
         return incoming, combined
 
     def add(self, data: pd.DataFrame):
         incoming, combined = self._prepare_addition(data)
-        self._store(combined)
+        self._store(combined, ids=self._affected_ids(incoming))
         return incoming[self._id_columns].iloc[0].to_dict()
 
     def _prepare_modification(self, data: pd.DataFrame):
@@ -388,11 +420,12 @@ class StandaloneAccountingEntity(AccountingEntity):
             updated = merged.loc[mask, incoming_col].astype(merged[current_col].dtype)
             merged.loc[mask, current_col] = updated
         new = merged.drop(columns=["_merge", *incoming_cols])
+        self._validate_change(pd.concat([replaced, new.loc[mask]], ignore_index=True))
         return incoming, replaced, new
 
     def modify(self, data: pd.DataFrame):
-        _, _, new = self._prepare_modification(data)
-        self._store(new)
+        incoming, _, new = self._prepare_modification(data)
+        self._store(new, ids=self._affected_ids(incoming))
 
     def _prepare_deletion(self, id: pd.DataFrame, allow_missing: bool = False):
         current = self.list()
@@ -404,11 +437,12 @@ class StandaloneAccountingEntity(AccountingEntity):
         merged = current.merge(incoming, on=self._id_columns, how='left', indicator=True)
         new = merged[merged['_merge'] == 'left_only'].drop(columns=['_merge'])
         drop = merged[merged['_merge'] == 'both'].drop(columns=['_merge'])
+        self._validate_change(drop)
         return drop, new
 
     def delete(self, id: pd.DataFrame, allow_missing: bool = False):
-        _, new = self._prepare_deletion(id, allow_missing=allow_missing)
-        self._store(new)
+        drop, new = self._prepare_deletion(id, allow_missing=allow_missing)
+        self._store(new, ids=self._affected_ids(drop))
 
 
 class DataFrameEntity(StandaloneAccountingEntity):
@@ -425,9 +459,9 @@ class DataFrameEntity(StandaloneAccountingEntity):
         # The `include_source` flag is accepted to satisfy the interface but has no effect here.
         return self.standardize(self._df.copy(), drop_extra_columns=drop_extra_columns)
 
-    def _store(self, data: pd.DataFrame):
+    def _store(self, data: pd.DataFrame, ids: set | None = None):
         self._df = data.reset_index(drop=True)
-        self._on_change()
+        self._changed(ids)
 
 
 class JournalDataFrameEntity(JournalEntity, DataFrameEntity):
@@ -471,23 +505,51 @@ class CSVAccountingEntity(StandaloneAccountingEntity):
         """
         super().__init__(*args, **kwargs)
         self._path = Path(path).expanduser()
+        self._modified = None
         # TODO: remove once the old system is migrated
         self._column_shortcuts = column_shortcuts
         self.source_column = source_column
 
-    @timed_cache(120)
+    @property
+    def version(self) -> Any:
+        """Extend the change version with the modification times of the CSV
+        files, so that changes made outside of this entity are also detected."""
+        return (self._version, self._file_versions())
+
+    def _file_versions(self) -> tuple:
+        """Modification time of the CSV file, empty if the file does not exist."""
+        try:
+            return (self._path.stat().st_mtime_ns,)
+        except FileNotFoundError:
+            return ()
+
     def list(self, drop_extra_columns: bool = False, include_source: bool = False) -> pd.DataFrame:
         """Retrieve all entries from the CSV file.
 
+        Cached entries are discarded when the file was modified outside of this entity.
+
         If `include_source` is True, each row will include an additional column (defined by
         `self.source_column`) indicating the file and line number where the row was read from,
         formatted as a GitHub-style reference (e.g., 'journal.csv:L#42').
         """
+        modified = self._file_versions()
+        if modified != self._modified:
+            self._modified = modified
+            self._cached_list.cache_clear()
+        return self._cached_list(
+            drop_extra_columns=drop_extra_columns, include_source=include_source
+        )
+
+    @timed_cache(120)
+    def _cached_list(
+        self, drop_extra_columns: bool = False, include_source: bool = False
+    ) -> pd.DataFrame:
+        """Read all entries, cached by `list()`."""
         return self._read_data(
             drop_extra_columns=drop_extra_columns, include_source=include_source
         )
 
-    def _store(self, data: pd.DataFrame, path: Path | str = None):
+    def _store(self, data: pd.DataFrame, path: Path | str = None, ids: set | None = None):
         """
         Store the DataFrame to a CSV file. If the DataFrame is empty, the CSV file is deleted.
 
@@ -495,6 +557,7 @@ class CSVAccountingEntity(StandaloneAccountingEntity):
             data (pd.DataFrame): DataFrame to be stored.
             path (Path, optional): Path where the CSV file will be saved.
                 Defaults to the instance's defined path.
+            ids (set, optional): Ids of the changed entries, passed on to `on_change`.
         """
         if path is None:
             path = self._path
@@ -505,8 +568,8 @@ class CSVAccountingEntity(StandaloneAccountingEntity):
             path.unlink(missing_ok=True)
         else:
             self._write_file(data, path)
-        self.list.cache_clear()
-        self._on_change()
+        self._cached_list.cache_clear()
+        self._changed(ids)
 
     def _read_data(
         self, drop_extra_columns: bool = False, include_source: bool = False
@@ -560,6 +623,16 @@ class MultiCSVEntity(CSVAccountingEntity):
         self.file_column = file_column
         self._write_file = write_file
 
+    def _file_versions(self) -> tuple:
+        """Relative paths and modification times of all CSV files in the root
+        directory, so that edits within existing files are detected too."""
+        if not self._path.is_dir():
+            return ()
+        return tuple(sorted(
+            (str(file.relative_to(self._path)), file.stat().st_mtime_ns)
+            for file in self._path.rglob("*.csv")
+        ))
+
     def _read_data(
         self, drop_extra_columns: bool = False, include_source: bool = False
     ) -> pd.DataFrame:
@@ -643,7 +716,8 @@ class MultiCSVEntity(CSVAccountingEntity):
             full_path.parent.mkdir(parents=True, exist_ok=True)
             df = combined.query(f"`{col}` == @path")
             df = df.drop(columns=col)
-            self._store(df, full_path)
+            ids = self._affected_ids(incoming.query(f"`{col}` == @path"))
+            self._store(df, full_path, ids=ids)
         return incoming[self._id_columns].to_dict()
 
     def modify(self, data: pd.DataFrame):
@@ -655,7 +729,9 @@ class MultiCSVEntity(CSVAccountingEntity):
             full_path.parent.mkdir(parents=True, exist_ok=True)
             df = new.query(f"`{col}` == @path")
             df = df.drop(columns=col)
-            self._store(df, full_path)
+            ids = self._affected_ids(incoming.query(f"`{col}` == @path"))
+            ids |= self._affected_ids(replaced.query(f"`{col}` == @path"))
+            self._store(df, full_path, ids=ids)
 
     def delete(self, id: pd.DataFrame, allow_missing: bool = False):
         col = self.file_column
@@ -664,7 +740,8 @@ class MultiCSVEntity(CSVAccountingEntity):
         for path in paths_to_update:
             df = new.query(f"`{col}` == @path")
             df = df.drop(columns=col)
-            self._store(df, self._path / path)
+            ids = self._affected_ids(drop.query(f"`{col}` == @path"))
+            self._store(df, self._path / path, ids=ids)
 
 
 class CSVJournalEntity(JournalEntity, MultiCSVEntity):
@@ -687,6 +764,17 @@ class CSVJournalEntity(JournalEntity, MultiCSVEntity):
         """Extract numeric portion of journal id."""
         return id.str.replace("^.*:", "", regex=True).astype(int)
 
+    def _file_ids(self, current: pd.DataFrame, df: pd.DataFrame, path: str) -> set:
+        """Ids affected by rewriting a journal file.
+
+        Ids are positional within a file, so rewriting a file may renumber all
+        of its transactions. Affected are both the ids read from the file before
+        and the ids it holds after storing `df`.
+        """
+        before = set(current.loc[self._csv_path(current["id"]) == path, "id"])
+        after = {f"{path}:{i}" for i in range(1, df["id"].nunique() + 1)}
+        return before | after
+
     def _read_data(
         self, drop_extra_columns: bool = False, include_source: bool = False
     ) -> pd.DataFrame:
@@ -729,10 +817,14 @@ class CSVJournalEntity(JournalEntity, MultiCSVEntity):
             keep_unreferenced (bool): Keep files in the journal directory that are
                 not referenced by this save. Defaults to False (delete them).
         """
+        current = self.list()
         if df is None:
-            df = self.list()
+            df = current
 
         df = self.standardize(df).copy()
+        columns = [col for col in self._schema["column"] if col != "id"]
+        changes = current[columns].merge(df[columns], how="outer", indicator=True)
+        self._validate_change(changes.loc[changes["_merge"] != "both"].drop(columns="_merge"))
         df[self.file_column] = self._csv_path(df["id"])
         save_files(
             df,
@@ -741,8 +833,8 @@ class CSVJournalEntity(JournalEntity, MultiCSVEntity):
             func=self._write_file,
             keep_unreferenced=keep_unreferenced,
         )
-        self.list.cache_clear()
-        self._on_change()
+        self._cached_list.cache_clear()
+        self._changed(None)
 
     def add(self, data: pd.DataFrame, path: str = "default.csv") -> list[str]:
         """Add new entries.
@@ -761,6 +853,7 @@ class CSVJournalEntity(JournalEntity, MultiCSVEntity):
 
         current = self.list()
         incoming = self.standardize(pd.DataFrame(data))
+        self._validate_change(incoming)
         df_same_file = current[self._csv_path(current["id"]) == path]
 
         # Assign unique IDs incrementing from the max ID
@@ -771,7 +864,7 @@ class CSVJournalEntity(JournalEntity, MultiCSVEntity):
         df = pd.concat([df_same_file, incoming], ignore_index=True)
         full_path = self._path / path
         Path(full_path).parent.mkdir(parents=True, exist_ok=True)
-        self._store(df, full_path)
+        self._store(df, full_path, ids=self._file_ids(current, df, path))
 
         return incoming["id"].to_list()
 
@@ -799,16 +892,19 @@ class CSVJournalEntity(JournalEntity, MultiCSVEntity):
         missing = pd.merge(incoming, current, on=self._id_columns, how='left', indicator=True)
         if not missing[missing['_merge'] != 'both'].empty:
             raise ValueError("Some ids are not present in the data.")
+        replaced = current.loc[current["id"].isin(incoming["id"])]
+        self._validate_change(pd.concat([replaced, incoming], ignore_index=True))
 
-        current = current.query("id not in @incoming['id']")
-        updated = pd.concat([current, incoming], ignore_index=True)
+        updated = current.query("id not in @incoming['id']")
+        updated = pd.concat([updated, incoming], ignore_index=True)
         paths_to_update = self._csv_path(incoming["id"]).unique()
         for path in paths_to_update:
             df_same_file = updated[self._csv_path(updated["id"]) == path]
             df_same_file = df_same_file.iloc[
                 self._id_from_path(df_same_file["id"]).argsort(kind='mergesort')
             ]
-            self._store(df_same_file, self._path / path)
+            ids = self._file_ids(current, df_same_file, path)
+            self._store(df_same_file, self._path / path, ids=ids)
 
     def delete(self, id: pd.DataFrame, allow_missing: bool = False):
         current = self.list()
@@ -818,8 +914,10 @@ class CSVJournalEntity(JournalEntity, MultiCSVEntity):
             if not missing[missing['_merge'] != 'both'].empty:
                 raise ValueError("Some ids are not present in the data.")
         new = current.merge(incoming, on=self._id_columns, how='left', indicator=True)
+        self._validate_change(new[new['_merge'] == 'both'].drop(columns=['_merge']))
         new = new[new['_merge'] == 'left_only'].drop(columns=['_merge'])
 
         paths_to_update = self._csv_path(incoming["id"]).unique()
         for path in paths_to_update:
-            self._store(new[self._csv_path(new["id"]) == path], self._path / path)
+            df = new[self._csv_path(new["id"]) == path]
+            self._store(df, self._path / path, ids=self._file_ids(current, df, path))
@@ -0,0 +1,49 @@
+"""Fixtures shared by the test suite."""
+
+import pytest
+from pyledger import MemoryLedger
+from .base_test import BaseTest
+
+
+def restored_engine() -> MemoryLedger:
+    """MemoryLedger populated with all accounting data of BaseTest."""
+    engine = MemoryLedger()
+    engine.restore(
+        configuration=BaseTest.CONFIGURATION,
+        accounts=BaseTest.ACCOUNTS,
+        tax_codes=BaseTest.TAX_CODES,
+        journal=BaseTest.JOURNAL,
+        assets=BaseTest.ASSETS,
+        price_history=BaseTest.PRICES,
+        revaluations=BaseTest.REVALUATIONS,
+        profit_centers=BaseTest.PROFIT_CENTERS,
+        target_balance=BaseTest.TARGET_BALANCE,
+    )
+    return engine
+
+
+@pytest.fixture
+def engine():
+    return restored_engine()
+
+
+@pytest.fixture(scope="module")
+def module_engine():
+    """Like `engine`, shared by all tests of a module that do not modify it."""
+    return restored_engine()
+
+
+@pytest.fixture
+def settings_engine():
+    """MemoryLedger populated with the settings of BaseTest, clear of journal
+    entries, revaluations and target balances."""
+    engine = MemoryLedger()
+    engine.restore(
+        configuration=BaseTest.CONFIGURATION,
+        accounts=BaseTest.ACCOUNTS,
+        tax_codes=BaseTest.TAX_CODES,
+        assets=BaseTest.ASSETS,
+        price_history=BaseTest.PRICES,
+        profit_centers=BaseTest.PROFIT_CENTERS,
+    )
+    return engine
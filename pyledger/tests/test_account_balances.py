@@ -0,0 +1,62 @@
+"""Test suite for the vectorized batch evaluation of account balances."""
+
+import pandas as pd
+import pytest
+from .base_test import BaseTest
+
+
+def reference_balances(engine, df: pd.DataFrame, **kwargs) -> pd.DataFrame:
+    """Evaluate balance queries row by row with `_account_balance()`."""
+    balances = [
+        engine._account_balance(account=account, period=period, profit_centers=pc, **kwargs)
+        for account, period, pc in zip(df["account"], df["period"], df["profit_center"])
+    ]
+    report_balances = [balance.pop("reporting_currency") for balance in balances]
+    return pd.DataFrame({"report_balance": report_balances, "balance": balances})
+
+
+def test_batch_matches_reference_implementation(engine):
+    queries = BaseTest.EXPECTED_BALANCES[["account", "period", "profit_center"]]
+    actual = engine.account_balances(queries)
+    expected = reference_balances(engine, queries)
+    assert actual["report_balance"].tolist() == expected["report_balance"].tolist()
+    assert actual["balance"].tolist() == expected["balance"].tolist()
+
+
+def test_batch_with_explicit_ledger(engine):
+    ledger = engine.serialized_ledger().query("date <= '2024-06-30'")
+    queries = BaseTest.EXPECTED_BALANCES[["account", "period", "profit_center"]]
+    actual = engine.account_balances(queries, ledger=ledger)
+    expected = reference_balances(engine, queries, ledger=ledger)
+    assert actual["report_balance"].tolist() == expected["report_balance"].tolist()
+    assert actual["balance"].tolist() == expected["balance"].tolist()
+
+
+def test_batch_reporting_currency_only(engine):
+    queries = pd.DataFrame({
+        "account": ["1000:1999", 1000], "period": pd.Series(["2024", None], dtype="object")
+    })
+    actual = engine.account_balances(queries, reporting_currency_only=True)
+    assert actual.columns.tolist() == ["report_balance"]
+    assert len(actual) == 2
+
+
+def test_batch_without_matching_entries(engine):
+    queries = pd.DataFrame({"account": [1000], "period": ["1999"]})
+    actual = engine.account_balances(queries)
+    assert actual["report_balance"].tolist() == [0.0]
+    assert actual["balance"].tolist() == [{}]
+
+
+def test_batch_empty_query(engine):
+    actual = engine.account_balances(pd.DataFrame({"account": [], "period": []}))
+    assert actual.empty
+    assert actual.columns.tolist() == ["report_balance", "balance"]
+
+
+def test_batch_invalid_profit_center_raises_error(engine):
+    queries = pd.DataFrame({
+        "account": [1000], "period": ["2024"], "profit_center": ["Nonexistent"]
+    })
+    with pytest.raises(ValueError, match="No valid profit centers"):
+        engine.account_balances(queries)
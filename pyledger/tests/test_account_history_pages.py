@@ -0,0 +1,50 @@
+"""Test suite for paginated account history."""
+
+import pandas as pd
+import pytest
+
+
+@pytest.mark.parametrize("account, period, profit_centers", [
+    ("1000:1999", None, None),
+    ("1000:9999", "2024-Q2", None),
+    ("1000:1999", "2024", "General+Shop"),
+])
+@pytest.mark.parametrize("page_size", [1, 3, 1000])
+def test_pages_match_account_history(module_engine, account, period, profit_centers, page_size):
+    expected = module_engine.account_history(account, period=period, profit_centers=profit_centers)
+    pages = list(module_engine.iter_account_history(
+        account, period=period, profit_centers=profit_centers, page_size=page_size
+    ))
+    actual = pd.concat(pages, ignore_index=True)
+
+    assert actual.equals(actual.sort_values(["date", "id"], kind="stable"))
+    pd.testing.assert_frame_equal(actual, expected)
+
+
+def test_pages_do_not_split_transactions(module_engine):
+    pages = list(module_engine.iter_account_history("1000:9999", page_size=1))
+    keys = [set(zip(page["date"], page["id"])) for page in pages]
+    assert all(len(key) == 1 for key in keys)
+    assert len(set.union(*keys)) == len(keys)
+
+
+@pytest.mark.parametrize("period", [None, "2024"])
+def test_resume_from_cursor(module_engine, period):
+    pages = list(module_engine.iter_account_history("1000:1999", period=period, page_size=4))
+    assert len(pages) > 2
+    last = pages[1].iloc[-1]
+    resumed = list(module_engine.iter_account_history(
+        "1000:1999", period=period, page_size=4, cursor=(last["date"], last["id"])
+    ))
+    pd.testing.assert_frame_equal(
+        pd.concat(resumed, ignore_index=True), pd.concat(pages[2:], ignore_index=True)
+    )
+
+
+def test_empty_history(module_engine):
+    assert list(module_engine.iter_account_history(1000, period="2010")) == []
+
+
+def test_invalid_page_size(module_engine):
+    with pytest.raises(ValueError, match="page_size"):
+        next(module_engine.iter_account_history(1000, page_size=0))
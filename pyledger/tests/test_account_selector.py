@@ -0,0 +1,60 @@
+"""Test suite for compiled account selectors."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from pyledger import MemoryLedger
+from pyledger.account_selector import AccountChart, AccountSelector
+from pyledger.tests.base_test import BaseTest
+
+
+@pytest.fixture
+def engine():
+    engine = MemoryLedger()
+    engine.restore(accounts=BaseTest.ACCOUNTS, tax_codes=BaseTest.TAX_CODES)
+    return engine
+
+
+def test_chart_between_preserves_chart_order():
+    chart = AccountChart([1020, 1000, 3000, 1010])
+    assert chart.between(1000, 1999).tolist() == [1020, 1000, 1010]
+    assert chart.between(4000, 5000).tolist() == []
+    assert chart.contains(3000)
+    assert not chart.contains(3001)
+
+
+def test_selector_mask_and_multiplier():
+    chart = AccountChart([1000, 1010, 1020, 1500, 3000])
+    selector = AccountSelector("1000:1999-1500+3000+1010", chart)
+    assert selector.to_parts() == {"add": [1000, 1010, 1020, 1500, 3000, 1010], "subtract": [1500]}
+    assert sorted(selector.to_list()) == [1000, 1010, 1020, 3000]
+
+    account = pd.Series([1000, 1010, 1500, 2000, 3000, None], dtype="Int64")
+    np.testing.assert_array_equal(
+        selector.mask(account), [True, True, True, False, True, False]
+    )
+    np.testing.assert_array_equal(selector.multiplier(account), [1, 2, 0, 0, 1, 0])
+
+
+def test_selector_is_memoized(engine):
+    selector = engine.account_selector("1000:1999")
+    assert engine.account_selector("1000:1999") is selector
+    assert engine.account_range("1000:1999") == selector.to_list()
+
+
+def test_account_changes_invalidate_selectors(engine):
+    accounts = engine.account_range("1000:1999")
+    new_account = 1001
+    assert new_account not in accounts
+    engine.accounts.add({
+        "account": [new_account], "currency": ["USD"], "description": ["New account"],
+        "group": ["/Assets"],
+    })
+    assert new_account in engine.account_range("1000:1999")
+    engine.accounts.delete({"account": [new_account]})
+    assert sorted(engine.account_range("1000:1999")) == sorted(accounts)
+
+
+def test_selector_without_matching_accounts(engine):
+    with pytest.raises(ValueError, match="No account matching"):
+        engine.account_selector("9990:9991")
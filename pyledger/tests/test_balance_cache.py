@@ -0,0 +1,83 @@
+"""Test suite for the versioned balance query result cache."""
+
+import datetime
+import pandas as pd
+import pytest
+
+
+QUERIES = pd.DataFrame({
+    "account": ["1000:9999", 1020, "1000:1999-1020", 1020],
+    "period": ["2024", "2024-12-31", None, datetime.date(2024, 12, 31)],
+    "profit_center": [None, None, "Shop+General", None],
+})
+
+
+def test_repeated_queries_are_served_from_cache(engine):
+    engine.balance_cache.clear()
+    expected = engine.account_balances(QUERIES.copy(), output="long")
+    # The last query is equivalent to the second query
+    assert engine.balance_cache.stats()["misses"] == 3
+    assert engine.balance_cache.stats()["hits"] == 0
+
+    cached = engine.account_balances(QUERIES.copy(), output="long")
+    pd.testing.assert_frame_equal(cached, expected)
+    assert engine.balance_cache.stats()["misses"] == 3
+    assert engine.balance_cache.stats()["hits"] == 3
+
+
+def test_cached_results_match_uncached_evaluation(engine):
+    engine.account_balances(QUERIES.copy())
+    cached = engine.account_balances(QUERIES.copy())
+    uncached = engine.account_balances(QUERIES.copy(), ledger=engine.serialized_ledger())
+    pd.testing.assert_frame_equal(cached, uncached)
+
+    cached = engine.account_balances(QUERIES.copy(), reporting_currency_only=True, output="long")
+    assert (cached["currency"] == "reporting_currency").all()
+    assert len(cached) == len(QUERIES)
+
+
+def test_journal_changes_invalidate_cached_results(engine):
+    query = pd.DataFrame({"account": [1000], "period": ["2024-12-31"]})
+    before = engine.account_balances(query.copy())["report_balance"].item()
+    version = engine.balance_cache.version
+    engine.journal.add(pd.DataFrame({
+        "id": ["cache"], "date": ["2024-06-30"], "account": [1000], "contra": [4000],
+        "currency": ["USD"], "amount": [100.0], "profit_center": ["General"],
+        "description": ["Cache test"],
+    }))
+    assert engine.balance_cache.version > version
+    after = engine.account_balances(query.copy())["report_balance"].item()
+    assert after == pytest.approx(before + 100.0)
+
+
+def test_cache_size_is_bounded(engine):
+    engine.balance_cache.maxsize = 2
+    engine.account_balances(QUERIES.copy())
+    assert engine.balance_cache.stats()["size"] == 2
+
+
+def test_query_keys_follow_resolved_filters_and_today(engine):
+    queries = pd.DataFrame({
+        "account": [1000, 1000, 1000],
+        "period": ["2024", "2024", None],
+        "profit_center": ["Shop+General", ["General", "Shop"], None],
+    })
+    keys = engine._balance_query_keys(queries)
+    assert keys[0] == keys[1]
+    assert keys[0][2] == frozenset(engine.parse_profit_centers("Shop+General"))
+    assert keys[2][1] == (None, None, datetime.date.today())
+
+
+def test_ledger_rebuild_after_expiry_invalidates_cached_results(engine):
+    engine.account_balances(QUERIES.copy())
+    version = engine.balance_cache.version
+    engine.account_balances(QUERIES.copy())
+    assert engine.balance_cache.version == version
+
+    # Simulate the expiry of the serialized ledger cache
+    engine.serialized_ledger.cache_clear()
+    engine._ledger_built -= 121
+    misses = engine.balance_cache.stats()["misses"]
+    engine.account_balances(QUERIES.copy())
+    assert engine.balance_cache.version > version
+    assert engine.balance_cache.stats()["misses"] > misses
@@ -0,0 +1,74 @@
+"""Test suite for the prefix-sum balance index."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from pyledger.balance_index import BalanceIndex
+from .base_test import BaseTest
+
+
+@pytest.mark.parametrize("start, end", [
+    (None, None),
+    (None, "2024-01-01"),
+    ("2024-01-24", None),
+    ("2024-03-01", "2024-12-31"),
+    ("2024-12-31", "2024-01-01"),
+])
+def test_index_balances_match_ledger_sums(engine, start, end):
+    ledger = engine.serialized_ledger()
+    index = BalanceIndex(ledger)
+    groups = index.groups
+    n = len(groups)
+    amount, report_amount, count = index.balances(
+        np.arange(n),
+        start=np.full(n, np.datetime64(start or "NaT"), dtype="datetime64[ns]"),
+        end=np.full(n, np.datetime64(end or "NaT"), dtype="datetime64[ns]"),
+    )
+
+    for i, group in enumerate(groups.itertuples(index=False)):
+        rows = (ledger["account"] == group.account) & (ledger["currency"] == group.currency)
+        if pd.isna(group.profit_center):
+            rows &= ledger["profit_center"].isna()
+        else:
+            rows &= ledger["profit_center"] == group.profit_center
+        if start is not None:
+            rows &= ledger["date"] >= pd.Timestamp(start)
+        if end is not None:
+            rows &= ledger["date"] <= pd.Timestamp(end)
+        rows = rows.fillna(False).astype(bool)
+        assert (count[i] > 0) == rows.any()
+        if rows.any():
+            assert amount[i] == pytest.approx(ledger.loc[rows, "amount"].sum())
+            assert report_amount[i] == pytest.approx(ledger.loc[rows, "report_amount"].sum())
+
+
+def test_empty_index():
+    index = BalanceIndex(BaseTest.JOURNAL.iloc[:0])
+    assert index.groups.empty
+    amount, report_amount, count = index.balances(
+        np.array([], dtype=int), start=np.array([]), end=np.array([])
+    )
+    assert len(amount) == len(report_amount) == len(count) == 0
+
+
+def test_index_rebuilt_on_journal_change(engine):
+    query = pd.DataFrame({"account": [1000], "period": ["2024"]})
+    before = engine.account_balances(query)["balance"].iloc[0]["USD"]
+    engine.journal.add(pd.DataFrame({
+        "id": ["balance-index"], "date": ["2024-06-30"], "account": [1000], "contra": [1005],
+        "currency": ["USD"], "amount": [100.0], "description": ["Transfer"],
+        "profit_center": ["General"],
+    }))
+    after = engine.account_balances(query)["balance"].iloc[0]["USD"]
+    assert after == pytest.approx(before + 100.0)
+
+
+def test_account_history_opening_balance(engine):
+    def closing_balances(df: pd.DataFrame) -> pd.DataFrame:
+        # Compare end-of-day balances, which do not depend on the order within a date
+        return df.groupby("date")[["balance", "report_balance"]].last()
+
+    full = engine.account_history(1000)
+    full = full.query("date >= '2024-10-01' and date <= '2024-12-31'")
+    partial = engine.account_history(1000, period="2024-Q4")
+    pd.testing.assert_frame_equal(closing_balances(partial), closing_balances(full))
@@ -0,0 +1,32 @@
+"""Test suite for the account by period balance matrix."""
+
+import pytest
+
+
+@pytest.mark.parametrize("accounts, profit_centers", [
+    (None, None),
+    ("1000:2999", None),
+    ([1000, 1020, 3000], "General"),
+])
+def test_matrix_matches_individual_balances(module_engine, accounts, profit_centers):
+    periods = ["2024-Q1", "2024-Q2", "2024", "2024-12-31", None]
+    matrix = module_engine.balance_matrix(accounts, periods, profit_centers=profit_centers)
+    assert matrix.columns.tolist() == periods
+
+    for period in periods:
+        expected = module_engine.individual_account_balances(
+            accounts, period=period, profit_centers=profit_centers
+        )
+        column = matrix[period]
+        assert set(column.index.get_level_values("account")) == set(expected["account"])
+        for row in expected.itertuples(index=False):
+            assert column[(row.account, "reporting_currency")] == pytest.approx(
+                row.report_balance
+            )
+            for currency, balance in row.balance.items():
+                assert column[(row.account, currency)] == pytest.approx(balance)
+
+
+def test_matrix_deduplicates_periods(module_engine):
+    matrix = module_engine.balance_matrix("1000:1999", ["2024", "2024", "2025"])
+    assert matrix.columns.tolist() == ["2024", "2025"]
@@ -0,0 +1,48 @@
+"""Test suite for the largest remainder allocation of reporting currency imbalances."""
+
+import numpy as np
+import pandas as pd
+from pyledger import LedgerEngine
+
+
+def balance_iteratively(rounded: pd.Series, unrounded: pd.Series, increment: float) -> pd.Series:
+    """Reference implementation adjusting one row by one increment at a time."""
+    rounded = rounded.copy()
+    tolerance = increment / 2
+    while abs(rounded.sum()) > tolerance:
+        errors = rounded - unrounded
+        if rounded.sum() > tolerance:
+            rounded[errors.idxmax()] -= increment
+        else:
+            rounded[errors.idxmin()] += increment
+    return rounded
+
+
+def test_matches_iterative_adjustment():
+    rng = np.random.default_rng(42)
+    increment = 0.01
+    txn_ids, rounded, unrounded, expected = [], [], [], []
+    for txn in range(200):
+        n = rng.integers(2, 12)
+        # Amounts nearly balanced in transaction currency, converted at rates with
+        # many decimals to avoid exact ties between rounding errors
+        amount = np.round(rng.uniform(-1000, 1000, n), 2)
+        amount[-1] = -amount[:-1].sum() + rng.choice([0.0, 0.01, -0.02])
+        values = pd.Series(amount * rng.uniform(0.005, 200))
+        rounded_values = values.round(2)
+        if abs(rounded_values.sum()) <= increment / 2:
+            continue
+        txn_ids += [f"txn{txn}"] * n
+        rounded.append(rounded_values)
+        unrounded.append(values)
+        expected.append(balance_iteratively(rounded_values, values, increment))
+
+    actual = LedgerEngine._balance_report_amounts(
+        txn_id=np.array(txn_ids),
+        rounded=pd.concat(rounded).to_numpy(),
+        unrounded=pd.concat(unrounded).to_numpy(),
+        increment=increment,
+    )
+    np.testing.assert_allclose(actual, pd.concat(expected).to_numpy(), atol=1e-9)
+    totals = pd.Series(actual).groupby(np.array(txn_ids)).sum()
+    assert (totals.abs() <= increment / 2).all()
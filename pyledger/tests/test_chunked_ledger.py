@@ -0,0 +1,83 @@
+"""Test suite for the append-only chunked ledger and its balance checkpoints."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from pyledger.chunked_ledger import ChunkedLedger
+
+
+@pytest.fixture
+def ledger(engine):
+    return engine.serialize_ledger(engine.journal.list())
+
+
+def split(ledger: pd.DataFrame, n: int = 3) -> ChunkedLedger:
+    size = len(ledger) // n + 1
+    chunked = ChunkedLedger(ledger.iloc[:size])
+    for start in range(size, len(ledger), size):
+        chunked.append(ledger.iloc[start:start + size])
+    return chunked
+
+
+def test_to_frame_combines_chunks_in_order(ledger):
+    chunked = split(ledger)
+    assert len(chunked) == len(ledger)
+    pd.testing.assert_frame_equal(chunked.to_frame(), ledger.reset_index(drop=True))
+
+
+@pytest.mark.parametrize("account, period, profit_centers", [
+    ("1000:9999", None, None),
+    (1020, "2024-12-31", None),
+    ("1000:1999-1020", "2024", "Shop+General"),
+])
+def test_account_balance_matches_single_frame(engine, ledger, account, period, profit_centers):
+    expected = engine._account_balance(
+        account, ledger=ledger, period=period, profit_centers=profit_centers
+    )
+    actual = engine._account_balance(
+        account, ledger=split(ledger), period=period, profit_centers=profit_centers
+    )
+    assert actual == expected
+
+
+def test_account_balances_match_single_frame(engine, ledger):
+    queries = pd.DataFrame({
+        "account": ["1000:9999", 1020, "1000:1999-1020"],
+        "period": [None, "2024-12-31", "2024"],
+        "profit_center": [None, None, "Shop+General"],
+    })
+    expected = engine.account_balances(queries.copy(), output="long", ledger=ledger)
+    actual = engine.account_balances(queries.copy(), output="long", ledger=split(ledger))
+    pd.testing.assert_frame_equal(actual, expected)
+
+
+def test_balances_start_from_checkpoints(ledger):
+    chunked = split(ledger)
+    for end in ["2024-03-31", "2024-06-30", "2024-12-31"]:
+        actual = chunked.balances(end=end)
+        expected = ChunkedLedger(ledger).balances(end=end)
+        pd.testing.assert_frame_equal(
+            actual.sort_values(["account", "currency", "profit_center"], ignore_index=True),
+            expected.sort_values(["account", "currency", "profit_center"], ignore_index=True),
+            check_dtype=False,
+        )
+    assert chunked._checkpoint_dates == [
+        pd.Timestamp("2024-03-31"), pd.Timestamp("2024-06-30"), pd.Timestamp("2024-12-31")
+    ]
+
+
+def test_append_discards_later_checkpoints(ledger):
+    chunked = ChunkedLedger(ledger)
+    before = chunked.balances(end="2024-12-31")
+    chunked.balances(end="2024-06-30")
+    entry = ledger.iloc[[0]].assign(date=pd.Timestamp("2024-09-30"), amount=1.0)
+    chunked.append(entry)
+    assert chunked._checkpoint_dates == [pd.Timestamp("2024-06-30")]
+    after = chunked.balances(end="2024-12-31")
+    key = ["account", "currency", "profit_center"]
+    merged = after.merge(before, on=key, how="left", suffixes=("", "_before"))
+    changed = merged.loc[
+        ~np.isclose(merged["amount"], merged["amount_before"], rtol=0, atol=1e-9)
+    ]
+    assert len(changed) == 1
+    assert changed["count"].item() == changed["count_before"].item() + 1
@@ -0,0 +1,64 @@
+"""Test suite for the incremental validation of journal transactions."""
+
+import warnings
+import pandas as pd
+from pandas.testing import assert_frame_equal
+import pytest
+from .base_test import BaseTest
+
+
+@pytest.fixture
+def validated_ids(settings_engine, monkeypatch):
+    calls = []
+    validate_journal = settings_engine._validate_journal
+
+    def recording_validate_journal(df, **kwargs):
+        calls.append(set(df["id"]))
+        return validate_journal(df, **kwargs)
+
+    monkeypatch.setattr(settings_engine, "_validate_journal", recording_validate_journal)
+    return calls
+
+
+def test_only_new_or_modified_transactions_are_validated(settings_engine, validated_ids):
+    journal = BaseTest.JOURNAL
+    expected = settings_engine.sanitize_journal(journal)
+    assert validated_ids[-1] == set(journal["id"])
+
+    assert_frame_equal(settings_engine.sanitize_journal(journal), expected)
+    assert validated_ids[-1] == set()
+
+    modified = journal.copy()
+    txn_id = modified["id"].iloc[0]
+    modified.loc[modified["id"] == txn_id, "description"] = "Modified"
+    result = settings_engine.sanitize_journal(modified)
+    assert validated_ids[-1] == {txn_id}
+    assert (result.loc[result["id"] == txn_id, "description"] == "Modified").all()
+    assert_frame_equal(
+        result.drop(columns="description"), expected.drop(columns="description")
+    )
+
+
+def test_settings_change_revalidates_all_transactions(settings_engine, validated_ids):
+    journal = BaseTest.JOURNAL
+    settings_engine.sanitize_journal(journal)
+    settings_engine.accounts.add(pd.DataFrame({
+        "account": [9999], "currency": ["USD"], "description": ["Test"]
+    }))
+    settings_engine.sanitize_journal(journal)
+    assert validated_ids[-1] == set(journal["id"])
+
+
+def test_reused_transactions_log_the_same_warnings(settings_engine, validated_ids, caplog):
+    journal = BaseTest.JOURNAL.copy()
+    journal.loc[0, "profit_center"] = "undefined"
+    expected = settings_engine.sanitize_journal(journal)
+    full = [r.getMessage() for r in caplog.records if "journal entries" in r.getMessage()]
+    assert any("invalid profit center" in message for message in full)
+
+    caplog.clear()
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", FutureWarning)
+        assert_frame_equal(settings_engine.sanitize_journal(journal), expected)
+    assert validated_ids[-1] == set()
+    assert [r.getMessage() for r in caplog.records if "journal entries" in r.getMessage()] == full
@@ -0,0 +1,70 @@
+"""Test suite for long-format account balances."""
+
+import pandas as pd
+import pytest
+from .base_test import BaseTest
+
+
+def long_to_dicts(long: pd.DataFrame, key: str) -> dict:
+    result = {}
+    for value, currency, balance in zip(long[key], long["currency"], long["balance"]):
+        result.setdefault(value, {})[currency] = None if pd.isna(balance) else balance
+    return result
+
+
+def test_long_matches_dict_balances(module_engine):
+    queries = BaseTest.EXPECTED_BALANCES[["account", "period", "profit_center"]]
+    expected = module_engine.account_balances(queries.copy())
+    long = module_engine.account_balances(queries.copy(), output="long")
+
+    assert (long.groupby("query")["currency"].apply(
+        lambda currency: (currency == "reporting_currency").sum()
+    ) == 1).all()
+    actual = long_to_dicts(long, "query")
+    for query, row in expected.iterrows():
+        assert actual[query] == {"reporting_currency": row["report_balance"], **row["balance"]}
+
+
+def test_long_reporting_currency_only(module_engine):
+    queries = BaseTest.EXPECTED_BALANCES[["account", "period", "profit_center"]]
+    expected = module_engine.account_balances(queries.copy(), reporting_currency_only=True)
+    long = module_engine.account_balances(
+        queries.copy(), reporting_currency_only=True, output="long"
+    )
+    assert (long["currency"] == "reporting_currency").all()
+    assert long["query"].tolist() == list(range(len(queries)))
+    assert long["balance"].tolist() == expected["report_balance"].tolist()
+
+
+def test_individual_long_balances(module_engine):
+    expected = module_engine.individual_account_balances(None, period="2024")
+    long = module_engine.individual_account_balances(None, period="2024", output="long")
+    assert set(long["account"]) == set(expected["account"])
+    actual = long_to_dicts(long, "account")
+    for row in expected.itertuples(index=False):
+        assert actual[row.account] == {"reporting_currency": row.report_balance, **row.balance}
+
+
+def test_aggregate_long_balances(module_engine):
+    expected = module_engine.aggregate_account_balances(
+        module_engine.individual_account_balances(None, period="2024"), n=2
+    )
+    aggregated = module_engine.aggregate_account_balances(
+        module_engine.individual_account_balances(None, period="2024", output="long"), n=2
+    )
+    report = aggregated.query("currency == 'reporting_currency'")
+    report = report.set_index(["group", "description"])["balance"]
+    for row in expected.itertuples(index=False):
+        assert report[(row.group, row.description)] == pytest.approx(row.report_balance)
+        for currency, balance in row.balance.items():
+            match = aggregated.query(
+                "group == @row.group and description == @row.description "
+                "and currency == @currency"
+            )
+            assert match["balance"].item() == pytest.approx(balance)
+
+
+def test_invalid_output(module_engine):
+    query = pd.DataFrame({"account": [1000], "period": ["2024"]})
+    with pytest.raises(ValueError, match="Unknown output"):
+        module_engine.account_balances(query, output="wide")
@@ -0,0 +1,144 @@
+"""Test suite for closing periods with balance snapshots."""
+
+import pandas as pd
+import pytest
+from pyledger import TextLedger
+from .base_test import BaseTest
+
+
+QUERIES = pd.DataFrame({
+    "account": ["1000:9999", 1020, "1000:1999-1020", "1000:1999", 2970, "3000:9999"],
+    "period": [None, "2024-12-31", "2024", "2024-03", "2024-06-30", "2024-Q3"],
+    "profit_center": [None, None, "Shop+General", None, None, "General"],
+})
+
+
+def test_balances_match_open_ledger(engine):
+    expected = engine.account_balances(QUERIES.copy(), output="long")
+    engine.close_period("2024-06")
+    engine.balance_cache.clear()
+    actual = engine.account_balances(QUERIES.copy(), output="long")
+    pd.testing.assert_frame_equal(actual, expected)
+
+
+def test_recent_queries_start_from_closing_balances(engine, monkeypatch):
+    engine.close_period("2024-06")
+    expected = engine._evaluate_balance_queries(QUERIES.copy(), index=engine._balance_index())
+
+    def fail(*args, **kwargs):
+        raise AssertionError("full balance index should not be used")
+
+    monkeypatch.setattr(engine, "_balance_index", fail)
+    recent = [0, 1, 5]
+    actual = engine._evaluate_balance_queries(QUERIES.iloc[recent])
+    expected = expected.loc[expected["query"].isin(recent)]
+    expected = expected.assign(query=expected["query"].map({q: i for i, q in enumerate(recent)}))
+    pd.testing.assert_frame_equal(actual, expected.reset_index(drop=True))
+
+
+def test_closed_periods_are_read_only(engine):
+    engine.close_period("2024-06")
+    journal = engine.journal.list()
+    closed = journal.loc[journal["date"] <= pd.Timestamp("2024-06-30")].head(1)
+    with pytest.raises(ValueError, match="closed"):
+        engine.journal.delete(closed)
+    with pytest.raises(ValueError, match="closed"):
+        engine.journal.add(closed.assign(id="new"))
+    with pytest.raises(ValueError, match="closed"):
+        engine.revaluations.add(BaseTest.REVALUATIONS.head(1).assign(account="1000"))
+
+    engine.reopen_period()
+    engine.journal.delete(closed)
+
+
+def test_text_ledger_closed_periods_are_read_only(tmp_path):
+    engine = TextLedger(tmp_path)
+    engine.restore(
+        configuration=BaseTest.CONFIGURATION,
+        accounts=BaseTest.ACCOUNTS,
+        tax_codes=BaseTest.TAX_CODES,
+        journal=BaseTest.JOURNAL,
+        assets=BaseTest.ASSETS,
+        price_history=BaseTest.PRICES,
+        profit_centers=BaseTest.PROFIT_CENTERS,
+    )
+    engine.close_period("2024-06")
+    journal = engine.journal.list()
+    closed = journal.loc[journal["date"] <= pd.Timestamp("2024-06-30")].head(1)
+    with pytest.raises(ValueError, match="closed"):
+        engine.journal.delete(closed)
+    with pytest.raises(ValueError, match="closed"):
+        engine.journal.add(closed)
+    with pytest.raises(ValueError, match="closed"):
+        engine.journal.modify(closed.assign(description="Modified"))
+    with pytest.raises(ValueError, match="closed"):
+        engine.journal.mirror(journal.loc[journal["id"] != closed["id"].item()], delete=True)
+    with pytest.raises(ValueError, match="closed"):
+        engine.journal.write_directory(journal.loc[journal["id"] != closed["id"].item()])
+    pd.testing.assert_frame_equal(engine.journal.list(), journal)
+
+    engine.reopen_period()
+    engine.journal.delete(closed)
+
+
+def test_text_ledger_closing_keeps_ledger(tmp_path):
+    engine = TextLedger(tmp_path)
+    engine.restore(
+        configuration=BaseTest.CONFIGURATION,
+        accounts=BaseTest.ACCOUNTS,
+        tax_codes=BaseTest.TAX_CODES,
+        journal=BaseTest.JOURNAL,
+        assets=BaseTest.ASSETS,
+        price_history=BaseTest.PRICES,
+        profit_centers=BaseTest.PROFIT_CENTERS,
+    )
+    engine.serialized_ledger()
+    state = engine._ledger_state
+    engine.close_period("2024-06")
+    assert engine.closed_until == pd.Timestamp("2024-06-30")
+    assert engine._ledger_state is state
+    engine.reopen_period()
+    assert engine.closed_until is None
+    assert engine._ledger_state is state
+
+
+def test_prices_and_assets_of_closed_periods_are_read_only(engine):
+    engine.close_period("2024-06")
+    with pytest.raises(ValueError, match="closed"):
+        engine.price_history.add(pd.DataFrame({
+            "ticker": ["EUR"], "date": ["2024-03-31"], "currency": ["USD"], "price": [2.0]
+        }))
+    with pytest.raises(ValueError, match="undated"):
+        engine.assets.add(pd.DataFrame({"ticker": ["XAU"], "increment": [0.001]}))
+    engine.price_history.add(pd.DataFrame({
+        "ticker": ["EUR"], "date": ["2024-10-31"], "currency": ["USD"], "price": [2.0]
+    }))
+    prices = engine.price_history.list()
+    added = prices.loc[(prices["ticker"] == "EUR") & (prices["date"] == "2024-10-31")]
+    assert added["price"].tolist() == [2.0]
+
+
+def test_journal_changes_after_closing_keep_snapshot(engine):
+    engine.close_period("2024-06")
+    snapshot = engine._closing_snapshot
+    entry = pd.DataFrame({
+        "id": ["new"], "date": ["2024-11-30"], "account": [1000], "contra": [1005],
+        "currency": ["USD"], "amount": [100.0], "description": ["Transfer"],
+    })
+    engine.journal.add(entry)
+    balances = engine.account_balances(QUERIES.copy(), output="long")
+    assert engine._closing_snapshot is snapshot
+
+    engine.reopen_period()
+    engine.balance_cache.clear()
+    pd.testing.assert_frame_equal(
+        engine.account_balances(QUERIES.copy(), output="long"), balances
+    )
+
+
+def test_cannot_close_before_closed_period(engine):
+    engine.close_period("2024")
+    with pytest.raises(ValueError, match="already closed"):
+        engine.close_period("2024-06")
+    with pytest.raises(ValueError, match="open-ended"):
+        engine.close_period(None)
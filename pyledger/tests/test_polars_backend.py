@@ -0,0 +1,80 @@
+"""Test suite comparing the Polars backend with the default pandas backend."""
+
+import pandas as pd
+import pytest
+from pyledger import MemoryLedger
+from .base_test import BaseTest
+
+
+def restored_engine(backend: str) -> MemoryLedger:
+    engine = MemoryLedger()
+    engine.backend = backend
+    engine.restore(
+        configuration=BaseTest.CONFIGURATION,
+        accounts=BaseTest.ACCOUNTS,
+        tax_codes=BaseTest.TAX_CODES,
+        journal=BaseTest.JOURNAL,
+        assets=BaseTest.ASSETS,
+        price_history=BaseTest.PRICES,
+        revaluations=BaseTest.REVALUATIONS,
+        profit_centers=BaseTest.PROFIT_CENTERS,
+        target_balance=BaseTest.TARGET_BALANCE,
+    )
+    return engine
+
+
+@pytest.fixture(scope="module")
+def engines():
+    return restored_engine("pandas"), restored_engine("polars")
+
+
+def sort_entries(df: pd.DataFrame) -> pd.DataFrame:
+    """Sort entries by all columns except balances, which depend on the order
+    of entries within the same date."""
+    df = df.drop(columns=["balance", "report_balance"], errors="ignore")
+    return df.sort_values(list(df.columns), kind="mergesort").reset_index(drop=True)
+
+
+def test_invalid_backend():
+    engine = MemoryLedger()
+    with pytest.raises(ValueError, match="Unknown backend"):
+        engine.backend = "spark"
+    assert engine.backend == "pandas"
+
+
+def test_serialized_ledger(engines):
+    pandas_engine, polars_engine = engines
+    pd.testing.assert_frame_equal(
+        sort_entries(polars_engine.serialized_ledger()),
+        sort_entries(pandas_engine.serialized_ledger()),
+    )
+
+
+@pytest.mark.parametrize("account, period, profit_centers", [
+    (1000, None, None),
+    (1000, "2024-Q4", None),
+    ("1000:1999", "2024", None),
+    ("1000:9999", "2024-06-30", ["General", "Shop"]),
+    (2979, "2025", "General"),
+])
+def test_account_history(engines, account, period, profit_centers):
+    pandas_engine, polars_engine = engines
+    expected = pandas_engine.account_history(account, period, profit_centers=profit_centers)
+    actual = polars_engine.account_history(account, period, profit_centers=profit_centers)
+    pd.testing.assert_frame_equal(sort_entries(actual), sort_entries(expected))
+    # Both backends order entries by date and id
+    pd.testing.assert_frame_equal(actual[["date", "id"]], expected[["date", "id"]])
+
+    # Compare end-of-day balances, which do not depend on the order within a date
+    def closing_balances(df: pd.DataFrame) -> pd.DataFrame:
+        return df.groupby("date")[["balance", "report_balance"]].last()
+
+    pd.testing.assert_frame_equal(closing_balances(actual), closing_balances(expected))
+
+
+def test_account_balances(engines):
+    pandas_engine, polars_engine = engines
+    query = BaseTest.EXPECTED_BALANCES[["account", "period", "profit_center"]]
+    expected = pandas_engine.account_balances(query.copy())
+    actual = polars_engine.account_balances(query.copy())
+    pd.testing.assert_frame_equal(actual, expected)
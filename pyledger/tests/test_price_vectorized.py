@@ -0,0 +1,37 @@
+"""Test suite for vectorized price lookups."""
+
+import datetime
+import pandas as pd
+import pytest
+
+
+def test_price_vectorized_matches_price(engine):
+    tickers = ["EUR", "JPY", "USD", "EUR", "EUR", "CHF"]
+    dates = pd.Series(pd.to_datetime([
+        "2024-03-29", "2024-03-28", "2024-01-01", "2023-12-29", "2025-01-01", "2024-06-30"
+    ]))
+    expected = [
+        engine.price(ticker, date=date, currency="USD")[1]
+        for ticker, date in zip(tickers, dates)
+    ]
+    actual = engine.price_vectorized(tickers, dates, currency="USD").to_list()
+    assert actual == pytest.approx(expected)
+
+
+def test_price_vectorized_without_date_uses_today(engine):
+    actual = engine.price_vectorized(["EUR"], [None], currency="USD").to_list()
+    assert actual == [engine.price("EUR", date=datetime.date.today(), currency="USD")[1]]
+
+
+def test_price_vectorized_raises_without_prior_price(engine):
+    with pytest.raises(ValueError, match="No USD prices available for 'EUR'"):
+        engine.price_vectorized(["EUR"], [datetime.date(2020, 1, 1)], currency="USD")
+
+
+def test_price_vectorized_allow_missing_returns_null(engine):
+    actual = engine.price_vectorized(
+        ["EUR", "EUR", "XYZ"], [datetime.date(2020, 1, 1), datetime.date(2024, 6, 30), None],
+        currency="USD", allow_missing=True,
+    ).to_list()
+    assert actual[0] is None and actual[2] is None
+    assert actual[1] == engine.price("EUR", date=datetime.date(2024, 6, 30), currency="USD")[1]
@@ -0,0 +1,50 @@
+"""Test suite for the categorical encoding of profit centers in the serialized ledger."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from .base_test import BaseTest
+
+
+def test_serialized_ledger_profit_centers_are_categorical(engine):
+    profit_centers = engine.serialized_ledger()["profit_center"]
+    assert isinstance(profit_centers.dtype, pd.CategoricalDtype)
+    assert profit_centers.cat.categories.tolist() == sorted(
+        BaseTest.PROFIT_CENTERS["profit_center"]
+    )
+
+
+@pytest.mark.parametrize("profit_centers", ["General", "Shop+General", ["Shop", "Bakery"]])
+def test_code_mask_matches_string_comparison(engine, profit_centers):
+    ledger = engine.serialized_ledger()
+    valid = engine.parse_profit_centers(profit_centers)
+    expected = ledger["profit_center"].astype("string").isin(valid).to_numpy(dtype=bool)
+    np.testing.assert_array_equal(
+        engine._profit_center_mask(ledger["profit_center"], profit_centers), expected
+    )
+    np.testing.assert_array_equal(
+        engine._profit_center_mask(ledger["profit_center"].astype("string"), profit_centers),
+        expected,
+    )
+
+
+def test_resolved_filters_are_memoized(engine):
+    resolved = engine._resolve_profit_centers("Shop+General")
+    assert engine._resolve_profit_centers("Shop+General") is resolved
+    assert engine._resolve_profit_centers(None) is None
+
+
+def test_profit_center_changes_refresh_codes(engine):
+    engine._resolve_profit_centers("General")
+    engine.profit_centers.add({"profit_center": ["Garden"]})
+    categories, resolved = engine._profit_center_categories()
+    assert "Garden" in categories
+    assert resolved == {}
+    profit_centers = engine.serialized_ledger()["profit_center"]
+    assert profit_centers.cat.categories.equals(categories)
+
+
+@pytest.mark.parametrize("missing", [None, pd.NA, np.nan])
+def test_missing_filter_applies_no_filtering(engine, missing):
+    assert engine._resolve_profit_centers(missing) is None
+    assert engine._profit_center_mask(engine.serialized_ledger()["profit_center"], missing) is None
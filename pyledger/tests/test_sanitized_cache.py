@@ -0,0 +1,94 @@
+"""Test suite for the memoization of sanitized settings per entity change version."""
+
+import os
+import pandas as pd
+import pytest
+from pyledger import TextLedger
+from .base_test import BaseTest
+
+
+@pytest.fixture
+def sanitize_accounts_calls(settings_engine, monkeypatch):
+    calls = []
+    sanitize_accounts = settings_engine.sanitize_accounts
+
+    def counting_sanitize_accounts(*args, **kwargs):
+        calls.append(1)
+        return sanitize_accounts(*args, **kwargs)
+
+    monkeypatch.setattr(settings_engine, "sanitize_accounts", counting_sanitize_accounts)
+    return calls
+
+
+def test_entity_version_increments_on_change(settings_engine):
+    version = settings_engine.accounts.version
+    settings_engine.accounts.add(pd.DataFrame({
+        "account": [9999], "currency": ["USD"], "description": ["Test"]
+    }))
+    assert settings_engine.accounts.version != version
+
+
+def test_sanitized_accounts_are_computed_once_per_version(settings_engine, sanitize_accounts_calls):
+    accounts, _ = settings_engine.sanitized_accounts_tax_codes()
+    settings_engine.sanitized_accounts_tax_codes()
+    settings_engine.sanitize_journal(BaseTest.JOURNAL)
+    assert len(sanitize_accounts_calls) == 2
+
+    accounts.drop(accounts.index, inplace=True)
+    assert not settings_engine.sanitized_accounts_tax_codes()[0].empty
+
+    settings_engine.accounts.add(pd.DataFrame({
+        "account": [9999], "currency": ["USD"], "description": ["Test"]
+    }))
+    accounts, _ = settings_engine.sanitized_accounts_tax_codes()
+    assert len(sanitize_accounts_calls) == 4
+    assert 9999 in accounts["account"].values
+
+
+def test_price_change_refreshes_prices(settings_engine):
+    date = pd.Timestamp("2030-01-01")
+    settings_engine.price_history.add(pd.DataFrame({
+        "ticker": ["EUR"], "date": [date], "currency": ["USD"], "price": [2.0]
+    }))
+    assert settings_engine.price_vectorized(["EUR"], [date], currency="USD").to_list() == [2.0]
+
+
+def test_price_change_refreshes_price(settings_engine):
+    date = pd.Timestamp("2030-01-01")
+    before = settings_engine.price("EUR", date, currency="USD")
+    settings_engine.price_history.add(pd.DataFrame({
+        "ticker": ["EUR"], "date": [date], "currency": ["USD"], "price": [2.0]
+    }))
+    assert settings_engine.price("EUR", date, currency="USD") == ("USD", 2.0) != before
+
+
+def test_account_change_refreshes_account_currency(settings_engine):
+    settings_engine.accounts.add(pd.DataFrame({
+        "account": [9999], "currency": ["USD"], "description": ["Test"]
+    }))
+    assert settings_engine.account_currency(9999) == "USD"
+    settings_engine.accounts.modify(pd.DataFrame({
+        "account": [9999], "currency": ["EUR"], "description": ["Test"]
+    }))
+    assert settings_engine.account_currency(9999) == "EUR"
+
+
+def test_edits_within_journal_files_change_version(tmp_path):
+    engine = TextLedger(tmp_path)
+    engine.restore(
+        configuration=BaseTest.CONFIGURATION,
+        accounts=BaseTest.ACCOUNTS,
+        tax_codes=BaseTest.TAX_CODES,
+        journal=BaseTest.JOURNAL,
+        assets=BaseTest.ASSETS,
+        price_history=BaseTest.PRICES,
+        profit_centers=BaseTest.PROFIT_CENTERS,
+    )
+    version = engine.journal.version
+    assert engine.journal.version == version
+
+    file = next((tmp_path / "journal").rglob("*.csv"))
+    stat = file.stat()
+    file.write_text(file.read_text().replace("\n", "\n\n", 1))
+    os.utime(file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert engine.journal.version != version
@@ -1,6 +1,7 @@
 """Unit tests for the serialized ledger caching mechanism."""
 
 import logging
+import pandas as pd
 import pytest
 from .base_test import BaseTest
 from pyledger import MemoryLedger
@@ -90,3 +91,109 @@ def test_ledger_mutators_invalidate_serialized_ledger(engine):
     serialized_ledger = engine.serialized_ledger()
     engine.journal.modify(journal.assign(description="test description"))
     assert not serialized_ledger.equals(engine.serialized_ledger())
+
+
+def assert_matches_full_rebuild(engine):
+    def sort(df):
+        return df.sort_values(list(df.columns), kind="mergesort").reset_index(drop=True)
+
+    patched = engine.serialized_ledger()
+    engine._invalidate_ledger()
+    pd.testing.assert_frame_equal(sort(patched), sort(engine.serialized_ledger()))
+
+
+@pytest.fixture
+def complete_journal_calls(engine, monkeypatch):
+    calls = []
+    complete_journal = engine.complete_journal
+
+    def counting_complete_journal(*args, **kwargs):
+        calls.append(1)
+        return complete_journal(*args, **kwargs)
+
+    monkeypatch.setattr(engine, "complete_journal", counting_complete_journal)
+    return calls
+
+
+def test_journal_mutators_patch_serialized_ledger(engine, complete_journal_calls):
+    engine.serialized_ledger()
+    journal = engine.journal.list()
+    taxed = journal.query("tax_code.notna()")["id"].iloc[0]  # noqa: F841
+    txn = journal.query("id == @taxed")
+
+    engine.journal.delete(txn)
+    assert_matches_full_rebuild(engine)
+    engine.journal.add(txn)
+    assert_matches_full_rebuild(engine)
+    engine.journal.modify(txn.assign(amount=txn["amount"] * 2))
+    assert_matches_full_rebuild(engine)
+    # Each mutation is patched in, the full rebuilds stem from the comparison
+    assert len(complete_journal_calls) == 1 + 3
+
+
+def test_patches_reuse_sanitized_automated_entry_rules(engine, monkeypatch):
+    engine.restore(
+        assets=BaseTest.ASSETS, revaluations=BaseTest.REVALUATIONS,
+        target_balance=BaseTest.TARGET_BALANCE,
+    )
+    calls = []
+    for name in ["sanitize_revaluations", "sanitize_target_balance"]:
+        def counting(df, sanitize=getattr(engine, name), name=name):
+            calls.append(name)
+            return sanitize(df)
+        monkeypatch.setattr(engine, name, counting)
+
+    engine.serialized_ledger()
+    journal = engine.journal.list()
+    txn = journal.loc[journal["id"] == journal["id"].iloc[0]]
+    engine.journal.modify(txn.assign(description="First patch"))
+    engine.serialized_ledger()
+    patched = len(calls)
+    engine.journal.modify(txn.assign(description="Second patch"))
+    assert_matches_full_rebuild(engine)
+    # Only the full rebuild sanitizes the rules again
+    assert calls[patched:] == ["sanitize_revaluations", "sanitize_target_balance"]
+
+
+def test_journal_change_recomputes_later_automated_entries_only(
+    engine, complete_journal_calls, monkeypatch
+):
+    engine.restore(
+        assets=BaseTest.ASSETS, revaluations=BaseTest.REVALUATIONS,
+        target_balance=BaseTest.TARGET_BALANCE,
+    )
+    entry = pd.DataFrame({
+        "id": ["incremental"], "account": [1000], "contra": [1005], "currency": ["USD"],
+        "amount": [100.0], "description": ["Transfer"], "profit_center": ["General"],
+    })
+    revaluation_dates = []
+    revaluation_entries = engine._revaluation_entries
+
+    def counting_revaluation_entries(*args, revaluations, **kwargs):
+        revaluation_dates.extend(revaluations["date"])
+        return revaluation_entries(*args, revaluations=revaluations, **kwargs)
+
+    monkeypatch.setattr(engine, "_revaluation_entries", counting_revaluation_entries)
+
+    # Entries after the last automated entry are patched in
+    engine.serialized_ledger()
+    n_calls = len(complete_journal_calls)
+    revaluation_dates.clear()
+    engine.journal.add(entry.assign(date="2025-06-30"))
+    engine.serialized_ledger()
+    assert len(complete_journal_calls) == n_calls
+    assert revaluation_dates == []
+    assert_matches_full_rebuild(engine)
+
+    # Automated entries dated on or after the change are recomputed
+    n_calls = len(complete_journal_calls)
+    revaluation_dates.clear()
+    engine.journal.add(entry.assign(id="incremental-2", date="2024-06-30"))
+    engine.serialized_ledger()
+    assert len(complete_journal_calls) == n_calls
+    assert revaluation_dates == list(pd.to_datetime(["2024-06-30", "2024-09-30", "2024-12-31"]))
+    assert_matches_full_rebuild(engine)
+
+    # Removing the entry again restores the original automated entries
+    engine.journal.delete(pd.DataFrame({"id": ["incremental-2"]}))
+    assert_matches_full_rebuild(engine)
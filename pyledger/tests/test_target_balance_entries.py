@@ -0,0 +1,40 @@
+"""Test suite for the batched generation of target balance entries."""
+
+import pandas as pd
+import pytest
+from .base_test import BaseTest
+
+
+@pytest.fixture
+def engine(settings_engine):
+    settings_engine.journal.add(BaseTest.JOURNAL)
+    return settings_engine
+
+
+def test_batched_rules_match_individual_balances(engine):
+    ledger = engine.serialized_ledger()
+    rules = engine.sanitize_target_balance(BaseTest.TARGET_BALANCE)
+    rules = rules.loc[rules["date"] == pd.Timestamp("2024-12-31")].reset_index(drop=True)
+    entries = engine._target_balance_entries(ledger=ledger, target_balance=rules)
+
+    expected = {}
+    for idx, rule in rules.iterrows():
+        balance = engine._account_balance(
+            ledger=ledger, account=rule["lookup_accounts"], period=rule["lookup_period"],
+            profit_centers=rule["lookup_profit_centers"],
+        )
+        delta = rule["balance"] - balance.get(rule["currency"], 0.0)
+        if delta != 0:
+            expected[f"target_balance:{rule['date']}:{idx}"] = delta
+
+    assert set(entries["id"]) == set(expected)
+    for id, amount in zip(entries["id"], entries["report_amount"]):
+        assert -amount == pytest.approx(expected[id], abs=0.01)
+
+
+def test_no_rules(engine):
+    rules = engine.sanitize_target_balance(BaseTest.TARGET_BALANCE).iloc[:0]
+    entries = engine._target_balance_entries(
+        ledger=engine.serialized_ledger(), target_balance=rules
+    )
+    assert entries.empty
@@ -0,0 +1,53 @@
+"""Test suite for tax entry generation."""
+
+# flake8: noqa: E501
+
+from io import StringIO
+import pandas as pd
+
+
+JOURNAL_CSV = """
+    id,       date, account, contra, currency,  amount, tax_code, profit_center, description
+     1, 2024-01-24,    1000,   4000,      USD, 1200.00,  OUT_STD,        Bakery, Sell cakes
+     2, 2024-02-01,    4000,   5000,      USD,  100.00,   IN_STD,        Bakery, Both taxed
+     3, 2024-03-01,    1000,   1300,      USD,  100.00,   IN_STD,        Bakery, None taxed
+     4, 2024-05-05,    1000,   5000,      USD, -555.55,   IN_STD,          Cafe, Purchase with tax
+"""
+
+EXPECTED_CSV = """
+    id,          date, account, contra, currency, amount, report_amount, tax_code, profit_center, description
+    1:tax, 2024-01-24,    4000,   2200,      USD, 200.00,        200.00,  OUT_STD,        Bakery, TAX: Sell cakes
+    4:tax, 2024-05-05,    5000,   1300,      USD, -92.59,        -92.59,   IN_STD,          Cafe, TAX: Purchase with tax
+"""
+
+
+def test_tax_entries(engine, caplog):
+    journal = engine.journal.standardize(
+        pd.read_csv(StringIO(JOURNAL_CSV), skipinitialspace=True)
+    )
+    expected = engine.journal.standardize(
+        pd.read_csv(StringIO(EXPECTED_CSV), skipinitialspace=True)
+    )
+    result = engine.journal.standardize(engine.tax_entries(journal)).reset_index(drop=True)
+    pd.testing.assert_frame_equal(result, expected, check_like=True)
+    assert "Skip tax code 'IN_STD' for 2: Both account and counter accounts" in caplog.text
+    assert "Skip tax code 'IN_STD' for 3: Neither account nor counter account" in caplog.text
+
+
+def test_tax_entries_without_taxed_entries(engine):
+    journal = engine.journal.standardize(
+        pd.read_csv(StringIO(JOURNAL_CSV), skipinitialspace=True).assign(tax_code=pd.NA)
+    )
+    assert engine.tax_entries(journal).empty
+
+
+def test_entries_without_taxed_accounts_are_skipped(engine):
+    journal = engine.journal.standardize(
+        pd.read_csv(StringIO(JOURNAL_CSV), skipinitialspace=True)
+    )
+    result = engine.tax_entries(journal)
+    assert "3:tax" not in set(result["id"])
+    assert engine.tax_entries(journal.iloc[[2]]).empty
+    # Skipped entries do not affect the tax of other entries
+    without = engine.tax_entries(journal.loc[journal["id"] != "3"])
+    pd.testing.assert_frame_equal(result.reset_index(drop=True), without.reset_index(drop=True))
@@ -0,0 +1,63 @@
+"""Test suite for the persisted completed journal of TextLedger."""
+
+import pandas as pd
+import pytest
+from pyledger import TextLedger
+from .base_test import BaseTest
+
+
+@pytest.fixture
+def root(tmp_path):
+    engine = TextLedger(tmp_path, cache_dir=".cache")
+    engine.restore(
+        configuration=BaseTest.CONFIGURATION,
+        accounts=BaseTest.ACCOUNTS,
+        tax_codes=BaseTest.TAX_CODES,
+        journal=BaseTest.JOURNAL,
+        assets=BaseTest.ASSETS,
+        price_history=BaseTest.PRICES,
+        revaluations=BaseTest.REVALUATIONS,
+        profit_centers=BaseTest.PROFIT_CENTERS,
+        target_balance=BaseTest.TARGET_BALANCE,
+    )
+    engine.serialized_ledger()
+    return tmp_path
+
+
+def fail(*args, **kwargs):
+    raise AssertionError("complete_journal() should not be called")
+
+
+def test_new_instance_reuses_persisted_ledger(root, monkeypatch):
+    expected = TextLedger(root, cache_dir=None).serialized_ledger()
+    engine = TextLedger(root, cache_dir=".cache")
+    monkeypatch.setattr(engine, "complete_journal", fail)
+    pd.testing.assert_frame_equal(engine.serialized_ledger(), expected)
+    assert len(list((root / ".cache").glob("*.arrow"))) == 2
+
+
+def test_changed_data_invalidates_persisted_ledger(root, monkeypatch):
+    engine = TextLedger(root, cache_dir=".cache")
+    engine.journal.delete(engine.journal.list().head(1))
+    expected = TextLedger(root, cache_dir=None).serialized_ledger()
+
+    engine = TextLedger(root, cache_dir=".cache")
+    pd.testing.assert_frame_equal(engine.serialized_ledger(), expected)
+    assert len(list((root / ".cache").glob("*.arrow"))) == 2
+    monkeypatch.setattr(engine, "complete_journal", fail)
+    engine._invalidate_ledger()
+    pd.testing.assert_frame_equal(engine.serialized_ledger(), expected)
+
+
+def test_cache_is_disabled_by_default(tmp_path):
+    engine = TextLedger(tmp_path)
+    engine.restore(configuration=BaseTest.CONFIGURATION, journal=BaseTest.JOURNAL.head(0))
+    engine.serialized_ledger()
+    assert not (tmp_path / ".cache").exists()
+
+
+def test_disabled_rules_invalidate_persisted_ledger(root):
+    engine = TextLedger(root, cache_dir=".cache")
+    key = engine._ledger_fingerprint()
+    engine.disabled_validation_rules = {"profit_centers"}
+    assert engine._ledger_fingerprint() != key
@@ -1,7 +1,8 @@
 """Tests for date processing helper functions in pyledger."""
 
 import datetime
-from pyledger import last_day_of_month, parse_date_span
+import pandas as pd
+from pyledger import last_day_of_month, parse_date_span, parse_date_spans
 import pytest
 
 
@@ -52,3 +53,26 @@ def test_parse_date_span_invalid(invalid_input: str | float):
     """Test the parse_date_span function with invalid inputs."""
     with pytest.raises(ValueError):
         parse_date_span(invalid_input)
+
+
+def test_parse_date_spans_matches_parse_date_span():
+    """Test that parse_date_spans matches parse_date_span element-wise."""
+    periods = pd.Series(
+        ["2023-Q1", "2023-01-01", None, "2023", "2023-Q1"], index=[5, 4, 3, 2, 1], dtype="string"
+    )
+    spans = parse_date_spans(periods)
+    assert spans.index.tolist() == periods.index.tolist()
+    assert spans["valid"].all()
+    for period, start, end in zip(periods, spans["start"], spans["end"]):
+        expected = parse_date_span(None if pd.isna(period) else period)
+        assert (None if pd.isna(start) else start.date(), None if pd.isna(end) else end.date()) \
+            == expected
+
+
+def test_parse_date_spans_invalid():
+    """Test that parse_date_spans raises on invalid periods, unless coerced."""
+    with pytest.raises(ValueError):
+        parse_date_spans(["2023", "invalid"])
+    spans = parse_date_spans(["2023", "invalid"], errors="coerce")
+    assert spans["valid"].tolist() == [True, False]
+    assert spans["end"].isna().tolist() == [False, True]
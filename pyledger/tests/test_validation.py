@@ -0,0 +1,64 @@
+"""Test suite for the validation rule pipeline."""
+
+import logging
+import numpy as np
+import pandas as pd
+import pytest
+from pyledger import ValidationRule
+from pyledger.validation import validate
+from .base_test import BaseTest
+
+
+@pytest.fixture
+def frame():
+    return pd.DataFrame({"id": ["1", "1", "2", "3"], "value": [1, -1, 0, 5]})
+
+
+def negative(df):
+    return (df["value"] < 0).to_numpy()
+
+
+def zero(df):
+    return (df["value"] == 0).to_numpy()
+
+
+def test_entries_are_discarded_as_a_whole(frame, caplog):
+    rules = [
+        ValidationRule("negative", negative, "Discarding %d negative entries: %s"),
+        ValidationRule("nonpositive", lambda df: (df["value"] <= 0).to_numpy(), "%d: %s"),
+    ]
+    result = validate(frame, rules, ["id"], logging.getLogger("ledger"), by_id=True)
+    assert result.discard.tolist() == [True, True, True, False]
+    assert result.ids["negative"]["id"].tolist() == ["1"]
+    assert result.ids["nonpositive"]["id"].tolist() == ["2"]
+    assert "Discarding 1 negative entries: 1" in caplog.text
+    assert result.summary()["rule"].tolist() == ["negative", "nonpositive"]
+
+
+def test_patch_rules_keep_rows_and_disabled_rules_are_skipped(frame):
+    def patch(df, mask):
+        df.loc[mask, "value"] = 1
+
+    rules = [
+        ValidationRule("zero", zero, "%d: %s", patch=patch),
+        ValidationRule("negative", negative, "%d: %s"),
+    ]
+    result = validate(frame, rules, ["id"], logging.getLogger("ledger"), disabled=["negative"])
+    assert not result.discard.any()
+    assert frame["value"].tolist() == [1, -1, 1, 5]
+    assert list(result.seconds) == ["zero"]
+
+
+def test_disabled_journal_rule(settings_engine):
+    engine = settings_engine
+    journal = BaseTest.JOURNAL.copy()
+    journal.loc[0, "profit_center"] = "undefined"
+    txn_id = journal.loc[0, "id"]
+    assert txn_id not in set(engine.sanitize_journal(journal)["id"])
+    result = engine.validation_result("journal")
+    assert set(result.ids["profit_centers"]["id"]) == {txn_id}
+    assert np.all([seconds >= 0 for seconds in result.seconds.values()])
+
+    engine.disabled_validation_rules = {"profit_centers"}
+    assert txn_id in set(engine.sanitize_journal(journal)["id"])
+    assert "profit_centers" not in engine.validation_result("journal").seconds
@@ -1,11 +1,13 @@
 """This module defines TextLedger, extending StandaloneLedger to store data in text files."""
 
+import json
 import math
+import os
 import pandas as pd
 import yaml
 from pathlib import Path
-import datetime
-from pyledger.time import parse_date_span
+from pyledger.time import parse_date_spans
+from . import __version__
 from .decorators import timed_cache
 from .standalone_ledger import StandaloneLedger
 from .constants import (
@@ -21,7 +23,7 @@ from .constants import (
     TARGET_BALANCE_SCHEMA,
     TAX_CODE_SCHEMA
 )
-from .helpers import write_fixed_width_csv
+from .helpers import fingerprint, write_fixed_width_csv
 from consistent_df import enforce_schema
 from .storage_entity import CSVAccountingEntity, CSVJournalEntity, MultiCSVEntity
 
@@ -60,21 +62,32 @@ class TextLedger(StandaloneLedger):
     the reporting currency, are stored in YAML format.
     """
 
-    def __init__(self, root: Path = Path.cwd()):
+    def __init__(self, root: Path = Path.cwd(), cache_dir: Path | None = None):
         """Initializes the TextLedger with a root path for file storage.
         If no root path is provided, defaults to the current working directory.
+
+        If `cache_dir` is given, the completed journal is persisted there,
+        relative to the root path unless absolute, and reused by later instances
+        as long as the underlying accounting data, the pyledger version and the
+        disabled validation rules are unchanged. Persistence is disabled by
+        default. The cache directory contains a `.gitignore` file excluding it
+        from version control; add it to the ignore rules of other versioning
+        systems.
         """
         super().__init__()
         self.root = Path(root).expanduser()
+        self.cache_dir = None if cache_dir is None else self.root / Path(cache_dir).expanduser()
         settings_dir = self.root / "settings"
         settings_dir.mkdir(parents=True, exist_ok=True)
         self._assets = CSVAccountingEntity(
             schema=ASSETS_SCHEMA, path=self.root / "settings/assets.csv",
+            on_change=self._invalidate_ledger,
+            validate_change=self._check_open_settings
         )
 
-        def _clear_account_caches():
-            self.serialized_ledger.cache_clear()
-            self.account_currency.cache_clear()
+        def _clear_account_caches(ids=None):
+            self._invalidate_ledger()
+            self._clear_account_selectors()
         self._accounts = CSVAccountingEntity(
             schema=ACCOUNT_SCHEMA, path=self.root / "account_chart.csv",
             column_shortcuts=ACCOUNT_COLUMN_SHORTCUTS,
@@ -83,15 +96,18 @@ class TextLedger(StandaloneLedger):
         self._tax_codes = CSVAccountingEntity(
             schema=TAX_CODE_SCHEMA, path=self.root / "settings/tax_codes.csv",
             column_shortcuts=TAX_CODE_COLUMN_SHORTCUTS,
-            on_change=self.serialized_ledger.cache_clear
+            on_change=self._invalidate_ledger
         )
         self._price_history = CSVAccountingEntity(
             schema=PRICE_SCHEMA, path=self.root / "settings/price_history.csv",
-            on_change=self.price.cache_clear
+            on_change=self._invalidate_ledger,
+            validate_change=self._check_open_settings
         )
         self._revaluations = CSVAccountingEntity(
             schema=REVALUATION_SCHEMA, path=self.root / "settings/revaluations.csv",
             source_column="source",
+            on_change=self._invalidate_ledger,
+            validate_change=self._check_open_period
         )
         self._journal = CSVJournalEntity(
             schema=JOURNAL_SCHEMA,
@@ -99,11 +115,17 @@ class TextLedger(StandaloneLedger):
             write_file=self.write_journal_file,
             column_shortcuts=JOURNAL_COLUMN_SHORTCUTS,
             prepare_for_mirroring=self.sanitize_journal,
-            on_change=self.serialized_ledger.cache_clear,
+            on_change=self._invalidate_journal,
+            validate_change=self._check_open_period,
             source_column="source"
         )
+
+        def _clear_profit_center_caches(ids=None):
+            self._invalidate_ledger()
+            self._clear_profit_center_codes()
         self._profit_centers = CSVAccountingEntity(
-            schema=PROFIT_CENTER_SCHEMA, path=self.root / "settings/profit_centers.csv"
+            schema=PROFIT_CENTER_SCHEMA, path=self.root / "settings/profit_centers.csv",
+            on_change=_clear_profit_center_caches
         )
         self._reconciliation = MultiCSVEntity(
             schema=RECONCILIATION_SCHEMA,
@@ -114,6 +136,8 @@ class TextLedger(StandaloneLedger):
         self._target_balance = CSVAccountingEntity(
             schema=TARGET_BALANCE_SCHEMA, path=self.root / "settings/target_balance.csv",
             source_column="source",
+            on_change=self._invalidate_ledger,
+            validate_change=self._check_open_period
         )
 
     # ----------------------------------------------------------------------
@@ -135,6 +159,11 @@ class TextLedger(StandaloneLedger):
         Args:
             configuration (dict): A dictionary containing the system configuration to be saved.
         """
+        self._write_configuration(configuration)
+        self._invalidate_ledger()
+
+    def _write_configuration(self, configuration: dict):
+        """Write the configuration file without invalidating the ledger."""
         with open(self.root / "settings/configuration.yml", "w") as f:
             yaml.dump(self.standardize_configuration(configuration), f, default_flow_style=False)
         self.__class__.configuration.fget.cache_clear()
@@ -217,6 +246,70 @@ class TextLedger(StandaloneLedger):
 
         return df
 
+    def _build_ledger_state(self) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """Extend _build_ledger_state() to persist the completed journal.
+
+        The completed journal and ledger are stored as Arrow IPC files in
+        `cache_dir`, named after a fingerprint of all data they depend on. A
+        cached result is reused if the fingerprint matches; otherwise the
+        journal is completed from scratch and the cache replaced.
+        """
+        if self.cache_dir is None:
+            return super()._build_ledger_state()
+
+        key = self._ledger_fingerprint()
+        journal_path = self.cache_dir / f"{key}.journal.arrow"
+        ledger_path = self.cache_dir / f"{key}.ledger.arrow"
+        if journal_path.exists() and ledger_path.exists():
+            try:
+                return pd.read_feather(journal_path), pd.read_feather(ledger_path)
+            except (OSError, ValueError) as e:
+                self._logger.warning(f"Discarding unreadable ledger cache: {e}")
+
+        state = super()._build_ledger_state()
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            gitignore = self.cache_dir / ".gitignore"
+            if not gitignore.exists():
+                gitignore.write_text("*\n")
+            for file in self.cache_dir.glob("*.arrow"):
+                file.unlink()
+            for df, path in zip(state, [journal_path, ledger_path]):
+                tmp = path.with_suffix(".tmp")
+                df.reset_index(drop=True).to_feather(tmp)
+                os.replace(tmp, path)
+        except (OSError, ValueError) as e:
+            self._logger.warning(f"Failed to write ledger cache: {e}")
+        return state
+
+    def _ledger_fingerprint(self) -> str:
+        """Fingerprint of all data the completed journal depends on.
+
+        Returns:
+            str: Hexadecimal digest combining the pyledger version, disabled
+                validation rules and content fingerprints of the configuration,
+                journal, accounts, tax codes, assets, prices, profit centers,
+                revaluations and target balances.
+        """
+        fingerprints = {
+            "version": __version__,
+            "disabled_validation_rules": json.dumps(sorted(self.disabled_validation_rules)),
+            # Closing periods does not change the completed journal
+            "configuration": json.dumps(
+                {k: v for k, v in self.configuration.items() if k != "closed_until"},
+                sort_keys=True, default=str
+            ),
+            "journal": fingerprint(self.journal.list()),
+            "accounts": fingerprint(self.accounts.list()),
+            "tax_codes": fingerprint(self.tax_codes.list()),
+            "assets": fingerprint(self.assets.list()),
+            "price_history": fingerprint(self.price_history.list()),
+            "profit_centers": fingerprint(self.profit_centers.list()),
+            "revaluations": fingerprint(self.revaluations.list()),
+            "target_balance": fingerprint(self.target_balance.list()),
+        }
+        return fingerprint(pd.DataFrame([fingerprints]))[:32]
+
     # ----------------------------------------------------------------------
     # Reconciliation
 
@@ -236,13 +329,9 @@ class TextLedger(StandaloneLedger):
         """
         df = enforce_schema(df, RECONCILIATION_SCHEMA, sort_columns=True, keep_extra_columns=True)
         if not df.empty:
-            def _get_dates(periods):
-                return [
-                    datetime.date.today() if pd.isna(p) else parse_date_span(p)[1]
-                    for p in periods
-                ]
+            dates = parse_date_spans(df["period"])["end"].fillna(pd.Timestamp.today().normalize())
             increment = self.precision_vectorized(
-                df["currency"], _get_dates(df["period"]), allow_missing=True
+                df["currency"], dates, allow_missing=True
             ).min()
             if not increment:
                 increment = DEFAULT_PRECISION
@@ -269,3 +358,19 @@ class TextLedger(StandaloneLedger):
     @reporting_currency.setter
     def reporting_currency(self, currency):
         self.configuration = self.configuration | {"reporting_currency": currency}
+
+    @property
+    def closed_until(self):
+        date = self.configuration.get("closed_until")
+        return None if date is None else pd.Timestamp(date)
+
+    @closed_until.setter
+    def closed_until(self, date):
+        configuration = {
+            key: value for key, value in self.configuration.items() if key != "closed_until"
+        }
+        if date is not None:
+            configuration["closed_until"] = pd.Timestamp(date).date().isoformat()
+        # Closing periods does not change the ledger, only the closing snapshot
+        self._write_configuration(configuration)
+        StandaloneLedger.closed_until.fset(self, date)
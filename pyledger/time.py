@@ -2,6 +2,8 @@
 
 import datetime
 import re
+import numpy as np
+import pandas as pd
 
 
 def last_day_of_month(date: datetime.date) -> datetime.date:
@@ -69,3 +71,50 @@ def parse_date_span(
             raise ValueError(f"Cannot interpret '{x_str}' as an interval.")
     else:
         raise ValueError(f"Cannot interpret '{x}' of type {type(x).__name__} as an interval.")
+
+
+def parse_date_spans(periods: pd.Series | list, errors: str = "raise") -> pd.DataFrame:
+    """Vectorized `parse_date_span()`, parsing each distinct period only once.
+
+    Missing values are interpreted as None, i.e. an indefinite period.
+
+    Args:
+        periods (pd.Series | list): Periods in any format supported by `parse_date_span()`.
+        errors (str): If 'raise', invalid periods raise a ValueError. If 'coerce',
+            they result in missing start and end dates and are marked as invalid.
+
+    Returns:
+        pd.DataFrame: Columns 'start' and 'end' of dtype datetime64[ns], with NaT
+            for open bounds, and the boolean column 'valid'. The index matches
+            the index of `periods`, if given as a pd.Series.
+
+    Raises:
+        ValueError: If a period can not be interpreted and `errors` is 'raise'.
+    """
+    if errors not in ("raise", "coerce"):
+        raise ValueError(f"errors must be 'raise' or 'coerce', not '{errors}'.")
+    periods = periods if isinstance(periods, pd.Series) else pd.Series(periods, dtype="object")
+    codes, uniques = pd.factorize(periods)
+
+    # Memo table with one row per distinct period, followed by missing values (code -1)
+    starts, ends, valid = [], [], []
+    for period in list(uniques) + [None]:
+        try:
+            start, end = parse_date_span(period)
+            is_valid = True
+        except ValueError:
+            if errors == "raise":
+                raise
+            start, end, is_valid = None, None, False
+        starts.append(start)
+        ends.append(end)
+        valid.append(is_valid)
+
+    def to_datetime(dates: list) -> np.ndarray:
+        return pd.to_datetime(pd.Series(dates, dtype="object")).to_numpy(dtype="datetime64[ns]")
+
+    return pd.DataFrame({
+        "start": to_datetime(starts)[codes],
+        "end": to_datetime(ends)[codes],
+        "valid": np.array(valid, dtype=bool)[codes],
+    }, index=periods.index)
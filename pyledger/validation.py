@@ -0,0 +1,155 @@
+"""This module defines the pipeline applying vectorized validation rules to
+accounting data, as used by the `sanitize_*` methods of the ledger engine.
+"""
+
+import logging
+from time import perf_counter
+from typing import Callable, Iterable
+import numpy as np
+import pandas as pd
+from .helpers import first_elements_as_str
+
+
+class ValidationRule:
+    """Named, vectorized validation rule.
+
+    A rule marks invalid rows of a validation frame: the data to validate,
+    joined with any reference data the rules need. Flagged entries are
+    discarded, or repaired in place if the rule defines a `patch` function.
+
+    Attributes:
+        name (str): Name of the rule, used to disable it and to report results.
+        mask (Callable[[pd.DataFrame], np.ndarray]): Returns a boolean array
+            marking invalid rows of the validation frame.
+        message (str): Log message with '%d' and '%s' placeholders for the
+            number and the ids of the flagged entries.
+        patch (Callable[[pd.DataFrame, np.ndarray], None] | None): Repairs flagged
+            rows of the validation frame in place. Rules with a patch function
+            do not discard entries.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        mask: Callable[[pd.DataFrame], np.ndarray],
+        message: str,
+        patch: Callable[[pd.DataFrame, np.ndarray], None] | None = None,
+    ):
+        self.name = name
+        self.mask = mask
+        self.message = message
+        self.patch = patch
+
+    def __repr__(self) -> str:
+        return f"ValidationRule({self.name!r})"
+
+
+class ValidationResult:
+    """Outcome of a validation pipeline run.
+
+    Attributes:
+        discard (np.ndarray): Boolean array marking rows to discard.
+        ids (dict[str, pd.DataFrame]): Ids of the entries flagged by each rule.
+        seconds (dict[str, float]): Wall time spent evaluating each rule.
+    """
+
+    def __init__(self, n_rows: int):
+        self.discard = np.zeros(n_rows, dtype=bool)
+        self.ids = {}
+        self.seconds = {}
+
+    def summary(self) -> pd.DataFrame:
+        """Number of flagged entries and wall time of each evaluated rule.
+
+        Returns:
+            pd.DataFrame: With columns 'rule', 'flagged' and 'seconds'.
+        """
+        return pd.DataFrame({
+            "rule": pd.Series(list(self.seconds), dtype="string"),
+            "flagged": [len(self.ids[rule]) for rule in self.seconds],
+            "seconds": list(self.seconds.values()),
+        })
+
+
+class _Preview:
+    """Preview of flagged ids, formatted only once a log message is emitted."""
+
+    def __init__(self, ids: pd.DataFrame):
+        self.ids = ids
+
+    def __str__(self) -> str:
+        if self.ids.shape[1] == 1:
+            return first_elements_as_str(set(self.ids.iloc[:, 0]))
+        return first_elements_as_str(self.ids.to_dict("records"))
+
+
+def log_flagged(
+    rules: Iterable[ValidationRule], ids: dict[str, pd.DataFrame], logger: logging.Logger
+) -> None:
+    """Log a warning for each rule that flagged entries.
+
+    Args:
+        rules (Iterable[ValidationRule]): Rules in order of application.
+        ids (dict[str, pd.DataFrame]): Ids of the entries flagged by each rule.
+        logger (logging.Logger): Logger for the warnings.
+    """
+    for rule in rules:
+        flagged = ids.get(rule.name)
+        if flagged is not None and len(flagged) > 0:
+            logger.warning(rule.message, len(flagged), _Preview(flagged))
+
+
+def validate(
+    frame: pd.DataFrame,
+    rules: Iterable[ValidationRule],
+    id_columns: list[str],
+    logger: logging.Logger | None,
+    by_id: bool = False,
+    disabled: Iterable[str] = (),
+    result: ValidationResult | None = None,
+) -> ValidationResult:
+    """Apply validation rules in order and log a warning for each rule that
+    flags entries.
+
+    Rows discarded by an earlier rule are not reported again by later rules.
+
+    Args:
+        frame (pd.DataFrame): Validation frame, patched in place.
+        rules (Iterable[ValidationRule]): Rules to apply.
+        id_columns (list[str]): Columns identifying entries in results and logs.
+        logger (logging.Logger | None): Logger for the warnings, or None to
+            validate without logging.
+        by_id (bool, optional): If True, rows sharing the single id column form
+            one entry that is discarded as a whole when any of its rows is
+            flagged. Otherwise each row is validated on its own. Defaults to False.
+        disabled (Iterable[str], optional): Names of rules to skip.
+        result (ValidationResult, optional): Result of a previous run on the
+            same frame to continue.
+
+    Returns:
+        ValidationResult: Rows to discard and flagged ids and timing per rule.
+    """
+    if result is None:
+        result = ValidationResult(len(frame))
+    disabled = set(disabled)
+    for rule in rules:
+        if rule.name in disabled:
+            continue
+        start = perf_counter()
+        mask = np.array(rule.mask(frame), dtype=bool)
+        if rule.patch is not None:
+            rule.patch(frame, mask)
+        mask &= ~result.discard
+        ids = frame.loc[mask, id_columns]
+        if by_id:
+            ids = ids.drop_duplicates()
+        if rule.patch is None and mask.any():
+            if by_id:
+                result.discard |= frame[id_columns[0]].isin(ids.iloc[:, 0]).to_numpy(dtype=bool)
+            else:
+                result.discard |= mask
+        result.seconds[rule.name] = perf_counter() - start
+        result.ids[rule.name] = ids.reset_index(drop=True)
+        if logger is not None:
+            log_flagged([rule], result.ids, logger)
+    return result